@@ -1,28 +1,67 @@
 from __future__ import annotations
 
+import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 
-from rich import print
-
-from homeconnect_coffee.client import HomeConnectClient
-from homeconnect_coffee.config import load_config
+from homeconnect_coffee.console import print
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Shows registered devices and the current device status")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the cached device list and fetch it from the API",
+    )
+    args = parser.parse_args()
+
+    # Imported after argument parsing so that --help stays fast
+    from homeconnect_coffee.cache import APPLIANCES_CACHE_FILE, default_cache_dir, ttl_cache
+    from homeconnect_coffee.client import HomeConnectClient
+    from homeconnect_coffee.config import load_config
+
     config = load_config()
     client = HomeConnectClient(config)
 
-    appliances = client.get_home_appliances()
-    print("[bold]Registered devices:[/bold]")
-    print(json.dumps(appliances, indent=2))
+    get_home_appliances = ttl_cache(default_cache_dir() / APPLIANCES_CACHE_FILE)(client.get_home_appliances)
+    if args.refresh:
+        get_home_appliances.invalidate()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Both requests are independent - issue them concurrently to save a round-trip
+        status_future = executor.submit(client.get_status) if config.haid else None
+        appliances = get_home_appliances()
+        print("[bold]Registered devices:[/bold]")
+        print(json.dumps(appliances, indent=2))
+
+        if status_future is None:
+            print("\n[bold yellow]Note:[/bold yellow] No HAID configured in .env file.")
+            print("Enter the HAID from the device list above into your .env file.")
+            return
+
+        try:
+            status = status_future.result()
+        except Exception:
+            # The device list only explains the failure, it does not override a
+            # successful live status. The cached list may be minutes old, so the
+            # connected flag is fetched again before it is reported.
+            get_home_appliances.invalidate()
+            try:
+                appliances = get_home_appliances()
+            except Exception:
+                appliances = {}
+            appliance = next(
+                (a for a in appliances.get("data", {}).get("homeappliances", []) if a.get("haid") == config.haid),
+                None,
+            )
+            if appliance is not None and appliance.get("connected") is False:
+                print("\n[bold yellow]Warning:[/bold yellow] Coffee machine is not connected, no status available.")
+                return
+            raise
 
-    if config.haid:
-        status = client.get_status()
         print("\n[bold]Current status of coffee machine:[/bold]")
         print(json.dumps(status, indent=2))
-    else:
-        print("\n[bold yellow]Note:[/bold yellow] No HAID configured in .env file.")
-        print("Enter the HAID from the device list above into your .env file.")
 
 
 if __name__ == "__main__":
@@ -2,21 +2,42 @@ from __future__ import annotations
 
 import argparse
 import json
+import threading
+from queue import Queue
 
-from rich import print
-from sseclient import SSEClient
-
-from homeconnect_coffee.client import HomeConnectClient
-from homeconnect_coffee.config import load_config
+from homeconnect_coffee.console import print
 
 EVENTS_URL = "https://api.home-connect.com/api/homeappliances/events"
 
+_STOP = None  # Queue sentinel for the printer thread
+
+
+def _printer(queue: Queue) -> None:
+    """Pretty-prints queued events so that slow terminal output never stalls the stream reader."""
+    while True:
+        item = queue.get()
+        if item is _STOP:
+            return
+        event_type, data = item
+        print(f"\n[bold cyan]{event_type}[/bold cyan]")
+        try:
+            payload = json.loads(data)
+            print(json.dumps(payload, indent=2))
+        except json.JSONDecodeError:
+            print(data)
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Listens to the HomeConnect event stream")
     parser.add_argument("--limit", type=int, default=0, help="Number of events (0 = unlimited)")
     args = parser.parse_args()
 
+    # Imported after argument parsing so that --help stays fast
+    from sseclient import SSEClient
+
+    from homeconnect_coffee.client import HomeConnectClient
+    from homeconnect_coffee.config import load_config
+
     config = load_config()
     client = HomeConnectClient(config)
     token = client.get_access_token()
@@ -28,21 +49,28 @@ def main() -> None:
 
     print("[bold]Connecting to HomeConnect events...[/bold]")
 
+    queue: Queue = Queue()
+    printer = threading.Thread(target=_printer, args=(queue,), daemon=True)
+    printer.start()
+
     count = 0
+    cancelled = False
     try:
         for event in SSEClient(EVENTS_URL, headers=headers):
             if not event.data:
                 continue
-            print(f"\n[bold cyan]{event.event}[/bold cyan]")
-            try:
-                payload = json.loads(event.data)
-                print(json.dumps(payload, indent=2))
-            except json.JSONDecodeError:
-                print(event.data)
+            queue.put((event.event, event.data))
             count += 1
             if args.limit and count >= args.limit:
                 break
     except KeyboardInterrupt:
+        cancelled = True
+    finally:
+        # Flush events that are still queued, also on Ctrl-C or stream errors
+        queue.put(_STOP)
+        printer.join(timeout=5)
+
+    if cancelled:
         print("\nCancelled.")
 
 
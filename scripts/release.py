@@ -12,87 +12,60 @@ import argparse
 import re
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+# Repository root and release files (resolved once instead of on every file access)
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_VERSION_FILE = _REPO_ROOT / "VERSION"
+_CHANGELOG_FILE = _REPO_ROOT / "CHANGELOG.md"
 
+
+@lru_cache(maxsize=1)
 def get_current_version() -> str:
     """Read current version from VERSION file."""
-    version_file = Path(__file__).parent.parent / "VERSION"
-    if not version_file.exists():
+    if not _VERSION_FILE.exists():
         raise FileNotFoundError("VERSION file not found")
-    return version_file.read_text(encoding="utf-8").strip()
+    return _VERSION_FILE.read_text(encoding="utf-8").strip()
 
 
 def write_version(version: str) -> None:
     """Write version to VERSION file."""
-    version_file = Path(__file__).parent.parent / "VERSION"
-    version_file.write_text(f"{version}\n", encoding="utf-8")
+    _VERSION_FILE.write_text(f"{version}\n", encoding="utf-8")
+    get_current_version.cache_clear()
+
+
+# MAJOR.MINOR.PATCH with optional prerelease suffix. Both the hyphen format
+# (1.2.1-b2) and the legacy formats without hyphen (1.2.1b2, 1.2.1.dev) are accepted.
+# MINOR and PATCH may be omitted (1.2 -> 1.2.0), as before.
+_VERSION_RE = re.compile(r"^(\d+)(?:\.(\d+))?(?:\.(\d+))?(?:[-.]?(dev|alpha|beta|a|b|rc)(\d*))?$")
+
+_PRERELEASE_NAMES = {"a": "alpha", "b": "beta"}
+
+# Version suffix written for each prerelease type
+_PRERELEASE_SUFFIXES = {"dev": "-dev", "alpha": "-a", "beta": "-b", "rc": "-rc"}
 
 
 def parse_version(version_str: str) -> tuple[int, int, int, str, int]:
     """Parse version string into components.
     
     Returns: (major, minor, patch, prerelease_type, prerelease_num)
+    
+    Raises:
+        ValueError: If the string is not a valid version
     """
     version_str = version_str.strip()
+    match = _VERSION_RE.match(version_str)
+    if match is None:
+        raise ValueError(f"Invalid version: {version_str!r}")
     
-    prerelease_type = ""
-    prerelease_num = 0
-    
-    # Extract prerelease info
-    # Support both formats: with hyphen (1.2.1-b2) and without (1.2.1b2) for backward compatibility
-    if "-dev" in version_str:
-        parts = version_str.split("-dev")
-        version_str = parts[0]
-        prerelease_type = "dev"
-        prerelease_num = 0  # Dev versions don't have numbers
-    elif ".dev" in version_str:
-        # Legacy format support
-        parts = version_str.split(".dev")
-        version_str = parts[0]
-        prerelease_type = "dev"
-        prerelease_num = 0  # Dev versions don't have numbers
-    elif "-a" in version_str:
-        parts = version_str.split("-a")
-        version_str = parts[0]
-        prerelease_type = "alpha"
-        prerelease_num = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-    elif "-b" in version_str:
-        parts = version_str.split("-b")
-        version_str = parts[0]
-        prerelease_type = "beta"
-        prerelease_num = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-    elif "-rc" in version_str:
-        parts = version_str.split("-rc")
-        version_str = parts[0]
-        prerelease_type = "rc"
-        prerelease_num = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-    elif "a" in version_str and not version_str.endswith("a") and "-" not in version_str:
-        # Legacy format without hyphen (backward compatibility)
-        parts = version_str.split("a")
-        version_str = parts[0]
-        prerelease_type = "alpha"
-        prerelease_num = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-    elif "b" in version_str and not version_str.endswith("b") and "-" not in version_str:
-        # Legacy format without hyphen (backward compatibility)
-        parts = version_str.split("b")
-        version_str = parts[0]
-        prerelease_type = "beta"
-        prerelease_num = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-    elif "rc" in version_str and "-" not in version_str:
-        # Legacy format without hyphen (backward compatibility)
-        parts = version_str.split("rc")
-        version_str = parts[0]
-        prerelease_type = "rc"
-        prerelease_num = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+    major, minor, patch, prerelease_type, prerelease_num = match.groups()
+    prerelease_type = prerelease_type or ""
+    prerelease_type = _PRERELEASE_NAMES.get(prerelease_type, prerelease_type)
+    # Dev versions don't have numbers
+    number = int(prerelease_num) if prerelease_num and prerelease_type != "dev" else 0
     
-    # Parse version numbers
-    version_parts = version_str.split(".")
-    major = int(version_parts[0]) if len(version_parts) > 0 and version_parts[0].isdigit() else 0
-    minor = int(version_parts[1]) if len(version_parts) > 1 and version_parts[1].isdigit() else 0
-    patch = int(version_parts[2]) if len(version_parts) > 2 and version_parts[2].isdigit() else 0
-    
-    return (major, minor, patch, prerelease_type, prerelease_num)
+    return (int(major), int(minor or 0), int(patch or 0), prerelease_type, number)
 
 
 def remove_prerelease_suffix(version: str) -> str:
@@ -125,112 +98,111 @@ def increment_version(
     """
     major, minor, patch, current_prerelease_type, current_prerelease_num = parse_version(current_version)
     
-    # If current version is a prerelease, increment the prerelease number if same type
-    if current_prerelease_type and prerelease_type == current_prerelease_type:
-        if prerelease_type == "dev":
-            # Dev versions: increment patch version for new dev release
-            return f"{major}.{minor}.{patch + 1}-dev"
-        elif prerelease_type == "alpha":
-            return f"{major}.{minor}.{patch}-a{current_prerelease_num + 1}"
-        elif prerelease_type == "beta":
-            return f"{major}.{minor}.{patch}-b{current_prerelease_num + 1}"
-        elif prerelease_type == "rc":
-            return f"{major}.{minor}.{patch}-rc{current_prerelease_num + 1}"
+    if not prerelease_type:
+        # No prerelease type specified - this shouldn't happen in normal flow
+        return f"{major}.{minor}.{patch}"
     
-    # Add prerelease marker to base version
-    if prerelease_type:
-        if prerelease_type == "dev":
-            return f"{major}.{minor}.{patch}-dev"
-        elif prerelease_type == "alpha":
-            return f"{major}.{minor}.{patch}-a1"
-        elif prerelease_type == "beta":
-            return f"{major}.{minor}.{patch}-b1"
-        elif prerelease_type == "rc":
-            return f"{major}.{minor}.{patch}-rc1"
-        else:
-            raise ValueError(f"Invalid prerelease type: {prerelease_type}")
+    suffix = _PRERELEASE_SUFFIXES.get(prerelease_type)
+    if suffix is None:
+        raise ValueError(f"Invalid prerelease type: {prerelease_type}")
     
-    # No prerelease type specified - this shouldn't happen in normal flow
-    return f"{major}.{minor}.{patch}"
+    if prerelease_type == "dev":
+        # Dev versions have no number: increment patch version for new dev release
+        if current_prerelease_type == "dev":
+            patch += 1
+        return f"{major}.{minor}.{patch}{suffix}"
+    
+    # Increment the prerelease number if same type, otherwise start at 1
+    number = current_prerelease_num + 1 if current_prerelease_type == prerelease_type else 1
+    return f"{major}.{minor}.{patch}{suffix}{number}"
 
 
-def check_git_status() -> None:
-    """Check that git repository is clean and on correct branch."""
-    # Check if we're in a git repository
+def check_git_status() -> str:
+    """Check that git repository is clean and on correct branch.
+    
+    Returns:
+        Name of the current branch
+    """
+    # A single porcelain v2 call reports both the branch and uncommitted changes
+    # (and fails outside of a git repository)
     try:
-        subprocess.run(["git", "status"], check=True, capture_output=True)
+        result = subprocess.run(
+            ["git", "status", "--porcelain=v2", "--branch"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
     except subprocess.CalledProcessError:
         raise RuntimeError("Not in a git repository")
     except FileNotFoundError:
         raise RuntimeError("git command not found")
     
+    branch = ""
+    dirty = False
+    for line in result.stdout.splitlines():
+        if line.startswith("# branch.head "):
+            branch = line[len("# branch.head "):]
+        elif line and not line.startswith("#"):
+            dirty = True
+    
     # Check for uncommitted changes
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    if result.stdout.strip():
+    if dirty:
         raise RuntimeError("Uncommitted changes detected. Please commit or stash them first.")
     
     # Check branch (should be main, master, or maintenance branch)
-    result = subprocess.run(
-        ["git", "branch", "--show-current"],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    branch = result.stdout.strip()
     if branch not in ("main", "master") and not branch.startswith("maintenance/"):
         raise RuntimeError(
             f"Not on main/master or maintenance branch (current: {branch}). "
             "Releases can only be created from main/master or maintenance/* branches."
         )
+    return branch
 
 
 def check_changelog(version: str) -> None:
     """Check that CHANGELOG.md contains the new version."""
-    changelog_file = Path(__file__).parent.parent / "CHANGELOG.md"
-    if not changelog_file.exists():
+    if not _CHANGELOG_FILE.exists():
         raise FileNotFoundError("CHANGELOG.md not found")
     
-    changelog_content = changelog_file.read_text(encoding="utf-8")
-    
-    # Check for version in changelog (format: ## [1.2.0] or ## [1.2.0] - date)
-    version_pattern = rf"##\s*\[{re.escape(version)}\]"
-    if not re.search(version_pattern, changelog_content):
+    # Check for version in changelog (format: ## [1.2.0] or ## [1.2.0] - date),
+    # anywhere in a line. New versions are at the top, so stop reading at the
+    # first match.
+    version_pattern = re.compile(rf"##\s*\[{re.escape(version)}\]")
+    with _CHANGELOG_FILE.open(encoding="utf-8") as changelog:
+        found = any(version_pattern.search(line) for line in changelog)
+    if not found:
         raise RuntimeError(
             f"CHANGELOG.md does not contain version {version}. "
             "Please update CHANGELOG.md before releasing."
         )
 
 
+def _version_to_tag(version: str) -> str:
+    """Return the git tag for a version (e.g., 1.2.1-b2 -> v1.2.1-b2).
+    
+    The tag is the VERSION string as written, so it always matches the
+    committed VERSION file (also for legacy formats such as 1.2.1b2).
+    """
+    return f"v{version.strip()}"
+
+
 def create_git_tag(version: str, dry_run: bool = False) -> None:
     """Create git tag for version.
     
     All versions (including dev) are tagged to enable GitHub Releases.
     Pre-release versions already use hyphen format (e.g., 1.2.1-b2).
     """
-    # Version already uses hyphen format, just add 'v' prefix
-    tag = f"v{version}"
+    tag = _version_to_tag(version)
     
     if dry_run:
         print(f"[DRY RUN] Would create tag: {tag}")
         return
     
-    # Check if tag already exists
-    result = subprocess.run(
-        ["git", "tag", "-l", tag],
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    if result.stdout.strip():
-        raise RuntimeError(f"Tag {tag} already exists")
-    
-    # Create tag
-    subprocess.run(["git", "tag", tag], check=True)
+    # git tag refuses to overwrite an existing tag, no need for a separate lookup
+    result = subprocess.run(["git", "tag", tag], capture_output=True, text=True)
+    if result.returncode != 0:
+        if "already exists" in result.stderr:
+            raise RuntimeError(f"Tag {tag} already exists")
+        raise RuntimeError(f"Could not create tag {tag}: {result.stderr.strip()}")
     print(f"Created tag: {tag}")
 
 
@@ -251,20 +223,9 @@ def commit_version(version: str, dry_run: bool = False) -> None:
         print(f"Version {version} already committed (no changes)")
         return
     
-    subprocess.run(["git", "add", "VERSION"], check=True)
-    
-    # Check if there are staged changes before committing
-    result = subprocess.run(
-        ["git", "diff", "--cached", "--quiet", "VERSION"],
-        capture_output=True,
-    )
-    if result.returncode == 0:
-        # No staged changes
-        print(f"Version {version} already committed (no staged changes)")
-        return
-    
+    # Committing with a pathspec stages VERSION as part of the commit
     subprocess.run(
-        ["git", "commit", "-m", f"Bump version to {version}"],
+        ["git", "commit", "-m", f"Bump version to {version}", "--", "VERSION"],
         check=True,
     )
     print(f"Committed version {version}")
@@ -274,9 +235,8 @@ def push_to_github(version: str, dry_run: bool = False) -> None:
     """Push commits and tags to GitHub.
     
     All versions (including dev) push tags to enable GitHub Releases.
-    Version already uses hyphen format, so tag is just v{version}.
     """
-    tag = f"v{version}"
+    tag = _version_to_tag(version)
     
     if dry_run:
         print(f"[DRY RUN] Would push commits and tag {tag} to GitHub")
@@ -290,32 +250,45 @@ def push_to_github(version: str, dry_run: bool = False) -> None:
     print(f"Pushed to GitHub (tag: {tag})")
 
 
-def main() -> None:
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for main()."""
     parser = argparse.ArgumentParser(description="Create a new release or prerelease")
-    parser.add_argument(
+    # Exactly one of --release, --dev, --alpha, --beta or --rc
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument(
         "--release",
-        action="store_true",
+        dest="action",
+        action="store_const",
+        const="release",
         help="Create a release by removing prerelease suffix (e.g., 1.2.1-b3 -> 1.2.1)",
     )
-    parser.add_argument(
+    action.add_argument(
         "--dev",
-        action="store_true",
+        dest="action",
+        action="store_const",
+        const="dev",
         help="Create development version (e.g., 1.2.1-dev). Dev versions create tags for GitHub Releases. "
              "Note: Dev versions are automatically created after each release, so manual creation is rarely needed.",
     )
-    parser.add_argument(
+    action.add_argument(
         "--alpha",
-        action="store_true",
+        dest="action",
+        action="store_const",
+        const="alpha",
         help="Create alpha version (e.g., 1.2.1-a1)",
     )
-    parser.add_argument(
+    action.add_argument(
         "--beta",
-        action="store_true",
+        dest="action",
+        action="store_const",
+        const="beta",
         help="Create beta version (e.g., 1.2.1-b1)",
     )
-    parser.add_argument(
+    action.add_argument(
         "--rc",
-        action="store_true",
+        dest="action",
+        action="store_const",
+        const="rc",
         help="Create release candidate (e.g., 1.2.1-rc1)",
     )
     parser.add_argument(
@@ -323,23 +296,16 @@ def main() -> None:
         action="store_true",
         help="Show what would be done without making changes",
     )
+    return parser
+
+
+def main() -> None:
+    parser = _build_parser()
     args = parser.parse_args()
     
-    # Determine action type
-    action_types = [args.release, args.dev, args.alpha, args.beta, args.rc]
-    if sum(action_types) != 1:
-        parser.error("Exactly one of --release, --dev, --alpha, --beta, or --rc must be specified")
-    
+    release = args.action == "release"
     # Determine prerelease type (None for release)
-    prerelease_type = None
-    if args.dev:
-        prerelease_type = "dev"
-    elif args.alpha:
-        prerelease_type = "alpha"
-    elif args.beta:
-        prerelease_type = "beta"
-    elif args.rc:
-        prerelease_type = "rc"
+    prerelease_type = None if release else args.action
     
     try:
         # Get current version
@@ -347,14 +313,14 @@ def main() -> None:
         print(f"Current version: {current_version}")
         
         # Calculate new version
-        if args.release:
+        if release:
             # Remove prerelease suffix
             new_version = remove_prerelease_suffix(current_version)
             # Check if version already has no suffix
             major, minor, patch, current_prerelease_type, _ = parse_version(current_version)
             if not current_prerelease_type:
                 parser.error(f"Current version {current_version} is already a release version. Use prerelease types (--alpha, --beta, --rc) to create prereleases.")
-        elif args.dev:
+        elif prerelease_type == "dev":
             # For dev releases: use current version, don't increment
             # GitHub Actions will increment after the release is created
             new_version = current_version
@@ -368,11 +334,11 @@ def main() -> None:
         
         # Validate git status
         if not args.dry_run:
-            check_git_status()
+            current_branch = check_git_status()
             print("✓ Git repository is clean")
         
         # Check changelog (only for release versions, not prereleases)
-        if args.release and not args.dry_run:
+        if release and not args.dry_run:
             check_changelog(new_version)
             print(f"✓ CHANGELOG.md contains version {new_version}")
         
@@ -393,19 +359,11 @@ def main() -> None:
         # Push to GitHub
         if not args.dry_run:
             push_to_github(new_version, dry_run=args.dry_run)
-            if args.release:
+            if release:
                 # Automatically create next dev version after release
                 major, minor, patch, _, _ = parse_version(new_version)
                 
-                # Check current branch to determine version increment strategy
-                result = subprocess.run(
-                    ["git", "branch", "--show-current"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                current_branch = result.stdout.strip()
-                
+                # Branch determines version increment strategy (known from check_git_status)
                 # On maintenance branches, increment patch; on main, increment minor
                 if current_branch.startswith("maintenance/"):
                     next_dev_version = f"{major}.{minor}.{patch + 1}-dev"
@@ -429,11 +387,12 @@ def main() -> None:
                 print("GitHub Actions will automatically create a pre-release.")
         else:
             print("\n[DRY RUN] No changes were made.")
-            if args.release:
+            if release:
                 # Show what would happen after release
                 major, minor, patch, _, _ = parse_version(new_version)
                 
                 # Check current branch to determine version increment strategy
+                # (check_git_status is skipped in dry-run mode)
                 result = subprocess.run(
                     ["git", "branch", "--show-current"],
                     capture_output=True,
@@ -15,6 +15,7 @@ import os
 import ssl
 import threading
 import time
+from http.server import ThreadingHTTPServer
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -23,9 +24,12 @@ from homeconnect_coffee import __version__, get_version_type, is_release_version
 from homeconnect_coffee.api_monitor import get_monitor
 from homeconnect_coffee.errors import ErrorHandler
 from homeconnect_coffee.handlers import RequestRouter
+from homeconnect_coffee.handlers import dashboard_handler as dashboard_module
+from homeconnect_coffee.handlers import history_handler as history_module
 from homeconnect_coffee.handlers.dashboard_handler import DashboardHandler
 from homeconnect_coffee.handlers.history_handler import HistoryHandler
 from homeconnect_coffee.history import HistoryManager
+from homeconnect_coffee.middleware import AuthMiddleware
 from homeconnect_coffee.services import EventStreamManager
 
 
@@ -38,6 +42,12 @@ error_handler: ErrorHandler | None = None
 logger = logging.getLogger(__name__)
 
 
+class CoffeeHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer with a longer listen backlog for bursts of requests."""
+
+    request_queue_size = 128
+
+
 def load_env_file() -> None:
     """Load .env file from common locations.
     
@@ -148,13 +158,7 @@ def main() -> None:
         enable_logging=not args.no_log,
     )
 
-    # Set global variables for handlers (for static methods)
-    from homeconnect_coffee.handlers.dashboard_handler import event_stream_manager as dashboard_event_manager
-    from homeconnect_coffee.handlers.history_handler import history_manager as history_handler_manager
-    
-    # Set global variables in handler modules
-    import homeconnect_coffee.handlers.dashboard_handler as dashboard_module
-    import homeconnect_coffee.handlers.history_handler as history_module
+    # Set global variables in handler modules (for static methods)
     dashboard_module.event_stream_manager = event_stream_manager
     history_module.history_manager = history_manager
 
@@ -163,7 +167,6 @@ def main() -> None:
     monitor.print_stats()  # Show current statistics on startup
 
     # Initialize auth middleware
-    from homeconnect_coffee.middleware import AuthMiddleware
     auth_middleware = AuthMiddleware(api_token=api_token, error_handler=error_handler)
     
     # Configure router
@@ -173,8 +176,7 @@ def main() -> None:
     RequestRouter.auth_middleware = auth_middleware
 
     # Use ThreadingHTTPServer so multiple requests can be processed simultaneously
-    from http.server import ThreadingHTTPServer
-    server = ThreadingHTTPServer((args.host, args.port), RequestRouter)
+    server = CoffeeHTTPServer((args.host, args.port), RequestRouter)
 
     # Enable HTTPS if certificate and key are provided
     protocol = "http"
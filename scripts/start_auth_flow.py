@@ -4,10 +4,7 @@ import argparse
 import textwrap
 import webbrowser
 
-from rich import print
-
-from homeconnect_coffee.auth import build_authorize_url, exchange_code_for_tokens
-from homeconnect_coffee.config import load_config
+from homeconnect_coffee.console import print
 
 
 def main() -> None:
@@ -24,6 +21,10 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    # Imported after argument parsing so that --help stays fast
+    from homeconnect_coffee.auth import build_authorize_url, exchange_code_for_tokens
+    from homeconnect_coffee.config import load_config
+
     config = load_config()
     authorize_url = build_authorize_url(config)
 
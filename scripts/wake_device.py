@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from time import sleep
 
-from rich import print
-
 from homeconnect_coffee.client import HomeConnectClient
 from homeconnect_coffee.config import load_config
+from homeconnect_coffee.console import print
+from homeconnect_coffee.services.coffee_service import POWER_ON, POWER_STANDBY, POWER_STATE_KEY
 
 
 def main() -> None:
@@ -17,16 +17,16 @@ def main() -> None:
         settings = client.get_settings()
         power_state = None
         for setting in settings.get("data", {}).get("settings", []):
-            if setting.get("key") == "BSH.Common.Setting.PowerState":
+            if setting.get("key") == POWER_STATE_KEY:
                 power_state = setting.get("value")
                 break
 
-        if power_state == "BSH.Common.EnumType.PowerState.Standby":
+        if power_state == POWER_STANDBY:
             print("[yellow]Device is in standby, activating...[/yellow]")
-            client.set_setting("BSH.Common.Setting.PowerState", "BSH.Common.EnumType.PowerState.On")
+            client.set_setting(POWER_STATE_KEY, POWER_ON)
             sleep(2)  # Wait briefly for device to activate
             print("[bold green]Device activated![/bold green]")
-        elif power_state == "BSH.Common.EnumType.PowerState.On":
+        elif power_state == POWER_ON:
             print("[green]Device is already activated.[/green]")
         else:
             print(f"[yellow]Unknown PowerState: {power_state}[/yellow]")
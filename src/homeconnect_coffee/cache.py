@@ -0,0 +1,82 @@
+"""Small on-disk TTL cache for API responses that tolerate some staleness.
+
+Used by the CLI scripts to avoid repeating HTTPS round-trips (e.g. appliance list,
+settings) when they are invoked several times in a row.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from functools import update_wrapper
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+DEFAULT_TTL = 300.0
+
+# Cache file for the appliance list; the list is per account, not per HAID,
+# so all scripts share this one file
+APPLIANCES_CACHE_FILE = "appliances.json"
+
+
+def default_cache_dir() -> Path:
+    """Returns the cache directory (``$XDG_CACHE_HOME/homeconnect_coffee``)."""
+    base = os.getenv("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base).expanduser() / "homeconnect_coffee"
+
+
+class CachedCall:
+    """Zero-argument call whose JSON result is cached in a file (see ttl_cache())."""
+
+    def __init__(self, fn: Callable[[], Dict[str, Any]], path: Path, ttl: float) -> None:
+        self._fn = fn
+        self.path = path
+        self.ttl = ttl
+        update_wrapper(self, fn)
+
+    def __call__(self) -> Dict[str, Any]:
+        try:
+            if self.path.stat().st_mtime > time.time() - self.ttl:
+                return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache file - fall through to a fresh call
+
+        result = self._fn()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(result))
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # Caching is best effort
+        return result
+
+    def invalidate(self) -> None:
+        """Removes the cached file, so the next call hits the wrapped function."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def ttl_cache(path: Path, ttl: float = DEFAULT_TTL) -> Callable[[Callable[[], Dict[str, Any]]], CachedCall]:
+    """Decorator that caches the JSON result of a zero-argument call in a file.
+
+    The cached file is used as long as its modification time is younger than ttl
+    seconds. Otherwise the wrapped function is called and the result is written
+    back atomically. The returned CachedCall has an ``invalidate()`` method that
+    removes the cached file.
+
+    Args:
+        path: Cache file path
+        ttl: Time-to-live in seconds
+
+    Returns:
+        Decorator for the function to cache
+    """
+
+    def decorator(fn: Callable[[], Dict[str, Any]]) -> CachedCall:
+        return CachedCall(fn, path, ttl)
+
+    return decorator
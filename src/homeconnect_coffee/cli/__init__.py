@@ -0,0 +1 @@
+"""Command line entry points shared by the scripts in scripts/."""
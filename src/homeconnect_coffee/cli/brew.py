@@ -0,0 +1,337 @@
+"""Brew a beverage from the command line (used by scripts/brew_espresso.py)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Any, Callable, Dict, TypeVar
+
+# Only lightweight modules are imported at load time, so that --help and
+# argument errors return without loading requests, sseclient or the client
+from ..cache import APPLIANCES_CACHE_FILE, CachedCall, default_cache_dir, ttl_cache
+from ..console import print
+from ..programs import (
+    FILL_OPTION,
+    OPERATION_STATE_KEY,
+    POWER_ON,
+    POWER_STANDBY,
+    POWER_STATE_KEY,
+    PROGRAM_KEYS,
+    PROGRAMS_WITH_FILL_ML,
+)
+
+if TYPE_CHECKING:
+    from ..client import HomeConnectClient
+
+STRONG_OPTION = "ConsumerProducts.CoffeeMaker.Option.BeanAmount"
+WRONG_OPERATION_STATE = "WrongOperationState"
+
+# Short OperationState names used by _poll_until_done
+RUNNING_STATES = frozenset({"Run", "DelayedStart", "ActionRequired"})
+IDLE_STATES = frozenset({"Inactive", "Ready"})
+
+T = TypeVar("T")
+
+
+def build_options(fill_ml: int | None, strength: str | None) -> list[dict[str, object]]:
+    options: list[dict[str, object]] = []
+    if fill_ml is not None:
+        options.append({"key": FILL_OPTION, "value": fill_ml})
+    # BeanAmount is omitted because values are device-specific
+    # and may not be "Mild", "Normal", "Strong"
+    # if strength is not None:
+    #     options.append({"key": STRONG_OPTION, "value": strength})
+    return options
+
+
+def _retry_with_backoff(
+    fn: Callable[[], T],
+    retriable: tuple[str, ...] = (WRONG_OPERATION_STATE,),
+    n_max: int = 5,
+    base: float = 0.5,
+    cap: float = 8.0,
+    jitter: float = 0.5,
+) -> T:
+    """Calls fn and retries retriable API errors with truncated exponential backoff.
+
+    Args:
+        fn: Callable to execute
+        retriable: Substrings of the RuntimeError message that allow a retry
+        n_max: Maximum number of attempts
+        base: Delay of the first retry in seconds
+        cap: Upper bound for a single delay in seconds (before jitter)
+        jitter: Relative random jitter added to each delay
+
+    Returns:
+        Return value of fn
+
+    Raises:
+        RuntimeError: If the error is not retriable or all attempts failed
+    """
+    for attempt in range(n_max):
+        try:
+            return fn()
+        except RuntimeError as e:
+            if not any(token in str(e) for token in retriable) or attempt == n_max - 1:
+                raise
+            delay = min(cap, base * (2**attempt)) * (1 + random.random() * jitter)
+            print(f"[yellow]Device not ready yet, retrying in {delay:.1f}s... (Attempt {attempt + 1}/{n_max})[/yellow]")
+            sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def _is_disconnected(get_home_appliances: CachedCall, haid: str) -> bool:
+    """Returns True if the appliance list explicitly reports the device as not connected."""
+    appliances = get_home_appliances().get("data", {}).get("homeappliances", [])
+    appliance = next((a for a in appliances if a.get("haid") == haid), None)
+    return appliance is not None and appliance.get("connected") is False
+
+
+def _fetch_power_setting(client: HomeConnectClient) -> Dict[str, Any]:
+    """Fetches only the PowerState setting, falling back to the full settings list on 404."""
+    try:
+        return client.get_setting(POWER_STATE_KEY)
+    except RuntimeError as e:
+        if "(404)" not in str(e):
+            raise
+    for setting in client.get_settings().get("data", {}).get("settings", []):
+        if setting.get("key") == POWER_STATE_KEY:
+            return {"data": setting}
+    return {"data": {}}
+
+
+def _read_power_state(get_power_setting: Callable[[], Dict[str, Any]]) -> str | None:
+    return get_power_setting().get("data", {}).get("value")
+
+
+def _wait_for_power_on(client: HomeConnectClient) -> None:
+    """Polls the PowerState with backoff until the device reports On."""
+
+    def check() -> None:
+        if _read_power_state(lambda: _fetch_power_setting(client)) != POWER_ON:
+            raise RuntimeError("PowerState not On yet")
+
+    _retry_with_backoff(check, retriable=("PowerState not On yet",))
+
+
+def await_power_on(client: HomeConnectClient, activate: Callable[[], Any], timeout: float = 10.0) -> bool:
+    """Activates the device and waits for the PowerState=On notification via SSE.
+
+    The appliance event stream is opened before activate() is called so that the
+    notification cannot be missed.
+
+    Args:
+        client: HomeConnectClient
+        activate: Callable that switches the device on
+        timeout: Maximum seconds to wait for the notification
+
+    Returns:
+        True if the notification arrived, False on timeout or stream errors
+        (the device was still asked to switch on)
+    """
+    import requests
+    from sseclient import SSEClient
+
+    from ..client import BASE_API
+
+    deadline = monotonic() + timeout
+    response = None
+    try:
+        response = requests.get(
+            f"{BASE_API}/homeappliances/{client.config.haid}/events",
+            headers={"Authorization": f"Bearer {client.get_access_token()}", "Accept": "text/event-stream"},
+            stream=True,
+            timeout=(10, timeout),
+        )
+        response.raise_for_status()
+    except requests.exceptions.RequestException:
+        if response is not None:
+            response.close()
+        activate()
+        return False
+
+    try:
+        activate()
+        for event in SSEClient(response).events():
+            if event.event == "NOTIFY" and event.data:
+                items = json.loads(event.data).get("items", [])
+                if any(i.get("key") == POWER_STATE_KEY and i.get("value") == POWER_ON for i in items):
+                    return True
+            if monotonic() > deadline:
+                return False
+        return False
+    except (requests.exceptions.RequestException, ValueError):
+        return False
+    finally:
+        response.close()
+
+
+def _ensure_power_on(client: HomeConnectClient, get_power_setting: CachedCall) -> None:
+    """Activates the device if the (possibly cached) PowerState reports Standby."""
+    try:
+        power_state = _read_power_state(get_power_setting)
+
+        if power_state == POWER_STANDBY:
+            print("[yellow]Device is in standby, activating...[/yellow]")
+            powered_on = await_power_on(client, lambda: client.set_setting(POWER_STATE_KEY, POWER_ON))
+            get_power_setting.invalidate()
+            if not powered_on:
+                # No notification received in time - fall back to polling
+                _wait_for_power_on(client)
+    except Exception as e:
+        print(f"[yellow]Could not check/set PowerState: {e}[/yellow]")
+        # Continue trying, device might already be active
+
+
+def _poll_until_done(client: HomeConnectClient, timeout: float = 60.0, base: float = 1.0, cap: float = 8.0) -> None:
+    """Polls the operation state with an adaptive interval until the program is done.
+
+    The interval starts at base, doubles while nothing changes (up to cap) and resets
+    after each observed state change. Polling stops on Finished, on Inactive/Ready after
+    the program was seen running, or once timeout seconds have elapsed.
+    """
+    t0 = monotonic()
+    interval = base
+    last_state: str | None = None
+    seen_running = False
+    while True:
+        status = client.get_status()
+        state = None
+        for item in status.get("data", {}).get("status", []):
+            if item.get("key") == OPERATION_STATE_KEY:
+                state = item.get("value")
+                break
+
+        changed = state != last_state
+        if changed:
+            print(json.dumps(status, indent=2))
+            last_state = state
+        short_state = (state or "").rsplit(".", 1)[-1]
+        if short_state in RUNNING_STATES:
+            seen_running = True
+        if short_state == "Finished" or (seen_running and short_state in IDLE_STATES):
+            break
+        if monotonic() - t0 > timeout:
+            print("[yellow]Polling timed out.[/yellow]")
+            break
+
+        interval = base if changed else min(cap, interval * 2)
+        sleep(interval)
+
+
+def brew(
+    beverage: str = "Espresso",
+    fill_ml: int | None = 50,
+    strength: str | None = None,
+    poll: bool = False,
+    ensure_on: bool = True,
+) -> None:
+    """Selects and starts a beverage program.
+
+    Args:
+        beverage: Beverage name (see PROGRAM_KEYS, case-insensitive)
+        fill_ml: Fill amount in ml (only used for beverages that support it)
+        strength: Bean amount/strength (currently ignored, device-specific)
+        poll: Poll the status until the program is done
+        ensure_on: Check the PowerState first and wake the device if necessary
+
+    Raises:
+        ValueError: If the beverage is unknown
+        SystemExit: If the device is not connected
+    """
+    beverage_name = beverage.lower()
+    program_key = PROGRAM_KEYS.get(beverage_name)
+    if program_key is None:
+        raise ValueError(f"Unknown beverage: {beverage}")
+    if beverage_name not in PROGRAMS_WITH_FILL_ML:
+        fill_ml = None
+
+    from ..client import HomeConnectClient
+    from ..config import load_config
+
+    config = load_config()
+    client = HomeConnectClient(config)
+
+    # Skip all further requests if the device is offline. A cached "disconnected"
+    # entry is confirmed with a fresh request before giving up.
+    cache_dir = default_cache_dir()
+    get_home_appliances = ttl_cache(cache_dir / APPLIANCES_CACHE_FILE)(client.get_home_appliances)
+    if _is_disconnected(get_home_appliances, config.haid):
+        get_home_appliances.invalidate()
+        if _is_disconnected(get_home_appliances, config.haid):
+            print("[bold yellow]Coffee machine is not connected, aborting.[/bold yellow]")
+            raise SystemExit(2)
+
+    # The PowerState is cached on disk for a few minutes to save a round-trip on repeated runs
+    get_power_setting = ttl_cache(cache_dir / f"power_state_{config.haid}.json")(
+        lambda: _fetch_power_setting(client)
+    )
+
+    if ensure_on:
+        # Check PowerState and activate device if necessary
+        print("[bold]Checking device status...[/bold]")
+        _ensure_power_on(client, get_power_setting)
+
+    options = build_options(fill_ml, strength)
+    
+    # First clear any existing selected program
+    try:
+        client.clear_selected_program()
+    except Exception:
+        pass  # Ignore errors if no program is selected
+    
+    print("[bold]Selecting program...[/bold]")
+    rechecked = False
+
+    def select() -> Dict[str, Any]:
+        nonlocal rechecked
+        try:
+            return client.select_program(program_key, options=options)
+        except RuntimeError as e:
+            if WRONG_OPERATION_STATE in str(e) and not rechecked:
+                # The cached PowerState may be stale - check it live once
+                rechecked = True
+                get_power_setting.invalidate()
+                _ensure_power_on(client, get_power_setting)
+            raise
+
+    _retry_with_backoff(select)
+
+    print(f"[bold green]Starting {beverage_name}...[/bold green]")
+    client.start_program()
+
+    if poll:
+        print("Querying status... (aborts after 60s)")
+        _poll_until_done(client)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Starts a beverage via the HomeConnect API")
+    parser.add_argument(
+        "--beverage",
+        choices=sorted(PROGRAM_KEYS),
+        default="espresso",
+        type=str.lower,
+        help="Beverage to brew (default: espresso)",
+    )
+    parser.add_argument("--fill-ml", type=int, default=50, help="Fill amount in ml (35-50 ml for espresso)")
+    parser.add_argument(
+        "--strength",
+        choices=["Mild", "Normal", "Strong"],
+        default=None,
+        help="Bean amount/strength (currently disabled - device-specific values required)",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Query status after start",
+    )
+    args = parser.parse_args()
+
+    brew(args.beverage, fill_ml=args.fill_ml, strength=args.strength, poll=args.poll)
+
+
+if __name__ == "__main__":
+    main()
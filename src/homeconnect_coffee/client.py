@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-from __future__ import annotations
-
+import copy
 import logging
 import time
 from datetime import datetime, timezone
-from threading import Lock
+from threading import Lock, RLock, local
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .api_monitor import record_api_call, record_token_refresh
 from .auth import TokenBundle, refresh_access_token
@@ -19,11 +20,31 @@ logger = logging.getLogger(__name__)
 BASE_API = "https://api.home-connect.com/api"
 JSON_HEADER = "application/vnd.bsh.sdk.v1+json"
 
+# Transport-level retries for transient failures. 429 is deliberately not
+# retried here because _request() implements its own (much longer) backoff
+# for rate limits; Retry-After is ignored for the same reason, as urllib3
+# would otherwise sleep on and retry 429 responses that carry it. Only
+# idempotent methods are retried on 5xx responses.
+_TRANSPORT_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "DELETE"}),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+
+# Maximum number of URLs whose last GET response is kept for conditional requests.
+# The client only GETs a handful of fixed endpoints per appliance, so this is a
+# safety bound rather than a working-set size.
+ETAG_CACHE_SIZE = 32
+
 # Global lock for token refresh (prevents concurrent refreshes)
 _token_refresh_lock = Lock()
 
-# Global lock for rate limit retries (prevents concurrent retries)
-_rate_limit_retry_lock = Lock()
+# Global lock for rate limit retries (prevents concurrent retries).
+# Reentrant because the retry calls _request() again while holding it.
+_rate_limit_retry_lock = RLock()
 
 
 class HomeConnectClient:
@@ -33,12 +54,35 @@ class HomeConnectClient:
         if not tokens:
             raise RuntimeError("No token found. Please run the auth flow first.")
         self.tokens = tokens
-        # Create a session for connection pooling
+        # Create a session for connection pooling (keeps the TLS connection alive)
         self._session = requests.Session()
-        # Track if we've already retried a request (to prevent infinite loops)
-        self._retry_attempted = False
-        # Track rate limit retries (reset per request)
-        self._rate_limit_retries = 0
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=_TRANSPORT_RETRY)
+        self._session.mount("https://", adapter)
+        # Per-thread request state: the client is shared by the server's
+        # request threads, so retry tracking must not leak between requests
+        self._local = local()
+        # Conditional GET cache: URL -> (ETag, last response body), oldest first.
+        # The client is shared by request threads, so callers get copies.
+        self._etag_cache: Dict[str, tuple[str, Dict[str, Any]]] = {}
+        self._etag_lock = Lock()
+
+    @property
+    def _retry_attempted(self) -> bool:
+        """Whether the current request already retried after a 401 (prevents infinite loops)."""
+        return getattr(self._local, "retry_attempted", False)
+
+    @_retry_attempted.setter
+    def _retry_attempted(self, value: bool) -> None:
+        self._local.retry_attempted = value
+
+    @property
+    def _rate_limit_retries(self) -> int:
+        """Rate limit retries of the current request (reset per request)."""
+        return getattr(self._local, "rate_limit_retries", 0)
+
+    @_rate_limit_retries.setter
+    def _rate_limit_retries(self, value: int) -> None:
+        self._local.rate_limit_retries = value
 
     def _ensure_token(self) -> None:
         """Ensures token is valid, refreshing if necessary.
@@ -126,6 +170,10 @@ class HomeConnectClient:
         
         url = f"{BASE_API}{endpoint}"
         headers = self._headers()
+        with self._etag_lock:
+            cached = self._etag_cache.get(url) if method == "GET" else None
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
         
         # Timeout: 10 seconds for connection, 30 seconds total
         try:
@@ -223,9 +271,26 @@ class HomeConnectClient:
             # Re-raise HTTPError as-is so ErrorHandler can classify it
             raise
         
+        if method != "GET":
+            # State-changing call - cached GET responses may be outdated now
+            with self._etag_lock:
+                self._etag_cache.clear()
+        elif resp.status_code == 304 and cached is not None:
+            # Not modified - reuse (a copy of) the body of the previous response
+            return copy.deepcopy(cached[1])
+        
         if resp.status_code == 204:
             return {}
-        return resp.json()
+        data = resp.json()
+        if method == "GET":
+            etag = resp.headers.get("ETag")
+            if isinstance(etag, str) and etag:
+                with self._etag_lock:
+                    self._etag_cache.pop(url, None)
+                    if len(self._etag_cache) >= ETAG_CACHE_SIZE:
+                        del self._etag_cache[next(iter(self._etag_cache))]
+                    self._etag_cache[url] = (etag, copy.deepcopy(data))
+        return data
     
     def __del__(self) -> None:
         """Cleanup: close session when client is destroyed."""
@@ -298,6 +363,11 @@ class HomeConnectClient:
         haid = haid or self.config.haid
         return self._request("GET", f"/homeappliances/{haid}/settings")
 
+    def get_setting(self, key: str, haid: Optional[str] = None) -> Dict[str, Any]:
+        """Gets a single device setting (smaller response than get_settings)."""
+        haid = haid or self.config.haid
+        return self._request("GET", f"/homeappliances/{haid}/settings/{key}")
+
     def set_setting(self, key: str, value: Any, haid: Optional[str] = None) -> Dict[str, Any]:
         """Sets a device setting."""
         haid = haid or self.config.haid
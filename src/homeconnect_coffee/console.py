@@ -0,0 +1,31 @@
+"""Console output helper for the CLI scripts.
+
+Importing rich's console costs tens of milliseconds, which dominates the runtime
+of short scripts. rich is therefore only loaded when stdout is a terminal. For
+pipes, files and cron jobs the markup is stripped and builtin print is used.
+"""
+
+from __future__ import annotations
+
+import builtins
+import re
+import sys
+from typing import Any
+
+# Matches rich markup tags such as [bold], [bold green], [/bold green] and [/]
+_MARKUP_RE = re.compile(r"\[(?:/|/?[a-z][a-z ]*)\]")
+
+
+def strip_markup(text: str) -> str:
+    """Removes rich markup tags from a string."""
+    return _MARKUP_RE.sub("", text)
+
+
+def print(*objects: Any, **kwargs: Any) -> None:  # noqa: A001 - drop-in replacement for rich.print
+    """Prints with rich on a TTY and with builtin print (markup stripped) otherwise."""
+    if sys.stdout.isatty():
+        from rich import print as rich_print
+
+        rich_print(*objects, **kwargs)
+        return
+    builtins.print(*(strip_markup(o) if isinstance(o, str) else o for o in objects), **kwargs)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import os
+import re
 import sys
+import time
 import traceback
 from enum import IntEnum
 from typing import Any, Dict, Optional
@@ -17,6 +20,9 @@ except ImportError:
 # Logger for error handling
 logger = logging.getLogger(__name__)
 
+# HTTP status code in client error messages, e.g. "API request failed (409): ..."
+_STATUS_CODE_RE = re.compile(r'\((\d{3})\)')
+
 
 class ColoredFormatter(logging.Formatter):
     """Logging formatter with colors for DEBUG (gray), WARNING (orange) and ERROR (red).
@@ -37,6 +43,8 @@ class ColoredFormatter(logging.Formatter):
         """Initializes the formatter."""
         super().__init__(*args, **kwargs)
         self._use_colors = self._should_use_colors()
+        # Last formatted timestamp: (second, datefmt, text)
+        self._time_cache: Optional[tuple[int, str, str]] = None
     
     def _should_use_colors(self) -> bool:
         """Checks if colors should be used.
@@ -59,6 +67,21 @@ class ColoredFormatter(logging.Formatter):
         
         return True
     
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Formats the record time, reusing the text for records of the same second.
+        
+        Only used with an explicit datefmt (without one, milliseconds are added).
+        """
+        if datefmt is None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached = self._time_cache
+        if cached is not None and cached[0] == second and cached[1] == datefmt:
+            return cached[2]
+        text = time.strftime(datefmt, self.converter(second))
+        self._time_cache = (second, datefmt, text)
+        return text
+    
     def format(self, record: logging.LogRecord) -> str:
         """Formats a log record with optional colors."""
         # Create base format
@@ -273,8 +296,7 @@ class ErrorHandler:
         
         # RuntimeError from client.py - check if it's a connection-related error
         if exception_type == "RuntimeError" and "API request failed" in exception_message:
-            import re
-            status_match = re.search(r'\((\d{3})\)', exception_message)
+            status_match = _STATUS_CODE_RE.search(exception_message)
             if status_match:
                 status_code = int(status_match.group(1))
                 # Handle specific status codes first
@@ -295,7 +317,6 @@ class ErrorHandler:
                             error_detail = parts[1].strip()
                     
                     # Try to parse as JSON/dict if it looks like one
-                    import json
                     error_text_to_check = error_detail
                     try:
                         # Try to parse as JSON if it starts with { or [
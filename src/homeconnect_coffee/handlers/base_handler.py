@@ -2,16 +2,106 @@
 
 from __future__ import annotations
 
+import hmac
 import json
 import logging
+import re
+from functools import lru_cache
 from http.server import BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlencode, urlparse
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs
 
+from ..client import HomeConnectClient
+from ..config import load_config
 from ..errors import ErrorCode, ErrorHandler
 
+if TYPE_CHECKING:
+    from ..middleware.auth_middleware import AuthMiddleware
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not available, use stdlib json
+
 # Logger for handlers
 logger = logging.getLogger(__name__)
 
+UNAUTHORIZED_MESSAGE = "Unauthorized - Invalid or missing API token"
+
+# Value of a token query parameter, masked in request logs
+_TOKEN_PARAM_RE = re.compile(r"([?&]token=)[^&#]*")
+
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serializes a response body to JSON bytes (orjson if installed).
+    
+    Compact by default; pretty=True indents by two spaces for reading by humans.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2 if pretty else orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _fixed_error_body(code: int, message: str, with_error_code: bool) -> bytes:
+    """Encodes an error response with a constant message once.
+    
+    Same format as ErrorHandler.format_error_response() (with_error_code=True)
+    or _send_error() (with_error_code=False). Only used with literal messages.
+    """
+    response: dict[str, Any] = {"error": message, "code": code}
+    if with_error_code:
+        response["error_code"] = code
+    return _dumps(response)
+
+# HomeConnectClient shared by all requests (created on first use)
+_client: HomeConnectClient | None = None
+_client_lock = Lock()
+
+
+def get_client() -> HomeConnectClient:
+    """Returns the HomeConnectClient shared by all request handlers.
+    
+    Config and token file are only read once, and the client's session keeps
+    the TLS connection to the API alive between requests.
+    
+    Returns:
+        Shared HomeConnectClient instance
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HomeConnectClient(load_config())
+    return _client
+
+
+def reset_client() -> None:
+    """Drops the shared client, so the next request reloads config and token."""
+    global _client
+    with _client_lock:
+        _client = None
+
+
+def reset_client_on_auth_error(exception: Exception) -> None:
+    """Drops the shared client if the API rejected its credentials (401).
+    
+    The client already refreshes and retries once on 401; if that fails too, the
+    token file may have been replaced (e.g. by a new auth flow) and is reloaded.
+    
+    Args:
+        exception: Exception raised while calling the API
+    """
+    response = getattr(exception, "response", None)
+    if getattr(response, "status_code", None) == 401 or "(401)" in str(exception):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("API rejected the credentials, reloading config and token on next request")
+        reset_client()
+
 
 class BaseHandler(BaseHTTPRequestHandler):
     """Base class for all HTTP handlers with common functionality.
@@ -24,6 +114,25 @@ class BaseHandler(BaseHTTPRequestHandler):
     enable_logging = True
     api_token: str | None = None
     error_handler: ErrorHandler | None = None
+    auth_middleware: AuthMiddleware | None = None
+
+    # Keep connections open between requests (e.g. /wake then /brew from a
+    # Shortcut); every response therefore needs a Content-Length
+    protocol_version = "HTTP/1.1"
+
+    # Query of the current request as (path, parse_qs() result), see _query_params()
+    _parsed_query: tuple[str, dict[str, list[str]]] | None = None
+
+    # Socket timeout in seconds, so slow or idle (kept-alive) clients cannot hold
+    # a server thread forever
+    timeout = 10
+
+    # Send small responses right away instead of waiting for Nagle's algorithm
+    disable_nagle_algorithm = True
+
+    # Buffer wfile so status line, headers and body of a response go out in one
+    # send(); the server flushes after each request (SSE events flush themselves)
+    wbufsize = 64 * 1024
 
     def handle_one_request(self):
         """Overrides handle_one_request to catch BrokenPipeError."""
@@ -35,11 +144,11 @@ class BaseHandler(BaseHTTPRequestHandler):
 
     def log_request(self, code="-", size="-"):
         """Logs requests when logging is enabled."""
-        if self.enable_logging:
-            client_ip = self.client_address[0]
-            method = self.command
+        # Skip token masking and formatting entirely if INFO is not logged;
+        # the timestamp is added by the logging formatter, once per record
+        if self.enable_logging and logger.isEnabledFor(logging.INFO):
             path = self._mask_token_in_path(self.path)
-            logger.info(f"{client_ip} - {method} {path} - {code}")
+            logger.info("%s - %s %s - %s", self.client_address[0], self.command, path, code)
 
     def _mask_token_in_path(self, path: str) -> str:
         """Masks token parameters in the path for logging.
@@ -53,16 +162,7 @@ class BaseHandler(BaseHTTPRequestHandler):
         if "token=" not in path:
             return path
         
-        parsed = urlparse(path)
-        query_params = parse_qs(parsed.query)
-        
-        if "token" in query_params:
-            # Mask token
-            query_params["token"] = ["__MASKED__"]
-            new_query = urlencode(query_params, doseq=True)
-            return f"{parsed.path}?{new_query}"
-        
-        return path
+        return _TOKEN_PARAM_RE.sub(r"\1__MASKED__", path)
 
     def _check_auth(self) -> bool:
         """Checks authentication via header or query parameter.
@@ -73,18 +173,26 @@ class BaseHandler(BaseHTTPRequestHandler):
         if self.api_token is None:
             return True  # No token configured = open
 
+        # The middleware configured with the same token has it encoded already
+        middleware = self.auth_middleware
+        if middleware is not None and middleware.api_token is self.api_token:
+            return middleware.check_auth(self)
+
         # Check Authorization header
+        # Tokens are compared in constant time
+        expected = self.api_token.encode("utf-8")
         auth_header = self.headers.get("Authorization", "")
         if auth_header.startswith("Bearer "):
             token = auth_header[7:]
-            if token == self.api_token:
+            if hmac.compare_digest(token.encode("utf-8"), expected):
                 return True
 
-        # Check query parameter
-        parsed_path = urlparse(self.path)
-        query_params = parse_qs(parsed_path.query)
-        token_param = query_params.get("token", [None])[0]
-        if token_param == self.api_token:
+        # Check query parameter (only parsed if the query can contain a token)
+        query = self.path.partition("?")[2]
+        if "token=" not in query:
+            return False
+        token_param = self._query_params().get("token", [None])[0]
+        if token_param is not None and hmac.compare_digest(token_param.encode("utf-8"), expected):
             return True
 
         return False
@@ -96,15 +204,7 @@ class BaseHandler(BaseHTTPRequestHandler):
             True if authenticated, False if 401 was sent
         """
         if not self._check_auth():
-            if self.error_handler:
-                response = self.error_handler.create_error_response(
-                    ErrorCode.UNAUTHORIZED,
-                    "Unauthorized - Invalid or missing API token",
-                    ErrorCode.UNAUTHORIZED,
-                )
-                self._send_error_response(ErrorCode.UNAUTHORIZED, response)
-            else:
-                self._send_error(401, "Unauthorized - Invalid or missing API token")
+            self._send_fixed_error(ErrorCode.UNAUTHORIZED, UNAUTHORIZED_MESSAGE, self.error_handler)
             return False
         return True
 
@@ -115,12 +215,40 @@ class BaseHandler(BaseHTTPRequestHandler):
             data: The JSON data
             status_code: HTTP status code
         """
+        # Compact JSON: responses are read by scripts and Shortcuts, not humans
+        # (unless ?pretty=1 is given)
+        self._send_raw(status_code, _dumps(data, pretty=self._pretty_requested()))
+
+    def _pretty_requested(self) -> bool:
+        """Checks whether the request asks for indented JSON (?pretty=1)."""
+        if "pretty=" not in getattr(self, "path", ""):
+            return False
+        return self._query_params().get("pretty", [""])[0].lower() in ("1", "true")
+
+    def _send_raw(
+        self,
+        status_code: int,
+        body: bytes,
+        content_type: str = "application/json",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Sends an already encoded response body.
+        
+        Args:
+            status_code: HTTP status code
+            body: The response body
+            content_type: Value of the Content-Type header
+            headers: Optional additional headers
+        """
         self.send_response(status_code)
-        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
         self.send_header("Access-Control-Allow-Origin", "*")
+        if headers:
+            for name, value in headers.items():
+                self.send_header(name, value)
         self.end_headers()
-        response_body = json.dumps(data, indent=2).encode("utf-8")
-        self.wfile.write(response_body)
+        self.wfile.write(body)
         # log_request is automatically called by BaseHTTPRequestHandler
 
     def _send_error(self, code: int, message: str) -> None:
@@ -140,13 +268,22 @@ class BaseHandler(BaseHTTPRequestHandler):
             code: HTTP status code
             response: Error response dict
         """
-        self.send_response(code)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.end_headers()
-        error_body = json.dumps(response, indent=2).encode("utf-8")
-        self.wfile.write(error_body)
-        # log_request is automatically called by BaseHTTPRequestHandler
+        self._send_raw(code, _dumps(response))
+
+    def _send_fixed_error(self, code: int, message: str, error_handler: ErrorHandler | None) -> None:
+        """Sends a frequent error response with a constant message (e.g. 401, 404).
+        
+        Equivalent to error_handler.create_error_response() + _send_error_response()
+        (or _send_error() without an error handler), but the body is only encoded once.
+        
+        Args:
+            code: HTTP status code (also used as error code)
+            message: Constant error message
+            error_handler: ErrorHandler that would format the response, or None
+        """
+        if error_handler is not None and error_handler.enable_logging:
+            logger.warning("Error %s (%s): %s", code, code, message)
+        self._send_raw(code, _fixed_error_body(code, message, error_handler is not None))
 
     def _parse_path(self) -> tuple[str, dict]:
         """Parses the request path and query parameters.
@@ -154,21 +291,25 @@ class BaseHandler(BaseHTTPRequestHandler):
         Returns:
             Tuple of (path, query parameters dict)
         """
-        parsed_path = urlparse(self.path)
-        query_params = parse_qs(parsed_path.query)
-        return parsed_path.path, query_params
+        return self.path.partition("?")[0], self._query_params()
+
+    def _query_params(self) -> dict[str, list[str]]:
+        """Returns the query parameters of the current request.
+        
+        The query is parsed once per request; routing, authentication and the
+        handlers all share the result.
+        
+        Returns:
+            Query parameters as returned by parse_qs()
+        """
+        parsed = self._parsed_query
+        if parsed is None or parsed[0] != self.path:
+            parsed = self._parsed_query = (self.path, parse_qs(self.path.partition("?")[2]))
+        return parsed[1]
 
     def _send_not_found(self) -> None:
         """Sends 404 Not Found response."""
-        if self.error_handler:
-            response = self.error_handler.create_error_response(
-                ErrorCode.NOT_FOUND,
-                "Not Found",
-                ErrorCode.NOT_FOUND,
-            )
-            self._send_error_response(ErrorCode.NOT_FOUND, response)
-        else:
-            self._send_error(404, "Not Found")
+        self._send_fixed_error(ErrorCode.NOT_FOUND, "Not Found", self.error_handler)
 
     def log_message(self, format, *args):
         """Suppresses standard logging messages (only log_request is used)."""
@@ -3,17 +3,39 @@
 from __future__ import annotations
 
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-from ..client import HomeConnectClient
-from ..config import load_config
 from ..services import CoffeeService
-from ..services.coffee_service import PROGRAM_KEYS
+from ..services.coffee_service import PROGRAM_KEYS, PROGRAMS_WITH_FILL_ML
+from .base_handler import get_client, reset_client_on_auth_error
+from .status_handler import invalidate_status_cache
 
 if TYPE_CHECKING:
     from .base_handler import BaseHandler
     from ..middleware.auth_middleware import AuthMiddleware
 
+logger = logging.getLogger(__name__)
+
+# Runs brews requested with async=1 after the response was sent. A single worker
+# keeps them in request order (there is only one machine to talk to).
+_brew_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="brew")
+
+# CoffeeService shared by all requests, so the PowerState it remembers (e.g. from
+# /wake) is available to a following /brew
+_coffee_service: CoffeeService | None = None
+
+
+def _get_coffee_service() -> CoffeeService:
+    """Returns the shared CoffeeService for the current shared client."""
+    global _coffee_service
+    client = get_client()
+    service = _coffee_service
+    if service is None or service.client is not client:
+        service = _coffee_service = CoffeeService(client)
+    return service
+
 
 class CoffeeHandler:
     """Handler for coffee operations: Wake and Brew.
@@ -38,10 +60,9 @@ class CoffeeHandler:
             return
 
         try:
-            config = load_config()
-            client = HomeConnectClient(config)
-            coffee_service = CoffeeService(client)
+            coffee_service = _get_coffee_service()
             result = coffee_service.wake_device()
+            invalidate_status_cache()
             router._send_json(result, status_code=200)
         except Exception as e:
             CoffeeHandler._handle_error(router, e, "Error activating device")
@@ -52,6 +73,7 @@ class CoffeeHandler:
         fill_ml: int | None = None,
         program: str | None = None,
         auth_middleware: "AuthMiddleware | None" = None,
+        run_async: bool = False,
     ) -> None:
         """Starts a coffee program.
         
@@ -61,6 +83,8 @@ class CoffeeHandler:
             program: Optional program name (default: "espresso")
             auth_middleware: Optional AuthMiddleware for authentication.
                            If None, router._require_auth() is used (legacy).
+            run_async: If True, respond with 202 right after validation and run
+                       the API calls in the background (errors are only logged).
         """
         # Use middleware if present, otherwise legacy method
         if auth_middleware:
@@ -80,9 +104,7 @@ class CoffeeHandler:
             
             program_key = PROGRAM_KEYS[program_name]
             
-            config = load_config()
-            client = HomeConnectClient(config)
-            coffee_service = CoffeeService(client)
+            coffee_service = _get_coffee_service()
             
             # Get display name for response
             display_name = program_name.title() if program_name else "Program"
@@ -97,13 +119,33 @@ class CoffeeHandler:
             elif program_name == "milk foam" or program_name == "milkfoam":
                 display_name = "Milk Foam"
             
+            if run_async:
+                if fill_ml is not None and program_name not in PROGRAMS_WITH_FILL_ML:
+                    raise ValueError(f"Program '{display_name}' does not support fill_ml option")
+                _brew_executor.submit(CoffeeHandler._brew_in_background, coffee_service, program_key, fill_ml, display_name)
+                router._send_json({"status": "queued", "message": f"{display_name} was queued"}, status_code=202)
+                return
+            
             result = coffee_service.brew_program(program_key, fill_ml=fill_ml, program_name=display_name)
+            invalidate_status_cache()
             router._send_json(result, status_code=200)
         except ValueError as e:
             router._send_error(400, str(e))
         except Exception as e:
             CoffeeHandler._handle_error(router, e, "Error starting program")
 
+    @staticmethod
+    def _brew_in_background(
+        coffee_service: CoffeeService, program_key: str, fill_ml: int | None, display_name: str
+    ) -> None:
+        """Runs a queued brew request; there is no client left to report errors to."""
+        try:
+            coffee_service.brew_program(program_key, fill_ml=fill_ml, program_name=display_name)
+        except Exception as e:
+            logger.error(f"Queued brew of {display_name} failed: {e}")
+        finally:
+            invalidate_status_cache()
+
     @staticmethod
     def _handle_error(router: "BaseHandler", exception: Exception, default_message: str) -> None:
         """Handles an error and sends appropriate response.
@@ -113,6 +155,7 @@ class CoffeeHandler:
             exception: The exception that occurred
             default_message: Default error message
         """
+        reset_client_on_auth_error(exception)
         if router.error_handler:
             code, response = router.error_handler.handle_error(exception, default_message=default_message)
             router._send_error_response(code, response)
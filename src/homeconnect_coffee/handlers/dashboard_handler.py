@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-import json
-import time
-from datetime import datetime
+import gzip
+import os
+import shutil
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO
 
 from .. import __version__, get_version_type, is_release_version
 from ..errors import ErrorCode
 from ..services import EventStreamManager
+from .base_handler import _dumps
 
 if TYPE_CHECKING:
     from .base_handler import BaseHandler
@@ -18,6 +19,70 @@ if TYPE_CHECKING:
 # Set by server.py
 event_stream_manager: EventStreamManager | None = None
 
+# /health always returns the same body, so it is encoded only once
+_HEALTH_BODY = b'{"status":"ok"}'
+
+# Files served by the public endpoints, relative to the repository root
+_REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+_DASHBOARD_PATH = _REPO_ROOT / "scripts" / "dashboard.html"
+_CERT_PATH = _REPO_ROOT / "certs" / "server.crt"
+
+# Rendered dashboard as (file mtime, HTML, gzipped HTML); rebuilt when the file changes
+_dashboard_cache: tuple[int, bytes, bytes] | None = None
+
+
+def _load_dashboard() -> tuple[bytes, bytes]:
+    """Returns the dashboard HTML with the version filled in, plain and gzipped.
+    
+    The file is only read, rendered and compressed again if it was modified.
+    
+    Returns:
+        Tuple of (HTML bytes, gzip-compressed HTML bytes)
+        
+    Raises:
+        FileNotFoundError: If the dashboard file does not exist
+    """
+    global _dashboard_cache
+    mtime = _DASHBOARD_PATH.stat().st_mtime_ns
+    cached = _dashboard_cache
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+
+    dashboard_html = _DASHBOARD_PATH.read_text(encoding="utf-8")
+    
+    # Embed version in HTML
+    version_type = get_version_type()
+    if is_release_version():
+        version_display = f"v{__version__}"
+    else:
+        version_type_upper = version_type.upper()
+        version_display = f"v{__version__} ({version_type_upper})"
+    
+    # Replace version placeholder in HTML
+    html = dashboard_html.replace("{{VERSION}}", version_display).encode("utf-8")
+    html_gzip = gzip.compress(html, compresslevel=6)
+    _dashboard_cache = (mtime, html, html_gzip)
+    return html, html_gzip
+
+
+def _send_file(router: "BaseHandler", file: BinaryIO) -> None:
+    """Copies an open file to the client after the headers.
+    
+    Uses socket.sendfile() so plain sockets get a zero-copy os.sendfile();
+    it falls back to send() by itself where that is not possible (e.g. TLS).
+    
+    Args:
+        router: The router (BaseHandler instance) with request context
+        file: File opened in binary mode
+    """
+    router.wfile.flush()
+    try:
+        sendfile = router.connection.sendfile
+    except AttributeError:
+        shutil.copyfileobj(file, router.wfile)
+        return
+    sendfile(file)
+
 
 class DashboardHandler:
     """Handler for dashboard and public endpoints: /dashboard, /cert, /health, /events.
@@ -32,10 +97,9 @@ class DashboardHandler:
         Args:
             router: The router (BaseHandler instance) with request context
         """
-        # Dashboard path relative to scripts/
-        dashboard_path = Path(__file__).parent.parent.parent.parent / "scripts" / "dashboard.html"
-
-        if not dashboard_path.exists():
+        try:
+            html, html_gzip = _load_dashboard()
+        except FileNotFoundError:
             if router.error_handler:
                 response = router.error_handler.create_error_response(
                     ErrorCode.NOT_FOUND,
@@ -46,32 +110,21 @@ class DashboardHandler:
             else:
                 router._send_error(404, "Dashboard not found")
             return
-
-        try:
-            dashboard_html = dashboard_path.read_text(encoding="utf-8")
-            
-            # Embed version in HTML
-            version_type = get_version_type()
-            if is_release_version():
-                version_display = f"v{__version__}"
-            else:
-                version_type_upper = version_type.upper()
-                version_display = f"v{__version__} ({version_type_upper})"
-            
-            # Replace version placeholder in HTML
-            dashboard_html = dashboard_html.replace("{{VERSION}}", version_display)
-            
-            router.send_response(200)
-            router.send_header("Content-Type", "text/html; charset=utf-8")
-            router.send_header("Access-Control-Allow-Origin", "*")
-            router.end_headers()
-            router.wfile.write(dashboard_html.encode("utf-8"))
         except Exception as e:
             if router.error_handler:
                 code, response = router.error_handler.handle_error(e, default_message="Error reading dashboard")
                 router._send_error_response(code, response)
             else:
                 router._send_error(500, f"Error reading dashboard: {str(e)}")
+            return
+
+        if "gzip" in router.headers.get("Accept-Encoding", ""):
+            router._send_raw(
+                200, html_gzip, content_type="text/html; charset=utf-8",
+                headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+            )
+        else:
+            router._send_raw(200, html, content_type="text/html; charset=utf-8", headers={"Vary": "Accept-Encoding"})
 
     @staticmethod
     def handle_cert_download(router: "BaseHandler") -> None:
@@ -80,9 +133,9 @@ class DashboardHandler:
         Args:
             router: The router (BaseHandler instance) with request context
         """
-        cert_path = Path(__file__).parent.parent.parent.parent / "certs" / "server.crt"
-
-        if not cert_path.exists():
+        try:
+            cert_file = _CERT_PATH.open("rb")
+        except FileNotFoundError:
             if router.error_handler:
                 response = router.error_handler.create_error_response(
                     ErrorCode.NOT_FOUND,
@@ -93,22 +146,24 @@ class DashboardHandler:
             else:
                 router._send_error(404, "Certificate not found. Please run 'make cert' first.")
             return
+        except OSError as e:
+            if router.error_handler:
+                code, response = router.error_handler.handle_error(e, default_message="Error reading certificate")
+                router._send_error_response(code, response)
+            else:
+                router._send_error(500, f"Error reading certificate: {str(e)}")
+            return
 
-        try:
-            cert_data = cert_path.read_bytes()
+        # Stream the file instead of reading it into memory first
+        with cert_file:
+            size = os.fstat(cert_file.fileno()).st_size
             router.send_response(200)
             router.send_header("Content-Type", "application/x-x509-ca-cert")
             router.send_header("Content-Disposition", 'attachment; filename="HomeConnectCoffee.crt"')
-            router.send_header("Content-Length", str(len(cert_data)))
+            router.send_header("Content-Length", str(size))
             router.send_header("Access-Control-Allow-Origin", "*")
             router.end_headers()
-            router.wfile.write(cert_data)
-        except Exception as e:
-            if router.error_handler:
-                code, response = router.error_handler.handle_error(e, default_message="Error reading certificate")
-                router._send_error_response(code, response)
-            else:
-                router._send_error(500, f"Error reading certificate: {str(e)}")
+            _send_file(router, cert_file)
 
     @staticmethod
     def handle_health(router: "BaseHandler") -> None:
@@ -117,7 +172,7 @@ class DashboardHandler:
         Args:
             router: The router (BaseHandler instance) with request context
         """
-        router._send_json({"status": "ok"}, status_code=200)
+        router._send_raw(200, _HEALTH_BODY)
 
     @staticmethod
     def handle_events_stream(router: "BaseHandler") -> None:
@@ -143,25 +198,25 @@ class DashboardHandler:
                 router._send_error(500, "Event stream manager not initialized")
             return
 
-        # Send SSE headers
+        # Send SSE headers (the stream has no length and ends when the
+        # connection closes, so it is never reused for another request)
+        router.close_connection = True
         router.send_response(200)
         router.send_header("Content-Type", "text/event-stream")
         router.send_header("Cache-Control", "no-cache")
-        router.send_header("Connection", "keep-alive")
         router.send_header("Access-Control-Allow-Origin", "*")
+        router.send_header("Connection", "close")
         router.end_headers()
 
-        # Add client to manager
-        event_stream_manager.add_client(router)
+        # Add client to manager (its keep-alive thread pings all clients)
+        closed = event_stream_manager.add_client(router)
 
         try:
             # Send initial event
             DashboardHandler._send_sse_event(router, "connected", {"message": "Connected"})
 
-            # Keep connection open and send keep-alive
-            while True:
-                time.sleep(30)
-                DashboardHandler._send_sse_event(router, "ping", {"timestamp": datetime.now().isoformat()})
+            # Keep connection open until the manager drops the client
+            closed.wait()
         except (BrokenPipeError, ConnectionResetError, OSError):
             # Client closed connection
             pass
@@ -180,13 +235,34 @@ class DashboardHandler:
             event_type: Event type
             data: Event data
         """
+        DashboardHandler._send_sse_frame(router, DashboardHandler._encode_sse_event(event_type, data))
+
+    @staticmethod
+    def _encode_sse_event(event_type: str, data: dict) -> bytes:
+        """Encodes an SSE event as one wire frame.
+        
+        Args:
+            event_type: Event type
+            data: Event data
+            
+        Returns:
+            The frame as bytes, ready to be written to any number of clients
+        """
+        return b"event: " + event_type.encode("utf-8") + b"\ndata: " + _dumps(data) + b"\n\n"
+
+    @staticmethod
+    def _send_sse_frame(router: "BaseHandler", frame: bytes) -> None:
+        """Writes an already encoded SSE frame and flushes it.
+        
+        Args:
+            router: The router (BaseHandler instance) with request context
+            frame: Frame from _encode_sse_event()
+        """
         try:
-            event_str = f"event: {event_type}\n"
-            event_str += f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
             # Use a lock if available, otherwise just write (wfile should be thread-safe)
             # Note: wfile from BaseHTTPRequestHandler should handle concurrent writes
             # but we add explicit flush to ensure data is sent immediately
-            router.wfile.write(event_str.encode("utf-8"))
+            router.wfile.write(frame)
             router.wfile.flush()
         except (BrokenPipeError, ConnectionResetError, OSError):
             # Client closed connection
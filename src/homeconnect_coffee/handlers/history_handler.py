@@ -68,8 +68,12 @@ class HistoryHandler:
                 router._send_json({"program_counts": counts}, status_code=200)
             else:
                 # Standard history
-                history = history_service.get_history(event_type, limit_int, before_timestamp)
-                router._send_json({"history": history}, status_code=200)
+                if router._pretty_requested():
+                    history = history_service.get_history(event_type, limit_int, before_timestamp)
+                    router._send_json({"history": history}, status_code=200)
+                else:
+                    # Stored event data is passed through without decoding it
+                    router._send_raw(200, history_service.get_history_json(event_type, limit_int, before_timestamp))
         except ValueError as e:
             if router.error_handler:
                 code, response = router.error_handler.handle_error(e, default_message="Invalid parameter")
@@ -97,7 +101,6 @@ class HistoryHandler:
             if history_manager is None:
                 # Fallback: create default HistoryManager
                 history_path = Path(__file__).parent.parent.parent.parent / "history.db"
-                from ..history import HistoryManager
                 history_manager = HistoryManager(history_path)
             
             # Get monitor with history_manager
@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 import json
-from http.server import BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlparse
 
 from .base_handler import BaseHandler
 from .coffee_handler import CoffeeHandler
@@ -12,6 +10,9 @@ from .dashboard_handler import DashboardHandler
 from .history_handler import HistoryHandler
 from .status_handler import StatusHandler
 
+# Largest accepted request body; the only body used is the small /brew JSON
+MAX_BODY_SIZE = 64 * 1024
+
 
 class RequestRouter(BaseHandler):
     """Router that forwards requests to specialized handlers."""
@@ -19,45 +20,8 @@ class RequestRouter(BaseHandler):
     enable_logging = True
     api_token: str | None = None
     error_handler = None
-
-    def handle_one_request(self):
-        """Overrides handle_one_request to catch BrokenPipeError."""
-        try:
-            super().handle_one_request()
-        except (BrokenPipeError, ConnectionResetError, OSError):
-            # Client closed connection - normal, don't log
-            pass
-
-    def log_request(self, code="-", size="-"):
-        """Logs requests when logging is enabled."""
-        if self.enable_logging:
-            client_ip = self.client_address[0]
-            method = self.command
-            path = self._mask_token_in_path(self.path)
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.info(f"{client_ip} - {method} {path} - {code}")
-    
-    def _mask_token_in_path(self, path: str) -> str:
-        """Masks token parameters in the path for logging."""
-        if "token=" not in path:
-            return path
-        
-        parsed = urlparse(path)
-        query_params = parse_qs(parsed.query)
-        
-        if "token" in query_params:
-            # Mask token
-            query_params["token"] = ["__MASKED__"]
-            from urllib.parse import urlencode
-            new_query = urlencode(query_params, doseq=True)
-            return f"{parsed.path}?{new_query}"
-        
-        return path
-
-    def log_message(self, format, *args):
-        """Suppresses standard logging messages."""
-        pass
+    # Request body of the current POST request, once read
+    _body: bytes | None = None
 
     def do_GET(self):
         """Forwards GET requests to specialized handlers."""
@@ -65,8 +29,40 @@ class RequestRouter(BaseHandler):
 
     def do_POST(self):
         """Forwards POST requests to specialized handlers."""
+        self._body = None
+        # Read the body before routing, also if the endpoint ignores it, so it is
+        # not parsed as the next request on a kept-alive connection
+        try:
+            self._read_body()
+        except ValueError:
+            self.close_connection = True
+            self._send_error(400, "Invalid Content-Length")
+            return
+        except OverflowError:
+            self.close_connection = True
+            self._send_error(413, f"Request body larger than {MAX_BODY_SIZE} bytes")
+            return
+        except TimeoutError:
+            self.close_connection = True
+            self._send_error(408, "Timeout reading request body")
+            return
         self._route_request()
 
+    def _read_body(self) -> bytes:
+        """Reads the request body (once) as announced by Content-Length.
+        
+        Raises:
+            ValueError: If Content-Length is not a number
+            OverflowError: If Content-Length exceeds MAX_BODY_SIZE
+            TimeoutError: If the client does not send the body within the timeout
+        """
+        if self._body is None:
+            content_length = int(self.headers.get("Content-Length") or 0)
+            if content_length > MAX_BODY_SIZE:
+                raise OverflowError(content_length)
+            self._body = self.rfile.read(content_length) if content_length > 0 else b""
+        return self._body
+
     def _route_request(self) -> None:
         """Forwards requests to the appropriate handler.
         
@@ -78,67 +74,101 @@ class RequestRouter(BaseHandler):
         
         Handler methods are static and take the router (self) as a parameter.
         """
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        query_params = parse_qs(parsed_path.query)
-
-        # Public endpoints (no authentication)
-        if path == "/dashboard":
-            DashboardHandler.handle_dashboard(self)
+        # Split off the query without building a full urlparse() result; the
+        # query is only parsed (once, see _query_params()) where it is used
+        path = self.path.partition("?")[0]
+
+        route = self._ROUTES.get(path)
+        if route is None:
+            # 404 Not Found
+            self._send_not_found()
             return
-        elif path == "/cert":
-            DashboardHandler.handle_cert_download(self)
-            return
-        elif path == "/health":
-            DashboardHandler.handle_health(self)
-            return
-        elif path == "/events":
-            DashboardHandler.handle_events_stream(self)
-            return
-
-        # History endpoints (public, read-only)
-        if path == "/api/history":
-            HistoryHandler.handle_history(self, query_params)
-            return
-        elif path == "/api/stats":
-            HistoryHandler.handle_api_stats(self)
-            return
-
-        # Coffee endpoints (require authentication)
-        if path == "/wake":
-            CoffeeHandler.handle_wake(self, self.auth_middleware)
-            return
-        elif path == "/brew":
-            if self.command == "GET":
-                # Brew as GET with query parameters
-                program_param = query_params.get("program", [None])[0]
-                fill_ml_param = query_params.get("fill_ml", [None])[0]
-                fill_ml = int(fill_ml_param) if fill_ml_param and fill_ml_param.isdigit() else None
-                # Default fill_ml to 50 for backward compatibility if no program specified
-                if program_param is None and fill_ml is None:
-                    fill_ml = 50
-                CoffeeHandler.handle_brew(self, fill_ml=fill_ml, program=program_param, auth_middleware=self.auth_middleware)
-            elif self.command == "POST":
-                # Brew as POST with JSON body
-                content_length = int(self.headers.get("Content-Length", 0))
-                body = self.rfile.read(content_length).decode("utf-8")
-                data = json.loads(body) if body else {}
-                program = data.get("program")
-                fill_ml = data.get("fill_ml")
-                # Default fill_ml to 50 for backward compatibility if no program specified
-                if program is None and fill_ml is None:
-                    fill_ml = 50
-                CoffeeHandler.handle_brew(self, fill_ml=fill_ml, program=program, auth_middleware=self.auth_middleware)
-            return
-
-        # Status endpoints (require authentication)
-        if path == "/status":
-            StatusHandler.handle_status(self, self.auth_middleware)
-            return
-        elif path == "/api/status":
-            StatusHandler.handle_extended_status(self, self.auth_middleware)
-            return
-
-        # 404 Not Found
-        self._send_not_found()
-
+        route(self)
+
+    # Public endpoints (no authentication)
+
+    def _route_dashboard(self) -> None:
+        """Handles /dashboard."""
+        DashboardHandler.handle_dashboard(self)
+
+    def _route_cert(self) -> None:
+        """Handles /cert."""
+        DashboardHandler.handle_cert_download(self)
+
+    def _route_health(self) -> None:
+        """Handles /health."""
+        DashboardHandler.handle_health(self)
+
+    def _route_events(self) -> None:
+        """Handles /events."""
+        DashboardHandler.handle_events_stream(self)
+
+    # History endpoints (public, read-only)
+
+    def _route_history(self) -> None:
+        """Handles /api/history."""
+        HistoryHandler.handle_history(self, self._query_params())
+
+    def _route_api_stats(self) -> None:
+        """Handles /api/stats."""
+        HistoryHandler.handle_api_stats(self)
+
+    # Coffee endpoints (require authentication)
+
+    def _route_wake(self) -> None:
+        """Handles /wake."""
+        CoffeeHandler.handle_wake(self, self.auth_middleware)
+
+    def _route_brew(self) -> None:
+        """Handles /brew (GET with query parameters or POST with JSON body)."""
+        if self.command == "GET":
+            # Brew as GET with query parameters
+            query_params = self._query_params()
+            program_param = query_params.get("program", [None])[0]
+            fill_ml_param = query_params.get("fill_ml", [None])[0]
+            fill_ml = int(fill_ml_param) if fill_ml_param and fill_ml_param.isdigit() else None
+            # Default fill_ml to 50 for backward compatibility if no program specified
+            if program_param is None and fill_ml is None:
+                fill_ml = 50
+            run_async = query_params.get("async", ["0"])[0].lower() in ("1", "true")
+            CoffeeHandler.handle_brew(
+                self, fill_ml=fill_ml, program=program_param, auth_middleware=self.auth_middleware, run_async=run_async
+            )
+        elif self.command == "POST":
+            # Brew as POST with JSON body
+            body = self._read_body()
+            # json.loads accepts the raw UTF-8 bytes, no need to decode first
+            data = json.loads(body) if body else {}
+            program = data.get("program")
+            fill_ml = data.get("fill_ml")
+            # Default fill_ml to 50 for backward compatibility if no program specified
+            if program is None and fill_ml is None:
+                fill_ml = 50
+            CoffeeHandler.handle_brew(
+                self, fill_ml=fill_ml, program=program, auth_middleware=self.auth_middleware,
+                run_async=data.get("async") is True,
+            )
+
+    # Status endpoints (require authentication)
+
+    def _route_status(self) -> None:
+        """Handles /status."""
+        StatusHandler.handle_status(self, self.auth_middleware)
+
+    def _route_extended_status(self) -> None:
+        """Handles /api/status."""
+        StatusHandler.handle_extended_status(self, self.auth_middleware)
+
+    # Path -> route method, built once so dispatch is a single dict lookup
+    _ROUTES = {
+        "/dashboard": _route_dashboard,
+        "/cert": _route_cert,
+        "/health": _route_health,
+        "/events": _route_events,
+        "/api/history": _route_history,
+        "/api/stats": _route_api_stats,
+        "/wake": _route_wake,
+        "/brew": _route_brew,
+        "/status": _route_status,
+        "/api/status": _route_extended_status,
+    }
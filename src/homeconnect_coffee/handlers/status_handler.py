@@ -4,14 +4,33 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from ..client import HomeConnectClient
-from ..config import load_config
 from ..services import StatusService
+from .base_handler import get_client, reset_client_on_auth_error
 
 if TYPE_CHECKING:
     from .base_handler import BaseHandler
     from ..middleware.auth_middleware import AuthMiddleware
 
+# StatusService shared by all requests, so its response caches work across requests
+_status_service: StatusService | None = None
+
+
+def _get_status_service() -> StatusService:
+    """Returns the shared StatusService for the current shared client."""
+    global _status_service
+    client = get_client()
+    service = _status_service
+    if service is None or service.client is not client:
+        service = _status_service = StatusService(client)
+    return service
+
+
+def invalidate_status_cache() -> None:
+    """Drops cached status responses after the device state was changed."""
+    service = _status_service
+    if service is not None:
+        service.invalidate_cache()
+
 
 class StatusHandler:
     """Handler for status endpoints: /status and /api/status.
@@ -36,9 +55,7 @@ class StatusHandler:
             return
 
         try:
-            config = load_config()
-            client = HomeConnectClient(config)
-            status_service = StatusService(client)
+            status_service = _get_status_service()
             status = status_service.get_status()
             router._send_json(status, status_code=200)
         except Exception as e:
@@ -61,9 +78,7 @@ class StatusHandler:
             return
 
         try:
-            config = load_config()
-            client = HomeConnectClient(config)
-            status_service = StatusService(client)
+            status_service = _get_status_service()
             extended_status = status_service.get_extended_status()
             router._send_json(extended_status, status_code=200)
         except Exception as e:
@@ -78,6 +93,7 @@ class StatusHandler:
             exception: The exception that occurred
             default_message: Default error message
         """
+        reset_client_on_auth_error(exception)
         if router.error_handler:
             code, response = router.error_handler.handle_error(exception, default_message=default_message)
             router._send_error_response(code, response)
@@ -5,7 +5,23 @@ import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not available, use stdlib json
+
+# Codec for stored event data (orjson is considerably faster if installed).
+# Both decoders raise a ValueError subclass on malformed input.
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(data: Any) -> str:
+    """Serializes event data to the JSON text stored in the data column."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False)
 
 
 class HistoryManager:
@@ -22,17 +38,64 @@ class HistoryManager:
         # Convert to absolute path to avoid issues with working directory changes
         self.db_path = self.db_path.resolve()
         
-        self._lock = Lock()  # Lock for thread-safe access
+        self._lock = Lock()  # Serializes writes on the shared write connection
+        self._write_conn: Optional[sqlite3.Connection] = None
         self._ensure_database()
 
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """Opens a connection to the history database.
+        
+        Args:
+            read_only: Open the database in read-only mode (used by queries).
+                       Read-only connections never take a write lock and
+                       cannot modify the database by accident.
+        
+        Returns:
+            SQLite connection (caller must close it)
+        """
+        if read_only:
+            return sqlite3.connect(f"{self.db_path.as_uri()}?mode=ro", uri=True)
+        conn = sqlite3.connect(str(self.db_path))
+        # WAL (set in _ensure_database) only needs an fsync at checkpoints with
+        # synchronous=NORMAL, instead of one per commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _writer(self) -> sqlite3.Connection:
+        """Returns the shared write connection, opening it on first use.
+        
+        Writes happen on every API call and history event, so the connection
+        is kept open instead of paying connect/PRAGMA costs each time.
+        Must be called with self._lock held.
+        
+        The connection runs in autocommit mode (isolation_level=None): single
+        statements commit on their own, multi-row writes open an explicit
+        transaction.
+        """
+        if self._write_conn is None:
+            conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._write_conn = conn
+        return self._write_conn
+
+    def close(self) -> None:
+        """Closes the shared write connection (reopened on the next write)."""
+        with self._lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
+
     def _ensure_database(self) -> None:
         """Ensures that the SQLite database exists and the schema is created."""
         with self._lock:
             if not self.db_path.exists():
                 self.db_path.parent.mkdir(parents=True, exist_ok=True)
                 
-            conn = sqlite3.connect(str(self.db_path))
+            conn = self._connect()
             try:
+                # Write-ahead logging: readers (dashboard queries) no longer block
+                # the history writer and vice versa. The mode is persistent.
+                conn.execute("PRAGMA journal_mode=WAL")
                 cursor = conn.cursor()
                 # Create events table
                 cursor.execute("""
@@ -47,9 +110,13 @@ class HistoryManager:
                 cursor.execute("""
                     CREATE INDEX IF NOT EXISTS idx_timestamp ON events(timestamp)
                 """)
+                # Composite index serves "WHERE type = ? [AND timestamp >= ?] ORDER BY
+                # timestamp" (filtered history, daily usage) without a sort step.
+                # It also covers lookups by type alone, so idx_type is redundant.
                 cursor.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_type ON events(type)
+                    CREATE INDEX IF NOT EXISTS idx_type_timestamp ON events(type, timestamp)
                 """)
+                cursor.execute("DROP INDEX IF EXISTS idx_type")
                 # Create api_statistics table
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS api_statistics (
@@ -71,33 +138,81 @@ class HistoryManager:
         self,
         event_type: str,
         data: Dict[str, Any],
-        timestamp: Optional[datetime] = None,
+        timestamp: Optional[datetime | str] = None,
     ) -> None:
-        """Adds an event to the history."""
+        """Adds an event to the history.
+        
+        The timestamp may be passed as an already formatted ISO 8601 string,
+        which is stored unchanged.
+        """
         try:
             if timestamp is None:
                 timestamp = datetime.now(timezone.utc)
             
-            timestamp_str = timestamp.isoformat()
-            data_json = json.dumps(data, ensure_ascii=False)
+            timestamp_str = timestamp if isinstance(timestamp, str) else timestamp.isoformat()
+            data_json = _dumps(data)
             
             with self._lock:
-                conn = sqlite3.connect(str(self.db_path))
-                try:
-                    cursor = conn.cursor()
-                    cursor.execute(
+                conn = self._writer()
+                with conn:  # Commits, or rolls back on error
+                    conn.execute(
                         "INSERT INTO events (timestamp, type, data) VALUES (?, ?, ?)",
                         (timestamp_str, event_type, data_json)
                     )
-                    conn.commit()
-                finally:
-                    conn.close()
         except Exception as e:
             # Don't propagate save errors, but log them with more context
             import traceback
             print(f"WARNING: Error saving event '{event_type}' to history at {self.db_path}: {e}")
             print(f"  Traceback: {traceback.format_exc()}")
 
+    def add_events(self, events: Iterable[Dict[str, Any]]) -> int:
+        """Adds several events to the history in a single transaction.
+
+        Args:
+            events: Events in the same shape as returned by get_history()
+                    ({"type": ..., "data": ..., "timestamp": ...}). The timestamp
+                    may be a datetime, an ISO 8601 string or missing (now).
+                    Entries without a type are skipped.
+
+        Returns:
+            Number of events written
+        """
+        try:
+            now_str = datetime.now(timezone.utc).isoformat()
+            rows = []
+            for event in events:
+                event_type = event.get("type")
+                if not event_type:
+                    continue  # Skip malformed entries instead of failing the whole batch
+                timestamp = event.get("timestamp")
+                if isinstance(timestamp, datetime):
+                    timestamp = timestamp.isoformat()
+                rows.append((
+                    timestamp or now_str,
+                    event_type,
+                    _dumps(event.get("data", {})),
+                ))
+            
+            if not rows:
+                return 0
+            
+            with self._lock:
+                conn = self._writer()
+                with conn:  # Commits, or rolls back on error
+                    # Take the write lock up front instead of on the first INSERT
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.executemany(
+                        "INSERT INTO events (timestamp, type, data) VALUES (?, ?, ?)",
+                        rows,
+                    )
+            return len(rows)
+        except Exception as e:
+            # Don't propagate save errors, but log them with more context
+            import traceback
+            print(f"WARNING: Error saving events to history at {self.db_path}: {e}")
+            print(f"  Traceback: {traceback.format_exc()}")
+            return 0
+
     def get_history(
         self, 
         event_type: Optional[str] = None, 
@@ -115,67 +230,122 @@ class HistoryManager:
         Returns:
             List of events, chronologically sorted (oldest first)
         """
-        with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
-                cursor = conn.cursor()
-                
-                query = "SELECT timestamp, type, data FROM events"
-                params = []
-                conditions = []
-                
-                if event_type:
-                    conditions.append("type = ?")
-                    params.append(event_type)
-                
-                if before_timestamp:
-                    conditions.append("timestamp < ?")
-                    params.append(before_timestamp)
-                
-                if conditions:
-                    query += " WHERE " + " AND ".join(conditions)
-                
-                # Cursor-based pagination: events before before_timestamp, sorted descending
-                # Then reverse for chronological order (oldest first)
-                if before_timestamp:
-                    query += " ORDER BY timestamp DESC"
-                    if limit:
-                        query += " LIMIT ?"
-                        params.append(limit)
-                    cursor.execute(query, params)
-                    rows = cursor.fetchall()
-                    # Reverse order for chronological order (oldest first)
-                    rows = list(reversed(rows))
-                elif limit:
-                    # Without before_timestamp: newest events first, then reverse
-                    query += " ORDER BY timestamp DESC LIMIT ?"
-                    params.append(limit)
-                    cursor.execute(query, params)
-                    rows = cursor.fetchall()
-                    # Reverse order for chronological order (oldest first)
-                    rows = list(reversed(rows))
-                else:
-                    # All events chronologically
-                    query += " ORDER BY timestamp ASC"
-                    cursor.execute(query, params)
-                    rows = cursor.fetchall()
-                
-                events = []
-                for row in rows:
-                    timestamp, event_type, data_json = row
-                    try:
-                        data = json.loads(data_json)
-                        events.append({
-                            "timestamp": timestamp,
-                            "type": event_type,
-                            "data": data,
-                        })
-                    except json.JSONDecodeError:
-                        continue
+        conn = self._connect(read_only=True)
+        try:
+            rows = self._history_rows(conn, "timestamp, type, data", event_type, limit, before_timestamp)
+            events = []
+            for timestamp, event_type, data_json in rows:
+                try:
+                    data = _loads(data_json)
+                except ValueError:
+                    continue
+                events.append({
+                    "timestamp": timestamp,
+                    "type": event_type,
+                    "data": data,
+                })
                 
-                return events
-            finally:
-                conn.close()
+            return events
+        finally:
+            conn.close()
+
+    def get_history_json(
+        self,
+        event_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        before_timestamp: Optional[str] = None
+    ) -> bytes:
+        """Returns the history as a serialized JSON response body.
+        
+        Same events as get_history(), wrapped as {"history": [...]}. SQLite builds
+        each event object and the stored data is spliced in as-is, so the data is
+        never decoded and re-encoded in Python.
+        
+        Args:
+            event_type: Optional filter for event type
+            limit: Maximum number of events (if set, returns the last N events)
+            before_timestamp: ISO 8601 timestamp - only returns events before this time
+        
+        Returns:
+            UTF-8 encoded JSON
+        """
+        conn = self._connect(read_only=True)
+        try:
+            rows = self._history_rows(
+                conn,
+                "json_object('timestamp', timestamp, 'type', type, 'data', json(data))",
+                event_type,
+                limit,
+                before_timestamp,
+                valid_only=True,
+            )
+            return ('{"history":[' + ",".join(row[0] for row in rows) + "]}").encode("utf-8")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _history_rows(
+        conn: sqlite3.Connection,
+        columns: str,
+        event_type: Optional[str],
+        limit: Optional[int],
+        before_timestamp: Optional[str],
+        valid_only: bool = False,
+    ) -> Iterable[tuple]:
+        """Queries events for get_history()/get_history_json() in chronological order.
+        
+        Args:
+            conn: Open database connection
+            columns: Result columns of the SELECT
+            event_type: Optional filter for event type
+            limit: Maximum number of events (if set, the last N events)
+            before_timestamp: Only events before this time
+            valid_only: Skip events whose data is not valid JSON
+        
+        Returns:
+            Rows, oldest first
+        """
+        cursor = conn.cursor()
+        
+        query = f"SELECT {columns} FROM events"
+        params: List[Any] = []
+        conditions = []
+        
+        if event_type:
+            conditions.append("type = ?")
+            params.append(event_type)
+        
+        if before_timestamp:
+            conditions.append("timestamp < ?")
+            params.append(before_timestamp)
+        
+        if valid_only:
+            conditions.append("json_valid(data)")
+        
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        
+        # Cursor-based pagination: events before before_timestamp, sorted descending
+        # Then reverse for chronological order (oldest first)
+        if before_timestamp:
+            query += " ORDER BY timestamp DESC"
+            if limit:
+                query += " LIMIT ?"
+                params.append(limit)
+            cursor.execute(query, params)
+            # Reverse order for chronological order (oldest first)
+            return reversed(cursor.fetchall())
+        if limit:
+            # Without before_timestamp: newest events first, then reverse
+            query += " ORDER BY timestamp DESC LIMIT ?"
+            params.append(limit)
+            cursor.execute(query, params)
+            # Reverse order for chronological order (oldest first)
+            return reversed(cursor.fetchall())
+        # All events chronologically
+        # Iterate the cursor directly instead of materializing all rows first
+        query += " ORDER BY timestamp ASC"
+        return cursor.execute(query, params)
 
     def get_program_history(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Returns the program history."""
@@ -187,65 +357,69 @@ class HistoryManager:
 
     def get_daily_usage(self, days: int = 7) -> Dict[str, int]:
         """Returns the daily usage of the last N days (only brew programs, excluding cleaning programs)."""
-        with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
-                cursor = conn.cursor()
+        conn = self._connect(read_only=True)
+        try:
+            cursor = conn.cursor()
                 
-                # Calculate cutoff date
-                cutoff_date = datetime.now(timezone.utc).replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                ) - timedelta(days=days)
-                cutoff_str = cutoff_date.isoformat()
+            # Calculate cutoff date
+            cutoff_date = datetime.now(timezone.utc).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            ) - timedelta(days=days)
+            cutoff_str = cutoff_date.isoformat()
                 
-                # Query for program_started events with date filtering
-                query = """
-                    SELECT timestamp, data
-                    FROM events
-                    WHERE type = 'program_started'
-                    AND timestamp >= ?
-                    ORDER BY timestamp ASC
-                """
-                cursor.execute(query, (cutoff_str,))
-                rows = cursor.fetchall()
+            # Query for program_started events with date filtering
+            query = """
+                SELECT timestamp, json_extract(data, '$.program')
+                FROM events
+                WHERE type = 'program_started'
+                AND timestamp >= ?
+                AND json_valid(data)
+                AND json_type(data, '$.program') IS NOT 'null'
+                ORDER BY timestamp ASC
+            """
+            cursor.execute(query, (cutoff_str,))
+            rows = cursor.fetchall()
                 
-                daily_counts: Dict[str, int] = {}
+            daily_counts: Dict[str, int] = {}
                 
-                # Create list of last 'days' days
-                today = datetime.now(timezone.utc).replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
-                date_keys_in_range = [
-                    (today - timedelta(days=i)).strftime("%Y-%m-%d")
-                    for i in range(days - 1, -1, -1)
-                ]
+            # Create list of last 'days' days
+            today = datetime.now(timezone.utc).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            date_keys_in_range = [
+                (today - timedelta(days=i)).strftime("%Y-%m-%d")
+                for i in range(days - 1, -1, -1)
+            ]
+            date_keys_set = set(date_keys_in_range)
                 
-                for row in rows:
-                    timestamp_str, data_json = row
-                    try:
-                        data = json.loads(data_json)
-                        program_key = data.get("program", "Unknown")
-                        
-                        # Only count brew programs
-                        if not self._is_brew_program(program_key):
-                            continue
-                        
-                        event_time = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                        date_key = event_time.strftime("%Y-%m-%d")
+            # The program key is extracted by SQLite (JSON1), so the stored
+            # event data does not need to be decoded in Python. None means the
+            # key is missing (explicit nulls are filtered out above).
+            for timestamp_str, program_key in rows:
+                try:
+                    if program_key is None:
+                        program_key = "Unknown"
                         
-                        if date_key in date_keys_in_range:
-                            daily_counts[date_key] = daily_counts.get(date_key, 0) + 1
-                    except (KeyError, ValueError, json.JSONDecodeError):
+                    # Only count brew programs
+                    if not self._is_brew_program(program_key):
                         continue
+                        
+                    # Timestamps are stored in ISO 8601, so the calendar date is
+                    # the first ten characters - no need to build a datetime
+                    date_key = timestamp_str[:10]
+                    if date_key in date_keys_set:
+                        daily_counts[date_key] = daily_counts.get(date_key, 0) + 1
+                except (TypeError, ValueError):
+                    continue
                 
-                # Fill missing days with 0
-                full_daily_counts = {
-                    date_key: daily_counts.get(date_key, 0) for date_key in date_keys_in_range
-                }
+            # Fill missing days with 0
+            full_daily_counts = {
+                date_key: daily_counts.get(date_key, 0) for date_key in date_keys_in_range
+            }
                 
-                return full_daily_counts
-            finally:
-                conn.close()
+            return full_daily_counts
+        finally:
+            conn.close()
 
     @staticmethod
     def _is_brew_program(program_key: str) -> bool:
@@ -281,36 +455,33 @@ class HistoryManager:
 
     def get_program_counts(self) -> Dict[str, int]:
         """Returns the usage count per program (only brew programs, excluding cleaning programs)."""
-        with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
-                cursor = conn.cursor()
+        conn = self._connect(read_only=True)
+        try:
+            cursor = conn.cursor()
                 
-                query = """
-                    SELECT data
-                    FROM events
-                    WHERE type = 'program_started'
-                """
-                cursor.execute(query)
-                rows = cursor.fetchall()
+            # Extraction and counting happen in SQLite (JSON1), so only one
+            # row per distinct program reaches Python. A missing program is
+            # counted as "Unknown", an explicit null is not a brew program.
+            query = """
+                SELECT COALESCE(json_extract(data, '$.program'), 'Unknown'), COUNT(*)
+                FROM events
+                WHERE type = 'program_started'
+                AND json_valid(data)
+                AND json_type(data, '$.program') IS NOT 'null'
+                GROUP BY 1
+            """
+            cursor.execute(query)
                 
-                counts: Dict[str, int] = {}
+            counts: Dict[str, int] = {}
                 
-                for row in rows:
-                    data_json, = row
-                    try:
-                        data = json.loads(data_json)
-                        program_key = data.get("program", "Unknown")
-                        
-                        # Only count brew programs
-                        if self._is_brew_program(program_key):
-                            counts[program_key] = counts.get(program_key, 0) + 1
-                    except (json.JSONDecodeError, KeyError):
-                        continue
+            for program_key, count in cursor:
+                # Only count brew programs
+                if isinstance(program_key, str) and self._is_brew_program(program_key):
+                    counts[program_key] = count
                 
-                return counts
-            finally:
-                conn.close()
+            return counts
+        finally:
+            conn.close()
 
     def get_api_statistics(self, date: Optional[str] = None) -> Dict[str, int]:
         """Gets API statistics for a specific date (YYYY-MM-DD).
@@ -324,29 +495,28 @@ class HistoryManager:
         if date is None:
             date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         
-        with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT calls_count, token_refreshes_count
-                    FROM api_statistics
-                    WHERE date = ?
-                """, (date,))
-                row = cursor.fetchone()
+        conn = self._connect(read_only=True)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT calls_count, token_refreshes_count
+                FROM api_statistics
+                WHERE date = ?
+            """, (date,))
+            row = cursor.fetchone()
                 
-                if row:
-                    return {
-                        "calls_count": row[0],
-                        "token_refreshes_count": row[1],
-                    }
-                else:
-                    return {
-                        "calls_count": 0,
-                        "token_refreshes_count": 0,
-                    }
-            finally:
-                conn.close()
+            if row:
+                return {
+                    "calls_count": row[0],
+                    "token_refreshes_count": row[1],
+                }
+            else:
+                return {
+                    "calls_count": 0,
+                    "token_refreshes_count": 0,
+                }
+        finally:
+            conn.close()
 
     def increment_api_call(self, date: Optional[str] = None) -> int:
         """Increments the API call counter for a specific date.
@@ -361,8 +531,8 @@ class HistoryManager:
             date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         
         with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
+            conn = self._writer()
+            with conn:
                 cursor = conn.cursor()
                 # Insert or update
                 cursor.execute("""
@@ -372,7 +542,6 @@ class HistoryManager:
                         calls_count = calls_count + 1,
                         last_updated = ?
                 """, (date, datetime.now(timezone.utc).isoformat(), datetime.now(timezone.utc).isoformat()))
-                conn.commit()
                 
                 # Get updated count
                 cursor.execute("""
@@ -380,8 +549,6 @@ class HistoryManager:
                 """, (date,))
                 row = cursor.fetchone()
                 return row[0] if row else 1
-            finally:
-                conn.close()
 
     def increment_token_refresh(self, date: Optional[str] = None) -> int:
         """Increments the token refresh counter for a specific date.
@@ -396,8 +563,8 @@ class HistoryManager:
             date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         
         with self._lock:
-            conn = sqlite3.connect(str(self.db_path))
-            try:
+            conn = self._writer()
+            with conn:
                 cursor = conn.cursor()
                 # Insert or update
                 cursor.execute("""
@@ -407,7 +574,6 @@ class HistoryManager:
                         token_refreshes_count = token_refreshes_count + 1,
                         last_updated = ?
                 """, (date, datetime.now(timezone.utc).isoformat(), datetime.now(timezone.utc).isoformat()))
-                conn.commit()
                 
                 # Get updated count
                 cursor.execute("""
@@ -415,5 +581,3 @@ class HistoryManager:
                 """, (date,))
                 row = cursor.fetchone()
                 return row[0] if row else 1
-            finally:
-                conn.close()
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import hmac
 from typing import TYPE_CHECKING
-from urllib.parse import parse_qs, urlparse
 
 from ..errors import ErrorCode
+from ..handlers.base_handler import UNAUTHORIZED_MESSAGE
 
 if TYPE_CHECKING:
     from ..handlers.base_handler import BaseHandler
@@ -32,6 +33,17 @@ class AuthMiddleware:
         self.api_token = api_token
         self.error_handler = error_handler
 
+    @property
+    def api_token(self) -> str | None:
+        """The API token to check (None = authentication disabled)."""
+        return self._api_token
+
+    @api_token.setter
+    def api_token(self, api_token: str | None) -> None:
+        self._api_token = api_token
+        # Encoded once for the constant-time comparison in check_auth()
+        self._api_token_bytes = api_token.encode("utf-8") if api_token is not None else None
+
     def check_auth(self, router: "BaseHandler") -> bool:
         """Checks authentication via header or query parameter.
         
@@ -41,21 +53,24 @@ class AuthMiddleware:
         Returns:
             True if authenticated, False otherwise
         """
-        if self.api_token is None:
+        expected = self._api_token_bytes
+        if expected is None:
             return True  # No token configured = open
 
         # Check Authorization header
+        # Tokens are compared in constant time
         auth_header = router.headers.get("Authorization", "")
         if auth_header.startswith("Bearer "):
             token = auth_header[7:]
-            if token == self.api_token:
+            if hmac.compare_digest(token.encode("utf-8"), expected):
                 return True
 
-        # Check query parameter
-        parsed_path = urlparse(router.path)
-        query_params = parse_qs(parsed_path.query)
-        token_param = query_params.get("token", [None])[0]
-        if token_param == self.api_token:
+        # Check query parameter (only parsed if the query can contain a token)
+        query = router.path.partition("?")[2]
+        if "token=" not in query:
+            return False
+        token_param = router._query_params().get("token", [None])[0]
+        if token_param is not None and hmac.compare_digest(token_param.encode("utf-8"), expected):
             return True
 
         return False
@@ -70,15 +85,7 @@ class AuthMiddleware:
             True if authenticated, False if 401 was sent
         """
         if not self.check_auth(router):
-            if self.error_handler:
-                response = self.error_handler.create_error_response(
-                    ErrorCode.UNAUTHORIZED,
-                    "Unauthorized - Invalid or missing API token",
-                    ErrorCode.UNAUTHORIZED,
-                )
-                router._send_error_response(ErrorCode.UNAUTHORIZED, response)
-            else:
-                router._send_error(401, "Unauthorized - Invalid or missing API token")
+            router._send_fixed_error(ErrorCode.UNAUTHORIZED, UNAUTHORIZED_MESSAGE, self.error_handler)
             return False
         return True
 
@@ -0,0 +1,50 @@
+"""Home Connect keys for the coffee maker (programs, options, settings and states).
+
+Kept free of third-party imports so that command line entry points can build
+their argument parsers without loading the HTTP client.
+"""
+
+from __future__ import annotations
+
+ESPRESSO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Espresso"
+COFFEE_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Coffee"
+CAPPUCCINO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Cappuccino"
+LATTE_MACCHIATO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.LatteMacchiato"
+CAFFE_LATTE_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.CaffeLatte"
+AMERICANO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Americano"
+HOT_WATER_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.HotWater"
+HOT_MILK_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.HotMilk"
+MILK_FOAM_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.MilkFoam"
+RISTRETTO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Ristretto"
+LUNGO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Lungo"
+
+FILL_OPTION = "ConsumerProducts.CoffeeMaker.Option.FillQuantity"
+
+POWER_STATE_KEY = "BSH.Common.Setting.PowerState"
+POWER_ON = "BSH.Common.EnumType.PowerState.On"
+POWER_STANDBY = "BSH.Common.EnumType.PowerState.Standby"
+OPERATION_STATE_KEY = "BSH.Common.Status.OperationState"
+OPERATION_STATE_INACTIVE = "BSH.Common.EnumType.OperationState.Inactive"
+
+# Mapping from program name (lowercase) to program key
+PROGRAM_KEYS = {
+    "espresso": ESPRESSO_KEY,
+    "coffee": COFFEE_KEY,
+    "cappuccino": CAPPUCCINO_KEY,
+    "latte macchiato": LATTE_MACCHIATO_KEY,
+    "lattemacchiato": LATTE_MACCHIATO_KEY,
+    "caffè latte": CAFFE_LATTE_KEY,
+    "caffelatte": CAFFE_LATTE_KEY,
+    "americano": AMERICANO_KEY,
+    "hot water": HOT_WATER_KEY,
+    "hotwater": HOT_WATER_KEY,
+    "hot milk": HOT_MILK_KEY,
+    "hotmilk": HOT_MILK_KEY,
+    "milk foam": MILK_FOAM_KEY,
+    "milkfoam": MILK_FOAM_KEY,
+    "ristretto": RISTRETTO_KEY,
+    "lungo": LUNGO_KEY,
+}
+
+# Programs that support fill_ml option
+PROGRAMS_WITH_FILL_ML = {"espresso", "coffee"}
@@ -2,49 +2,53 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
 
 import requests
 
 from ..client import HomeConnectClient
 from ..config import HomeConnectConfig
-
-ESPRESSO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Espresso"
-COFFEE_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Coffee"
-CAPPUCCINO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Cappuccino"
-LATTE_MACCHIATO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.LatteMacchiato"
-CAFFE_LATTE_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.CaffeLatte"
-AMERICANO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Americano"
-HOT_WATER_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.HotWater"
-HOT_MILK_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.HotMilk"
-MILK_FOAM_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.MilkFoam"
-RISTRETTO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Ristretto"
-LUNGO_KEY = "ConsumerProducts.CoffeeMaker.Program.Beverage.Lungo"
-
-FILL_OPTION = "ConsumerProducts.CoffeeMaker.Option.FillQuantity"
-
-# Mapping from program name (lowercase) to program key
-PROGRAM_KEYS = {
-    "espresso": ESPRESSO_KEY,
-    "coffee": COFFEE_KEY,
-    "cappuccino": CAPPUCCINO_KEY,
-    "latte macchiato": LATTE_MACCHIATO_KEY,
-    "lattemacchiato": LATTE_MACCHIATO_KEY,
-    "caffè latte": CAFFE_LATTE_KEY,
-    "caffelatte": CAFFE_LATTE_KEY,
-    "americano": AMERICANO_KEY,
-    "hot water": HOT_WATER_KEY,
-    "hotwater": HOT_WATER_KEY,
-    "hot milk": HOT_MILK_KEY,
-    "hotmilk": HOT_MILK_KEY,
-    "milk foam": MILK_FOAM_KEY,
-    "milkfoam": MILK_FOAM_KEY,
-    "ristretto": RISTRETTO_KEY,
-    "lungo": LUNGO_KEY,
-}
-
-# Programs that support fill_ml option
-PROGRAMS_WITH_FILL_ML = {"espresso", "coffee"}
+from ..programs import (  # noqa: F401 - keys are re-exported for existing callers
+    AMERICANO_KEY,
+    CAFFE_LATTE_KEY,
+    CAPPUCCINO_KEY,
+    COFFEE_KEY,
+    ESPRESSO_KEY,
+    FILL_OPTION,
+    HOT_MILK_KEY,
+    HOT_WATER_KEY,
+    LATTE_MACCHIATO_KEY,
+    LUNGO_KEY,
+    MILK_FOAM_KEY,
+    OPERATION_STATE_INACTIVE,
+    OPERATION_STATE_KEY,
+    POWER_ON,
+    POWER_STANDBY,
+    POWER_STATE_KEY,
+    PROGRAM_KEYS,
+    PROGRAMS_WITH_FILL_ML,
+    RISTRETTO_KEY,
+)
+
+# Seconds a known PowerState is trusted before it is fetched from the API again
+POWER_STATE_TTL = 5.0
+
+# Runs the power check of brew_program() next to the other API calls; created
+# on first use so that importing the module (e.g. from CLI scripts) starts no threads
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Returns the shared executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="coffee-service")
+        return _executor
 
 
 def build_options(fill_ml: int | None) -> list[dict[str, object]]:
@@ -55,12 +59,50 @@ def build_options(fill_ml: int | None) -> list[dict[str, object]]:
     return options
 
 
+def _power_state(settings: Dict[str, Any]) -> Optional[str]:
+    """Returns the PowerState value from a get_settings() response (None if missing)."""
+    return next(
+        (
+            setting.get("value")
+            for setting in settings.get("data", {}).get("settings", ())
+            if setting.get("key") == POWER_STATE_KEY
+        ),
+        None,
+    )
+
+
 class CoffeeService:
     """Service for coffee operations."""
 
     def __init__(self, client: HomeConnectClient) -> None:
         """Initializes the CoffeeService with a HomeConnectClient."""
         self.client = client
+        # Last known PowerState and when it was seen (time.monotonic())
+        self._known_power_state: Optional[tuple[str, float]] = None
+
+    def _remember_power_state(self, power_state: str) -> None:
+        """Remembers a PowerState seen or set by this service."""
+        self._known_power_state = (power_state, time.monotonic())
+
+    def _cached_power_state(self) -> Optional[str]:
+        """Returns the remembered PowerState if it is younger than POWER_STATE_TTL."""
+        known = self._known_power_state
+        if known is None or time.monotonic() - known[1] > POWER_STATE_TTL:
+            return None
+        return known[0]
+
+    def _ensure_power_on(self) -> None:
+        """Switches the device on if it is in standby (errors are ignored)."""
+        try:
+            power_state = _power_state(self.client.get_settings())
+            if power_state == POWER_STANDBY:
+                self.client.set_setting(POWER_STATE_KEY, POWER_ON)
+                power_state = POWER_ON
+            if power_state is not None:
+                self._remember_power_state(power_state)
+        except Exception:
+            # Ignore activation errors, try to brew anyway
+            pass
 
     def wake_device(self) -> Dict[str, Any]:
         """Activates the device from standby.
@@ -73,27 +115,25 @@ class CoffeeService:
         """
         # Try to activate directly first - faster than checking status first
         try:
-            self.client.set_setting("BSH.Common.Setting.PowerState", "BSH.Common.EnumType.PowerState.On")
+            self.client.set_setting(POWER_STATE_KEY, POWER_ON)
+            self._remember_power_state(POWER_ON)
             return {"status": "activated", "message": "Device was activated"}
         except RuntimeError:
             # If activation fails, check if device is already active
             try:
                 status = self.client.get_status()
                 for item in status.get("data", {}).get("status", []):
-                    if item.get("key") == "BSH.Common.Status.OperationState":
+                    if item.get("key") == OPERATION_STATE_KEY:
                         op_state = item.get("value")
-                        if op_state != "BSH.Common.EnumType.OperationState.Inactive":
+                        if op_state != OPERATION_STATE_INACTIVE:
                             return {"status": "already_on", "message": "Device is already activated"}
                         break
                 
                 # Fallback: Check settings
-                settings = self.client.get_settings()
-                for setting in settings.get("data", {}).get("settings", []):
-                    if setting.get("key") == "BSH.Common.Setting.PowerState":
-                        power_state = setting.get("value")
-                        if power_state == "BSH.Common.EnumType.PowerState.On":
-                            return {"status": "already_on", "message": "Device is already activated"}
-                        break
+                power_state = _power_state(self.client.get_settings())
+                if power_state == POWER_ON:
+                    self._remember_power_state(power_state)
+                    return {"status": "already_on", "message": "Device is already activated"}
                 
                 return {"status": "unknown", "message": "Could not determine PowerState"}
             except Exception:
@@ -123,16 +163,18 @@ class CoffeeService:
         if fill_ml is not None and program_name_lower not in PROGRAMS_WITH_FILL_ML:
             raise ValueError(f"Program '{program_name or program_key}' does not support fill_ml option")
         
-        # Activate device if necessary
-        try:
-            settings = self.client.get_settings()
-            for setting in settings.get("data", {}).get("settings", []):
-                if setting.get("key") == "BSH.Common.Setting.PowerState":
-                    if setting.get("value") == "BSH.Common.EnumType.PowerState.Standby":
-                        self.client.set_setting("BSH.Common.Setting.PowerState", "BSH.Common.EnumType.PowerState.On")
-        except Exception:
-            # Ignore activation errors, try to brew anyway
-            pass
+        # Activate device if necessary (skipped if the device was just seen on,
+        # e.g. after /wake, to save a round-trip to the API). If it was last
+        # seen on, it is most likely still on and the check runs while the
+        # previously selected program is cleared. Otherwise it is woken first,
+        # as clearing a device in standby fails and would leave the old program.
+        power_check = None
+        if self._cached_power_state() != POWER_ON:
+            known = self._known_power_state
+            if known is not None and known[0] == POWER_ON:
+                power_check = _get_executor().submit(self._ensure_power_on)
+            else:
+                self._ensure_power_on()
 
         # Select program
         options = build_options(fill_ml) if fill_ml is not None else []
@@ -142,6 +184,9 @@ class CoffeeService:
             # Ignore errors if no program is selected
             pass
 
+        if power_check is not None:
+            power_check.result()
+
         self.client.select_program(program_key, options=options)
         self.client.start_program()
 
@@ -7,10 +7,11 @@ import logging
 import os
 import threading
 import time
+from datetime import datetime
 from http.server import BaseHTTPRequestHandler
-from queue import Queue
+from queue import Empty, Queue
 from threading import Event, Lock
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
 
 import requests
 from sseclient import SSEClient
@@ -21,10 +22,46 @@ from ..history import HistoryManager
 
 EVENTS_URL = "https://api.home-connect.com/api/homeappliances/events"
 
+ACTIVE_PROGRAM_KEY = "BSH.Common.Root.ActiveProgram"
+# SSE event types that can carry an ActiveProgram item
+PROGRAM_EVENT_TYPES = frozenset({"EVENT", "NOTIFY"})
+
+# Maximum number of queued events written to the history in one transaction
+HISTORY_BATCH_SIZE = 100
+
+# Seconds between keep-alive pings sent to all SSE clients
+SSE_KEEPALIVE_INTERVAL = 30
+
 # Logger for event stream manager
 logger = logging.getLogger(__name__)
 
 
+def _program_started_events(payload: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yields program_started history entries for ActiveProgram items of an event payload.
+
+    Args:
+        payload: Decoded EVENT/NOTIFY payload
+
+    Yields:
+        Tuples of ("program_started", data) ready for the history queue
+    """
+    for item in payload.get("items", ()):
+        if item.get("key") != ACTIVE_PROGRAM_KEY:
+            continue
+        value = item.get("value")
+        # ActiveProgram Event: If value is not null, a program was started
+        if isinstance(value, dict):
+            # Value is an object with "key" and "options"
+            if value:
+                yield "program_started", {
+                    "program": value.get("key", "Unknown"),
+                    "options": value.get("options", []),
+                }
+        elif isinstance(value, str) and value:
+            # Value is directly the program key (string)
+            yield "program_started", {"program": value, "options": []}
+
+
 class EventStreamManager:
     """Manages the event stream and SSE clients."""
 
@@ -44,7 +81,9 @@ class EventStreamManager:
         
         # State for SSE clients
         self._clients: list[BaseHTTPRequestHandler] = []
+        self._client_closed: dict[BaseHTTPRequestHandler, Event] = {}
         self._clients_lock = Lock()
+        self._keepalive_thread: threading.Thread | None = None
         
         # State for event stream worker
         self._stream_thread: threading.Thread | None = None
@@ -66,9 +105,12 @@ class EventStreamManager:
         # State for history worker
         self._history_queue: Queue = Queue()
         self._history_worker_thread: threading.Thread | None = None
+        
+        # Client reused across reconnects (only used by the event stream worker)
+        self._client: HomeConnectClient | None = None
 
     def start(self) -> None:
-        """Starts the event stream worker, history worker, and heartbeat monitor."""
+        """Starts the event stream worker, history worker, heartbeat monitor and SSE keep-alive."""
         # Start history worker (runs always)
         if self._history_worker_thread is None or not self._history_worker_thread.is_alive():
             self._history_worker_thread = threading.Thread(
@@ -83,6 +125,13 @@ class EventStreamManager:
             )
             self._heartbeat_monitor_thread.start()
         
+        # Start SSE keep-alive (runs always)
+        if self._keepalive_thread is None or not self._keepalive_thread.is_alive():
+            self._keepalive_thread = threading.Thread(
+                target=self._keepalive_worker, daemon=True
+            )
+            self._keepalive_thread.start()
+        
         # Start event stream worker (runs always for history persistence)
         if self._stream_running:
             return
@@ -111,17 +160,23 @@ class EventStreamManager:
         if self.enable_logging:
             logger.info("Event stream worker stopping...")
 
-    def add_client(self, client: BaseHTTPRequestHandler) -> None:
+    def add_client(self, client: BaseHTTPRequestHandler) -> Event:
         """Adds an SSE client.
         
         Args:
             client: BaseHTTPRequestHandler for SSE connection
+            
+        Returns:
+            Event that is set once the client has been removed (e.g. after a
+            failed write), so the connection thread can wait on it instead of polling
         """
         with self._clients_lock:
             if client not in self._clients:
                 self._clients.append(client)
+                self._client_closed[client] = Event()
                 if self.enable_logging:
                     logger.info(f"Event stream manager: Added client, {len(self._clients)} client(s) connected")
+            return self._client_closed[client]
 
     def remove_client(self, client: BaseHTTPRequestHandler) -> None:
         """Removes an SSE client.
@@ -131,10 +186,20 @@ class EventStreamManager:
         """
         with self._clients_lock:
             if client in self._clients:
-                self._clients.remove(client)
+                self._discard_client(client)
                 if self.enable_logging:
                     logger.info(f"Event stream manager: Removed client, {len(self._clients)} client(s) remaining")
 
+    def _discard_client(self, client: BaseHTTPRequestHandler) -> None:
+        """Removes a client and wakes up its connection thread.
+        
+        Must be called with _clients_lock held.
+        """
+        self._clients.remove(client)
+        closed = self._client_closed.pop(client, None)
+        if closed is not None:
+            closed.set()
+
     def broadcast_event(self, event_type: str, payload: Dict[str, Any]) -> None:
         """Sends an event to all connected clients.
         
@@ -153,11 +218,13 @@ class EventStreamManager:
             if self.enable_logging:
                 logger.debug(f"broadcast_event: Sending '{event_type}' to {len(self._clients)} client(s)")
             
+            # Encode once, write the same frame to every client
+            frame = DashboardHandler._encode_sse_event(event_type, payload)
             disconnected_clients = []
             for client_handler in self._clients:
                 try:
                     # Use static method from DashboardHandler
-                    DashboardHandler._send_sse_event(client_handler, event_type, payload)
+                    DashboardHandler._send_sse_frame(client_handler, frame)
                 except (BrokenPipeError, ConnectionResetError, OSError):
                     # Client closed connection
                     disconnected_clients.append(client_handler)
@@ -170,10 +237,24 @@ class EventStreamManager:
             # Remove disconnected clients
             for client in disconnected_clients:
                 if client in self._clients:
-                    self._clients.remove(client)
+                    self._discard_client(client)
                     if self.enable_logging:
                         logger.debug(f"broadcast_event: Removed disconnected client, {len(self._clients)} client(s) remaining")
 
+    def _keepalive_worker(self) -> None:
+        """Background thread that pings all SSE clients periodically.
+        
+        A single thread serves every connection; clients whose socket is gone
+        are removed by broadcast_event(), which also releases their handler thread.
+        """
+        while True:
+            time.sleep(SSE_KEEPALIVE_INTERVAL)
+            try:
+                self.broadcast_event("ping", {"timestamp": datetime.now().isoformat()})
+            except Exception as e:
+                if self.enable_logging:
+                    logger.warning(f"SSE keep-alive failed: {e}")
+
     def _history_worker(self) -> None:
         """Background thread that saves events from the queue."""
         if self.enable_logging:
@@ -183,28 +264,36 @@ class EventStreamManager:
         while True:
             try:
                 # Wait for event in queue (blocking, but in separate thread)
-                event_type, data = self._history_queue.get(timeout=1)
+                batch = [self._history_queue.get(timeout=1)]
+                # Drain whatever else is already queued (e.g. a burst of events
+                # from one SSE message) so it is written in a single transaction
+                while len(batch) < HISTORY_BATCH_SIZE:
+                    try:
+                        batch.append(self._history_queue.get_nowait())
+                    except Empty:
+                        break
                 
                 if self.history_manager:
                     try:
-                        self.history_manager.add_event(event_type, data)
-                        saved_count += 1
-                        if self.enable_logging and saved_count % 10 == 0:
-                            logger.debug(f"History worker: Saved {saved_count} events to history")
-                        elif self.enable_logging:
-                            logger.debug(f"History worker: Saved event '{event_type}' to history")
+                        saved = self.history_manager.add_events(
+                            {"type": event_type, "data": data} for event_type, data in batch
+                        )
+                        saved_count += saved
+                        if self.enable_logging:
+                            logger.debug(f"History worker: Saved {saved} event(s) to history ({saved_count} total)")
                     except Exception as e:
                         if self.enable_logging:
-                            logger.error(f"Error saving event to history: {e}")
+                            logger.error(f"Error saving events to history: {e}")
                 else:
                     if self.enable_logging:
-                        logger.warning(f"History worker: No history_manager available, skipping event '{event_type}'")
+                        logger.warning(f"History worker: No history_manager available, skipping {len(batch)} event(s)")
                 
-                self._history_queue.task_done()
+                for _ in batch:
+                    self._history_queue.task_done()
             except Exception as e:
                 # Timeout or other error - just continue
-                if self.enable_logging and not isinstance(e, Exception):
-                    logger.debug(f"History worker: Queue timeout (normal)")
+                if self.enable_logging and not isinstance(e, Empty):
+                    logger.debug(f"History worker: {e}")
                 pass
 
     def _update_heartbeat(self) -> None:
@@ -286,20 +375,24 @@ class EventStreamManager:
 
         while not self._stream_stop_event.is_set():
             try:
-                # Timeout for config and client creation
-                # Always get a fresh token for each connection attempt to ensure it's valid
+                # Config and client are loaded once and reused across reconnects;
+                # the token is still checked (and refreshed if needed) per attempt
                 try:
+                    if self._client is None:
+                        if self.enable_logging:
+                            logger.info("Event stream worker: Loading config...")
+                        self._client = HomeConnectClient(load_config())
                     if self.enable_logging:
-                        logger.info("Event stream worker: Loading config and getting access token...")
-                    config = load_config()
-                    client = HomeConnectClient(config)
+                        logger.info("Event stream worker: Getting access token...")
                     # get_access_token() ensures token is valid and refreshes if needed
-                    token = client.get_access_token()
+                    token = self._client.get_access_token()
                     if self.enable_logging:
                         logger.info("Event stream worker: Successfully obtained access token")
                 except Exception as e:
                     if self.enable_logging:
                         logger.error(f"Event stream worker: Error loading config or token: {e}")
+                    # Start over with config and token file on the next attempt
+                    self._client = None
                     time.sleep(10)  # Wait before retry
                     continue
                     
@@ -341,9 +434,11 @@ class EventStreamManager:
                         backoff_seconds = min(backoff_seconds * 2, max_backoff_seconds)
                         continue
                     elif e.response is not None and e.response.status_code == 401:
-                        # Token expired or invalid - will get fresh token on next iteration
+                        # Token expired or invalid - rebuild the client so the token
+                        # file is read again on the next iteration
                         if self.enable_logging:
                             logger.warning("Event stream worker: Token expired or invalid (401), will refresh on reconnect")
+                        self._client = None
                         time.sleep(5)  # Short wait before reconnect with fresh token
                         continue
                     else:
@@ -427,33 +522,10 @@ class EventStreamManager:
                                             "payload": payload,
                                         },
                                     ))
-                                elif event_type in ("EVENT", "NOTIFY"):
+                                elif event_type in PROGRAM_EVENT_TYPES:
                                     # Save program events
-                                    items = payload.get("items", [])
-                                    for item in items:
-                                        item_key = item.get("key")
-                                        item_value = item.get("value")
-                                        
-                                        # ActiveProgram Event: If value is not null, a program was started
-                                        if item_key == "BSH.Common.Root.ActiveProgram" and item_value:
-                                            if isinstance(item_value, dict):
-                                                # Value is an object with "key" and "options"
-                                                self._history_queue.put_nowait((
-                                                    "program_started",
-                                                    {
-                                                        "program": item_value.get("key", "Unknown"),
-                                                        "options": item_value.get("options", []),
-                                                    },
-                                                ))
-                                            elif isinstance(item_value, str):
-                                                # Value is directly the program key (string)
-                                                self._history_queue.put_nowait((
-                                                    "program_started",
-                                                    {
-                                                        "program": item_value,
-                                                        "options": [],
-                                                    },
-                                                ))
+                                    for entry in _program_started_events(payload):
+                                        self._history_queue.put_nowait(entry)
                             except Exception as e:
                                 # Errors adding to queue should not stop the stream
                                 if self.enable_logging:
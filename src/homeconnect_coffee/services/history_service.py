@@ -32,6 +32,24 @@ class HistoryService:
         """
         return self.history_manager.get_history(event_type, limit, before_timestamp)
 
+    def get_history_json(
+        self,
+        event_type: Optional[str] = None,
+        limit: Optional[int] = None,
+        before_timestamp: Optional[str] = None,
+    ) -> bytes:
+        """Returns the event history as a JSON response body ({"history": [...]}).
+        
+        Args:
+            event_type: Optional filter for event type
+            limit: Maximum number of events
+            before_timestamp: ISO 8601 timestamp for cursor-based pagination
+        
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return self.history_manager.get_history_json(event_type, limit, before_timestamp)
+
     def get_program_counts(self) -> Dict[str, int]:
         """Returns the usage count per program.
         
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+import logging
 import threading
 import time
+from concurrent.futures import Future
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
 from ..api_monitor import get_monitor
 from ..auth import TokenBundle
 from ..client import HomeConnectClient
 
+logger = logging.getLogger(__name__)
+
+# Seconds a /status response is reused; collapses bursts (e.g. Siri Shortcuts,
+# polling UIs) into a single API call
+STATUS_CACHE_TTL = 1.5
+
 
 class StatusService:
     """Service for status queries."""
@@ -22,14 +30,85 @@ class StatusService:
         self._cache: Dict[str, Any] = {}
         self._cache_lock = threading.Lock()
         self._cache_ttl = 10  # Cache for 10 seconds
+        # Short-lived cache for get_status(): (time.monotonic(), data)
+        self._status_cache: Optional[tuple[float, Dict[str, Any]]] = None
+        # Upstream calls currently in progress, shared by concurrent callers
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        # Bumped by invalidate_cache(); fetches started before that do not
+        # write their (possibly outdated) result back into the caches
+        self._generation = 0
+
+    def _single_flight(self, key: str, fn: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Runs fn() once for all concurrent callers using the same key.
+        
+        The first caller runs fn(); callers arriving while it is in progress wait
+        for and share its result (or exception).
+        
+        Args:
+            key: Identifies the call to coalesce
+            fn: The call to run
+        
+        Returns:
+            Result of fn()
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._inflight_lock:
+                # invalidate_cache() may already have replaced this entry
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+        return future.result()
 
     def get_status(self) -> Dict[str, Any]:
         """Returns the device status.
         
+        Responses are reused for STATUS_CACHE_TTL seconds, and concurrent
+        requests on a cold cache share a single API call.
+        
         Returns:
             Dict with status data from the HomeConnect API
         """
-        return self.client.get_status()
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            return cached[1]
+
+        return self._single_flight("status", self._fetch_status)
+
+    def _fetch_status(self) -> Dict[str, Any]:
+        """Fetches the status from the API and stores it in the short-lived cache."""
+        generation = self._generation
+        status = self.client.get_status()
+        with self._cache_lock:
+            if generation == self._generation:
+                self._status_cache = (time.monotonic(), status)
+        return status
+
+    def invalidate_cache(self) -> None:
+        """Drops cached status data, e.g. after the device state was changed.
+        
+        Fetches already in progress are detached as well: later callers start
+        a fresh API call instead of joining them.
+        """
+        with self._cache_lock:
+            self._generation += 1
+            self._status_cache = None
+            self._cache = {}
+        with self._inflight_lock:
+            self._inflight.pop("status", None)
+            self._inflight.pop("extended_status", None)
 
     def _get_token_status(self) -> Dict[str, Any]:
         """Returns token status information for debugging.
@@ -153,11 +232,18 @@ class StatusService:
                 # Cache hit - return cached data
                 return self._cache['data']
         
-        # Cache miss or expired - fetch new data
+        # Cache miss or expired - fetch new data (once for concurrent callers)
+        return self._single_flight("extended_status", self._fetch_and_cache_extended_status)
+
+    def _fetch_and_cache_extended_status(self) -> Dict[str, Any]:
+        """Fetches extended status from API and updates the cache."""
+        generation = self._generation
         data = self._fetch_extended_status()
         
-        # Update cache
+        # Update cache (unless it was invalidated in the meantime)
         with self._cache_lock:
+            if generation != self._generation:
+                return data
             self._cache = {
                 'data': data,
                 'timestamp': time.time()
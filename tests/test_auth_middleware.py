@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from io import BytesIO
 from unittest.mock import Mock
 
@@ -95,6 +96,40 @@ class TestAuthMiddleware:
         
         assert middleware.check_auth(router) is False
 
+    def test_check_auth_query_among_other_params(self, handler_kwargs):
+        """Test check_auth() finds the token between other query parameters."""
+        middleware = AuthMiddleware(api_token="test-token")
+        router = BaseHandler(**handler_kwargs)
+        router.path = "/brew?program=coffee&token=test-token&fill_ml=40"
+        router.headers = Mock()
+        router.headers.get.return_value = ""
+        
+        assert middleware.check_auth(router) is True
+
+    def test_check_auth_non_ascii_token(self, handler_kwargs):
+        """Test check_auth() rejects non-ASCII tokens instead of raising."""
+        middleware = AuthMiddleware(api_token="test-token")
+        router = BaseHandler(**handler_kwargs)
+        router.path = "/test?token=t%C3%A9st"
+        router.headers = Mock()
+        router.headers.get.return_value = "Bearer tést"
+        
+        assert middleware.check_auth(router) is False
+
+    def test_check_auth_after_token_change(self, handler_kwargs):
+        """Test check_auth() uses a token assigned after construction."""
+        middleware = AuthMiddleware(api_token="old-token")
+        middleware.api_token = "new-token"
+        router = BaseHandler(**handler_kwargs)
+        router.path = "/test"
+        router.headers = Mock()
+        router.headers.get.return_value = "Bearer new-token"
+        
+        assert middleware.check_auth(router) is True
+        middleware.api_token = None
+        router.headers.get.return_value = ""
+        assert middleware.check_auth(router) is True
+
     def test_require_auth_sends_401(self, handler_kwargs, error_handler):
         """Test require_auth() sends 401 on missing auth."""
         middleware = AuthMiddleware(api_token="test-token", error_handler=error_handler)
@@ -112,6 +147,28 @@ class TestAuthMiddleware:
         assert result is False
         assert router.send_response.called  # Response wurde gesendet
 
+    def test_require_auth_401_body_matches_error_handler_format(self, handler_kwargs, error_handler):
+        """Test the pre-encoded 401 body equals the ErrorHandler response."""
+        middleware = AuthMiddleware(api_token="test-token", error_handler=error_handler)
+        router = BaseHandler(**handler_kwargs)
+        router.path = "/test"
+        router.headers = Mock()
+        router.headers.get.return_value = ""
+        router.wfile = BytesIO()
+        router.send_response = Mock()
+        router.send_header = Mock()
+        router.end_headers = Mock()
+        
+        middleware.require_auth(router)
+        
+        expected = error_handler.create_error_response(
+            ErrorCode.UNAUTHORIZED,
+            "Unauthorized - Invalid or missing API token",
+            ErrorCode.UNAUTHORIZED,
+        )
+        router.send_response.assert_called_once_with(401)
+        assert json.loads(router.wfile.getvalue()) == expected
+
     def test_require_auth_success(self, handler_kwargs, error_handler):
         """Test require_auth() returns True on successful auth."""
         middleware = AuthMiddleware(api_token="test-token", error_handler=error_handler)
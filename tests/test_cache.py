@@ -0,0 +1,83 @@
+"""Unit tests for cache.py (ttl_cache)."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from homeconnect_coffee.cache import default_cache_dir, ttl_cache
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Tests for ttl_cache decorator."""
+
+    def test_first_call_writes_cache(self, temp_dir: Path):
+        """Test that the first call hits the function and writes the cache file."""
+        path = temp_dir / "settings.json"
+        fn = Mock(return_value={"data": {"settings": []}})
+
+        cached = ttl_cache(path, ttl=60)(fn)
+        result = cached()
+
+        assert result == {"data": {"settings": []}}
+        assert fn.call_count == 1
+        assert path.exists()
+
+    def test_fresh_cache_is_used(self, temp_dir: Path):
+        """Test that a fresh cache file avoids calling the function again."""
+        path = temp_dir / "settings.json"
+        fn = Mock(return_value={"value": 1})
+
+        cached = ttl_cache(path, ttl=60)(fn)
+        cached()
+        result = cached()
+
+        assert result == {"value": 1}
+        assert fn.call_count == 1
+
+    def test_expired_cache_calls_function(self, temp_dir: Path):
+        """Test that an expired cache file is refreshed."""
+        path = temp_dir / "settings.json"
+        fn = Mock(side_effect=[{"value": 1}, {"value": 2}])
+
+        cached = ttl_cache(path, ttl=60)(fn)
+        cached()
+        old = time.time() - 120
+        os.utime(path, (old, old))
+
+        assert cached() == {"value": 2}
+        assert fn.call_count == 2
+
+    def test_invalidate_removes_cache(self, temp_dir: Path):
+        """Test that invalidate() forces a fresh call."""
+        path = temp_dir / "settings.json"
+        fn = Mock(side_effect=[{"value": 1}, {"value": 2}])
+
+        cached = ttl_cache(path, ttl=60)(fn)
+        cached()
+        cached.invalidate()
+
+        assert not path.exists()
+        assert cached() == {"value": 2}
+        cached.invalidate()
+        cached.invalidate()  # Missing file is ignored
+
+    def test_corrupt_cache_is_ignored(self, temp_dir: Path):
+        """Test that an unreadable cache file falls back to the function."""
+        path = temp_dir / "settings.json"
+        path.write_text("{not json")
+        fn = Mock(return_value={"value": 1})
+
+        assert ttl_cache(path, ttl=60)(fn)() == {"value": 1}
+        fn.assert_called_once()
+
+    def test_default_cache_dir_uses_xdg(self, monkeypatch, temp_dir: Path):
+        """Test that XDG_CACHE_HOME is respected."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir))
+
+        assert default_cache_dir() == temp_dir / "homeconnect_coffee"
@@ -0,0 +1,196 @@
+"""Unit tests for cli/brew.py (command line brewing)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from homeconnect_coffee.cli import brew as brew_cli
+from homeconnect_coffee.programs import COFFEE_KEY, ESPRESSO_KEY, HOT_WATER_KEY
+
+
+def _status(state: str) -> dict:
+    return {"data": {"status": [
+        {"key": "BSH.Common.Status.OperationState", "value": f"BSH.Common.EnumType.OperationState.{state}"},
+    ]}}
+
+
+@pytest.mark.unit
+class TestRetryWithBackoff:
+    """Tests for _retry_with_backoff helper."""
+
+    @patch("homeconnect_coffee.cli.brew.sleep")
+    def test_retries_retriable_errors(self, mock_sleep):
+        """Test that WrongOperationState errors are retried with growing delays."""
+        fn = Mock(side_effect=[
+            RuntimeError("API request failed (409): WrongOperationState"),
+            RuntimeError("API request failed (409): WrongOperationState"),
+            "ok",
+        ])
+
+        assert brew_cli._retry_with_backoff(fn, jitter=0) == "ok"
+        assert fn.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("homeconnect_coffee.cli.brew.sleep")
+    def test_other_errors_are_raised(self, mock_sleep):
+        """Test that non-retriable errors are raised immediately."""
+        fn = Mock(side_effect=RuntimeError("API request failed (400): Bad request"))
+
+        with pytest.raises(RuntimeError, match="400"):
+            brew_cli._retry_with_backoff(fn)
+        fn.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("homeconnect_coffee.cli.brew.sleep")
+    def test_gives_up_after_n_max(self, mock_sleep):
+        """Test that the last error is raised after n_max attempts."""
+        fn = Mock(side_effect=RuntimeError("WrongOperationState"))
+
+        with pytest.raises(RuntimeError):
+            brew_cli._retry_with_backoff(fn, n_max=3, cap=1.0)
+        assert fn.call_count == 3
+        assert all(c.args[0] <= 1.5 for c in mock_sleep.call_args_list)
+
+
+@pytest.mark.unit
+class TestPollUntilDone:
+    """Tests for _poll_until_done helper."""
+
+    @patch("homeconnect_coffee.cli.brew.sleep")
+    def test_stops_when_finished(self, mock_sleep):
+        """Test that polling stops once the program is finished."""
+        client = Mock()
+        client.get_status.side_effect = [_status("Run"), _status("Run"), _status("Finished")]
+
+        brew_cli._poll_until_done(client)
+
+        assert client.get_status.call_count == 3
+        # Interval backs off while the state does not change
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0]
+
+    @patch("homeconnect_coffee.cli.brew.sleep")
+    def test_inactive_before_run_does_not_stop(self, mock_sleep):
+        """Test that Inactive only ends polling after the program was seen running."""
+        client = Mock()
+        client.get_status.side_effect = [_status("Inactive"), _status("Run"), _status("Inactive")]
+
+        brew_cli._poll_until_done(client)
+
+        assert client.get_status.call_count == 3
+
+
+@pytest.mark.unit
+class TestBrew:
+    """Tests for brew() entry point."""
+
+    def test_build_options(self):
+        """Test build_options() with and without fill amount."""
+        assert brew_cli.build_options(40, None) == [
+            {"key": "ConsumerProducts.CoffeeMaker.Option.FillQuantity", "value": 40},
+        ]
+        assert brew_cli.build_options(None, "Strong") == []
+
+    def test_fetch_power_setting_falls_back_on_404(self):
+        """Test that the full settings list is used if the single-key endpoint is missing."""
+        client = Mock()
+        client.get_setting.side_effect = RuntimeError("API request failed (404): Not found")
+        client.get_settings.return_value = {"data": {"settings": [
+            {"key": "BSH.Common.Setting.PowerState", "value": "BSH.Common.EnumType.PowerState.Standby"},
+        ]}}
+
+        result = brew_cli._fetch_power_setting(client)
+
+        assert result["data"]["value"] == "BSH.Common.EnumType.PowerState.Standby"
+        client.get_setting.assert_called_once_with("BSH.Common.Setting.PowerState")
+
+    def test_import_does_not_load_http_client(self):
+        """Test that importing the CLI module (e.g. for --help) does not load requests."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, homeconnect_coffee.cli.brew; "
+            "print(sorted(m for m in ('requests', 'sseclient', 'homeconnect_coffee.client') if m in sys.modules))"
+        )
+        src_dir = Path(brew_cli.__file__).resolve().parents[2]
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=src_dir,
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_unknown_beverage_raises(self):
+        """Test that unknown beverages are rejected before any API call."""
+        with pytest.raises(ValueError, match="Unknown beverage"):
+            brew_cli.brew("Tea")
+
+    @pytest.mark.parametrize(
+        "beverage,program_key,options",
+        [
+            ("Espresso", ESPRESSO_KEY, [{"key": "ConsumerProducts.CoffeeMaker.Option.FillQuantity", "value": 50}]),
+            ("coffee", COFFEE_KEY, [{"key": "ConsumerProducts.CoffeeMaker.Option.FillQuantity", "value": 50}]),
+            ("hot water", HOT_WATER_KEY, []),
+        ],
+    )
+    def test_brew_selects_and_starts_program(self, temp_dir: Path, test_config, beverage, program_key, options):
+        """Test the brew flow with the device already switched on."""
+        client = Mock()
+        client.get_home_appliances.return_value = {"data": {"homeappliances": [
+            {"haid": "test_haid", "connected": True},
+        ]}}
+        client.get_setting.return_value = {"data": {
+            "key": "BSH.Common.Setting.PowerState", "value": "BSH.Common.EnumType.PowerState.On",
+        }}
+
+        with patch("homeconnect_coffee.config.load_config", return_value=test_config), \
+             patch("homeconnect_coffee.client.HomeConnectClient", return_value=client), \
+             patch("homeconnect_coffee.cli.brew.default_cache_dir", return_value=temp_dir):
+            brew_cli.brew(beverage)
+
+        client.set_setting.assert_not_called()
+        client.select_program.assert_called_once_with(program_key, options=options)
+        client.start_program.assert_called_once()
+
+    def test_brew_aborts_when_disconnected(self, temp_dir: Path, test_config):
+        """Test that a disconnected device stops the flow before selecting a program."""
+        client = Mock()
+        client.get_home_appliances.return_value = {"data": {"homeappliances": [
+            {"haid": "test_haid", "connected": False},
+        ]}}
+
+        with patch("homeconnect_coffee.config.load_config", return_value=test_config), \
+             patch("homeconnect_coffee.client.HomeConnectClient", return_value=client), \
+             patch("homeconnect_coffee.cli.brew.default_cache_dir", return_value=temp_dir):
+            with pytest.raises(SystemExit) as exc_info:
+                brew_cli.brew()
+
+        assert exc_info.value.code == 2
+        assert client.get_home_appliances.call_count == 2  # Cached result is confirmed once
+        client.select_program.assert_not_called()
+
+    @patch("homeconnect_coffee.cli.brew.sleep")
+    def test_brew_rechecks_power_state_on_wrong_operation_state(self, mock_sleep, temp_dir: Path, test_config):
+        """Test that a WrongOperationState re-checks the PowerState live and retries."""
+        client = Mock()
+        client.get_home_appliances.return_value = {"data": {"homeappliances": [
+            {"haid": "test_haid", "connected": True},
+        ]}}
+        client.get_setting.return_value = {"data": {
+            "key": "BSH.Common.Setting.PowerState", "value": "BSH.Common.EnumType.PowerState.On",
+        }}
+        client.select_program.side_effect = [
+            RuntimeError("API request failed (409): WrongOperationState"),
+            {},
+        ]
+
+        with patch("homeconnect_coffee.config.load_config", return_value=test_config), \
+             patch("homeconnect_coffee.client.HomeConnectClient", return_value=client), \
+             patch("homeconnect_coffee.cli.brew.default_cache_dir", return_value=temp_dir):
+            brew_cli.brew()
+
+        assert client.get_setting.call_count == 2  # Cached PowerState is checked live once
+        assert client.select_program.call_count == 2
+        client.start_program.assert_called_once()
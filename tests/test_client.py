@@ -262,6 +262,159 @@ class TestHomeConnectClient:
         headers = call_args[1]["headers"]
         assert headers["Authorization"] == "Bearer new_access_token"
 
+    @patch("homeconnect_coffee.client.record_api_call")
+    @patch("homeconnect_coffee.client.requests.Session")
+    def test_get_setting(self, mock_session_class, mock_record_api_call, test_config, valid_token_bundle, temp_token_file):
+        """Test get_setting() requests a single setting."""
+        valid_token_bundle.save(temp_token_file)
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        mock_response = Mock()
+        mock_response.ok = True
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"data": {"key": "BSH.Common.Setting.PowerState", "value": "On"}}
+        mock_session.request.return_value = mock_response
+        
+        client = HomeConnectClient(test_config)
+        result = client.get_setting("BSH.Common.Setting.PowerState")
+        
+        call_args = mock_session.request.call_args
+        assert call_args[0][0] == "GET"
+        assert call_args[0][1].endswith("/homeappliances/test_haid/settings/BSH.Common.Setting.PowerState")
+        assert result["data"]["value"] == "On"
+
+    @patch("homeconnect_coffee.client.record_api_call")
+    @patch("homeconnect_coffee.client.requests.Session")
+    def test_conditional_get_with_etag(self, mock_session_class, mock_record_api_call, test_config, valid_token_bundle, temp_token_file):
+        """Test that GETs send If-None-Match and reuse the cached body on 304."""
+        valid_token_bundle.save(temp_token_file)
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        
+        first = Mock(ok=True, status_code=200, headers={"ETag": '"v1"'})
+        first.json.return_value = {"data": {"status": ["cached"]}}
+        not_modified = Mock(ok=True, status_code=304, headers={"ETag": '"v1"'})
+        not_modified.json.side_effect = ValueError("no body")
+        mock_session.request.side_effect = [first, not_modified]
+        
+        client = HomeConnectClient(test_config)
+        assert client.get_status() == {"data": {"status": ["cached"]}}
+        assert client.get_status() == {"data": {"status": ["cached"]}}
+        
+        first_headers = mock_session.request.call_args_list[0][1]["headers"]
+        second_headers = mock_session.request.call_args_list[1][1]["headers"]
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == '"v1"'
+
+    @patch("homeconnect_coffee.client.record_api_call")
+    @patch("homeconnect_coffee.client.requests.Session")
+    def test_etag_cache_returns_copies(self, mock_session_class, mock_record_api_call, test_config, valid_token_bundle, temp_token_file):
+        """Test that callers mutating a response do not change later 304 responses."""
+        valid_token_bundle.save(temp_token_file)
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        
+        first = Mock(ok=True, status_code=200, headers={"ETag": '"v1"'})
+        first.json.return_value = {"data": {"status": ["cached"]}}
+        not_modified = Mock(ok=True, status_code=304, headers={"ETag": '"v1"'})
+        mock_session.request.side_effect = [first, not_modified, not_modified]
+        
+        client = HomeConnectClient(test_config)
+        client.get_status()["data"]["status"].append("changed")
+        client.get_status()["data"]["status"].clear()
+        
+        assert client.get_status() == {"data": {"status": ["cached"]}}
+
+    @patch("homeconnect_coffee.client.ETAG_CACHE_SIZE", 2)
+    @patch("homeconnect_coffee.client.record_api_call")
+    @patch("homeconnect_coffee.client.requests.Session")
+    def test_etag_cache_is_bounded(self, mock_session_class, mock_record_api_call, test_config, valid_token_bundle, temp_token_file):
+        """Test that the oldest URL is evicted once the cache is full."""
+        valid_token_bundle.save(temp_token_file)
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        
+        response = Mock(ok=True, status_code=200, headers={"ETag": '"v1"'})
+        response.json.return_value = {"data": {}}
+        mock_session.request.return_value = response
+        
+        client = HomeConnectClient(test_config)
+        client.get_status()
+        client.get_settings()
+        client.get_programs()
+        
+        assert len(client._etag_cache) == 2
+        assert not any(url.endswith("/status") for url in client._etag_cache)
+
+    @patch("homeconnect_coffee.client.record_api_call")
+    @patch("homeconnect_coffee.client.requests.Session")
+    def test_state_change_invalidates_etag_cache(self, mock_session_class, mock_record_api_call, test_config, valid_token_bundle, temp_token_file):
+        """Test that a PUT clears cached ETags."""
+        valid_token_bundle.save(temp_token_file)
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+        
+        get_response = Mock(ok=True, status_code=200, headers={"ETag": '"v1"'})
+        get_response.json.return_value = {"data": {}}
+        put_response = Mock(ok=True, status_code=204, headers={})
+        mock_session.request.side_effect = [get_response, put_response, get_response]
+        
+        client = HomeConnectClient(test_config)
+        client.get_settings()
+        client.set_setting("BSH.Common.Setting.PowerState", "BSH.Common.EnumType.PowerState.On")
+        client.get_settings()
+        
+        third_headers = mock_session.request.call_args_list[2][1]["headers"]
+        assert "If-None-Match" not in third_headers
+
+    @patch("homeconnect_coffee.client.time.sleep")
+    @patch("homeconnect_coffee.client.record_api_call")
+    @patch("homeconnect_coffee.client.requests.Session")
+    def test_rate_limit_retries_repeatedly(self, mock_session_class, mock_record_api_call, mock_sleep, test_config, valid_token_bundle, temp_token_file):
+        """Test that consecutive 429 responses are retried without deadlocking."""
+        valid_token_bundle.save(temp_token_file)
+        mock_session = Mock()
+        mock_session_class.return_value = mock_session
+
+        rate_limited = Mock(ok=False, status_code=429, headers={})
+        ok_response = Mock(ok=True, status_code=200, headers={})
+        ok_response.json.return_value = {"data": {}}
+        mock_session.request.side_effect = [rate_limited, rate_limited, ok_response]
+
+        client = HomeConnectClient(test_config)
+
+        assert client.get_status() == {"data": {}}
+        assert mock_sleep.call_count == 2
+        assert client._rate_limit_retries == 0
+
+    def test_retry_state_is_per_thread(self, test_config, valid_token_bundle, temp_token_file):
+        """Test that retry tracking of one thread does not affect another."""
+        import threading
+
+        valid_token_bundle.save(temp_token_file)
+        client = HomeConnectClient(test_config)
+        client._rate_limit_retries = 2
+        client._retry_attempted = True
+
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append((client._rate_limit_retries, client._retry_attempted)))
+        thread.start()
+        thread.join()
+
+        assert seen == [(0, False)]
+
+    def test_session_mounts_retrying_adapter(self, test_config, valid_token_bundle, temp_token_file):
+        """Test that the session uses a pooled adapter with transport retries."""
+        valid_token_bundle.save(temp_token_file)
+        
+        client = HomeConnectClient(test_config)
+        adapter = client._session.get_adapter("https://api.home-connect.com/api/homeappliances")
+        
+        assert adapter.max_retries.total == 3
+        assert 429 not in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.respect_retry_after_header is False
+        assert "PUT" not in adapter.max_retries.allowed_methods
+
     def test_get_access_token(self, test_config, valid_token_bundle, temp_token_file):
         """Test get_access_token() returns token."""
         valid_token_bundle.save(temp_token_file)
@@ -130,3 +130,12 @@ class TestColoredFormatter:
             
             assert formatter._use_colors is False
 
+    def test_format_time_matches_logging_formatter(self):
+        """Test that cached timestamps match logging.Formatter and change per second."""
+        datefmt = '%Y-%m-%d %H:%M:%S'
+        formatter = ColoredFormatter(fmt='%(asctime)s %(message)s', datefmt=datefmt)
+        reference = logging.Formatter(fmt='%(asctime)s %(message)s', datefmt=datefmt)
+        
+        for created in (1700000000.1, 1700000000.9, 1700000001.0):
+            record = logging.makeLogRecord({"msg": "x", "created": created})
+            assert formatter.formatTime(record, datefmt) == reference.formatTime(record, datefmt)
@@ -0,0 +1,38 @@
+"""Unit tests for console.py (lazy rich output)."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from homeconnect_coffee import console
+
+
+@pytest.mark.unit
+class TestConsole:
+    """Tests for console print helper."""
+
+    def test_strip_markup(self):
+        """Test that rich markup tags are removed."""
+        assert console.strip_markup("[bold green]Done[/bold green] [/]") == "Done "
+
+    def test_strip_markup_keeps_json(self):
+        """Test that JSON brackets are not treated as markup."""
+        text = '{"items": [], "data": ["a", 1]}'
+        assert console.strip_markup(text) == text
+
+    def test_print_without_tty_uses_builtin_print(self, capsys):
+        """Test that non-TTY output is plain text."""
+        with patch.object(console.sys.stdout, "isatty", return_value=False):
+            console.print("[bold]Status:[/bold]", 42)
+        
+        assert capsys.readouterr().out == "Status: 42\n"
+
+    def test_print_with_tty_uses_rich(self):
+        """Test that TTY output is delegated to rich."""
+        with patch.object(console.sys.stdout, "isatty", return_value=True), \
+             patch("rich.print") as mock_rich_print:
+            console.print("[bold]Status[/bold]")
+        
+        mock_rich_print.assert_called_once_with("[bold]Status[/bold]")
@@ -6,7 +6,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeconnect_coffee.services.event_stream_manager import EventStreamManager
+from homeconnect_coffee.services.event_stream_manager import (
+    EventStreamManager,
+    _program_started_events,
+)
 
 
 @pytest.mark.unit
@@ -111,13 +114,16 @@ class TestEventStreamManager:
         event_manager.add_client(client2)
         
         # Mock the static method
-        with patch.object(DashboardHandler, '_send_sse_event') as mock_send:
+        frame = DashboardHandler._encode_sse_event("STATUS", {"status": "on"})
+        with patch.object(DashboardHandler, '_encode_sse_event', wraps=DashboardHandler._encode_sse_event) as mock_encode, \
+             patch.object(DashboardHandler, '_send_sse_frame') as mock_send:
             event_manager.broadcast_event("STATUS", {"status": "on"})
             
-            # Check that _send_sse_event was called for both clients
+            # Check that the frame was encoded once and sent to both clients
+            mock_encode.assert_called_once_with("STATUS", {"status": "on"})
             assert mock_send.call_count == 2
-            mock_send.assert_any_call(client1, "STATUS", {"status": "on"})
-            mock_send.assert_any_call(client2, "STATUS", {"status": "on"})
+            mock_send.assert_any_call(client1, frame)
+            mock_send.assert_any_call(client2, frame)
 
     def test_broadcast_event_removes_disconnected_clients(self, temp_history_db):
         """Test broadcast_event() removes disconnected clients."""
@@ -134,17 +140,74 @@ class TestEventStreamManager:
         event_manager.add_client(client2)
         
         # Mock the static method to raise BrokenPipeError for client1
-        def side_effect(router, event_type, data):
+        def side_effect(router, frame):
             if router == client1:
                 raise BrokenPipeError()
         
-        with patch.object(DashboardHandler, '_send_sse_event', side_effect=side_effect):
+        with patch.object(DashboardHandler, '_send_sse_frame', side_effect=side_effect):
             event_manager.broadcast_event("STATUS", {"status": "on"})
         
         # client1 should have been removed
         assert client1 not in event_manager._clients
         assert client2 in event_manager._clients
 
+    def test_removed_client_is_released(self, temp_history_db):
+        """Test that the event returned by add_client() is set when the client is dropped."""
+        from homeconnect_coffee.history import HistoryManager
+        from homeconnect_coffee.handlers.dashboard_handler import DashboardHandler
+        
+        manager = HistoryManager(temp_history_db)
+        event_manager = EventStreamManager(manager, enable_logging=False)
+        
+        client1 = Mock()
+        client2 = Mock()
+        closed1 = event_manager.add_client(client1)
+        closed2 = event_manager.add_client(client2)
+        
+        assert event_manager.add_client(client1) is closed1
+        assert not closed1.is_set()
+        
+        def side_effect(router, frame):
+            if router == client1:
+                raise BrokenPipeError()
+        
+        with patch.object(DashboardHandler, '_send_sse_frame', side_effect=side_effect):
+            event_manager.broadcast_event("ping", {})
+        
+        assert closed1.is_set()
+        assert not closed2.is_set()
+        
+        event_manager.remove_client(client2)
+        assert closed2.is_set()
+
+    def test_event_stream_401_rebuilds_client(self, temp_history_db):
+        """Test that a 401 from the event stream drops the client so the token is reloaded."""
+        import requests
+        from homeconnect_coffee.history import HistoryManager
+        
+        manager = HistoryManager(temp_history_db)
+        event_manager = EventStreamManager(manager, enable_logging=False)
+        
+        unauthorized = Mock(status_code=401)
+        
+        def get(*args, **kwargs):
+            if get.calls == 0:
+                get.calls += 1
+                raise requests.exceptions.HTTPError(response=unauthorized)
+            event_manager._stream_stop_event.set()
+            raise requests.exceptions.ConnectionError("stop")
+        get.calls = 0
+        
+        module = "homeconnect_coffee.services.event_stream_manager"
+        with patch(f"{module}.load_config"), \
+             patch(f"{module}.HomeConnectClient") as mock_client_cls, \
+             patch(f"{module}.requests.get", side_effect=get), \
+             patch(f"{module}.time.sleep"):
+            mock_client_cls.return_value.get_access_token.return_value = "token"
+            event_manager._event_stream_worker()
+        
+        assert mock_client_cls.call_count == 2
+
     def test_start_starts_workers(self, temp_history_db):
         """Test start() starts worker threads."""
         from homeconnect_coffee.history import HistoryManager
@@ -239,8 +302,8 @@ class TestEventStreamManager:
         # Start history worker
         event_manager.start()
         
-        # Mock add_event to raise an exception
-        with patch.object(manager, 'add_event', side_effect=Exception("Test error")):
+        # Mock add_events to raise an exception
+        with patch.object(manager, 'add_events', side_effect=Exception("Test error")):
             # Add event to queue
             event_manager._history_queue.put_nowait(("test_event", {"key": "value"}))
             
@@ -253,6 +316,25 @@ class TestEventStreamManager:
         
         event_manager.stop()
 
+    def test_history_worker_batches_queued_events(self, temp_history_db):
+        """Test that events already waiting in the queue are written in one call."""
+        import time
+        from homeconnect_coffee.history import HistoryManager
+        
+        manager = HistoryManager(temp_history_db)
+        event_manager = EventStreamManager(manager, enable_logging=False)
+        
+        for i in range(5):
+            event_manager._history_queue.put_nowait(("test_event", {"index": i}))
+        
+        with patch.object(manager, "add_events", wraps=manager.add_events) as mock_add_events:
+            event_manager.start()
+            event_manager._history_queue.join()
+        event_manager.stop()
+        
+        mock_add_events.assert_called_once()
+        assert [event["data"]["index"] for event in manager.get_history()] == [0, 1, 2, 3, 4]
+
     def test_event_saved_with_different_working_directory(self, temp_history_db):
         """Test that events are saved correctly even when working directory changes."""
         import os
@@ -288,3 +370,32 @@ class TestEventStreamManager:
             if event_manager is not None:
                 event_manager.stop()
 
+
+
+@pytest.mark.unit
+class TestProgramStartedEvents:
+    """Tests for _program_started_events helper."""
+
+    def test_dict_value(self):
+        """Test ActiveProgram item with object value."""
+        payload = {"items": [
+            {"key": "BSH.Common.Status.OperationState", "value": "Run"},
+            {"key": "BSH.Common.Root.ActiveProgram", "value": {"key": "Espresso", "options": [{"key": "x"}]}},
+        ]}
+
+        assert list(_program_started_events(payload)) == [
+            ("program_started", {"program": "Espresso", "options": [{"key": "x"}]}),
+        ]
+
+    def test_string_value(self):
+        """Test ActiveProgram item with plain program key."""
+        payload = {"items": [{"key": "BSH.Common.Root.ActiveProgram", "value": "Coffee"}]}
+
+        assert list(_program_started_events(payload)) == [
+            ("program_started", {"program": "Coffee", "options": []}),
+        ]
+
+    def test_null_value_and_missing_items(self):
+        """Test that cleared ActiveProgram values and payloads without items yield nothing."""
+        assert list(_program_started_events({"items": [{"key": "BSH.Common.Root.ActiveProgram", "value": None}]})) == []
+        assert list(_program_started_events({})) == []
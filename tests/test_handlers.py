@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import gzip
 import json
+import os
+import socket
 from io import BytesIO
 from unittest.mock import Mock, patch
+from urllib.parse import parse_qs
 
 import pytest
 
@@ -17,6 +21,8 @@ from homeconnect_coffee.handlers import (
     RequestRouter,
     StatusHandler,
 )
+from homeconnect_coffee.handlers import coffee_handler, dashboard_handler
+from homeconnect_coffee.handlers.base_handler import get_client, reset_client
 
 
 @pytest.fixture
@@ -63,6 +69,77 @@ class TestBaseHandler:
         assert "__MASKED__" in masked
         assert "secret123" not in masked
 
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/brew?program=coffee&token=secret123&fill_ml=40", "/brew?program=coffee&token=__MASKED__&fill_ml=40"),
+            ("/status?mytoken=abc", "/status?mytoken=abc"),
+            ("/status", "/status"),
+        ],
+    )
+    def test_mask_token_keeps_other_params(self, handler_kwargs, path, expected):
+        """Test _mask_token_in_path() only replaces the token value."""
+        handler = BaseHandler(**handler_kwargs)
+        
+        assert handler._mask_token_in_path(path) == expected
+
+    def test_query_params_parsed_once_per_request(self, handler_kwargs):
+        """Test _query_params() caches the parsed query until the path changes."""
+        handler = BaseHandler(**handler_kwargs)
+        handler.path = "/brew?program=coffee&token=abc"
+        
+        with patch("homeconnect_coffee.handlers.base_handler.parse_qs", wraps=parse_qs) as mock_parse:
+            assert handler._query_params()["program"] == ["coffee"]
+            assert handler._query_params()["token"] == ["abc"]
+            assert mock_parse.call_count == 1
+            
+            handler.path = "/api/history?limit=5"
+            assert handler._query_params() == {"limit": ["5"]}
+            assert mock_parse.call_count == 2
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_send_json_with_and_without_orjson(self, handler_kwargs, monkeypatch, use_orjson):
+        """Test that _send_json() writes the same compact body with both encoders."""
+        from homeconnect_coffee.handlers import base_handler
+
+        if use_orjson and base_handler.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(base_handler, "orjson", None)
+
+        handler = BaseHandler(**handler_kwargs)
+        handler.wfile = BytesIO()
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler._send_json({"status": "ok", "items": [1, 2]})
+
+        body = handler.wfile.getvalue()
+        assert body == b'{"status":"ok","items":[1,2]}'
+        handler.send_header.assert_any_call("Content-Length", str(len(body)))
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_send_json_pretty(self, handler_kwargs, monkeypatch, use_orjson):
+        """Test that ?pretty=1 indents the JSON response."""
+        from homeconnect_coffee.handlers import base_handler
+
+        if use_orjson and base_handler.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(base_handler, "orjson", None)
+
+        handler = BaseHandler(**handler_kwargs)
+        handler.path = "/status?pretty=1"
+        handler.wfile = BytesIO()
+        handler.send_response = Mock()
+        handler.send_header = Mock()
+        handler.end_headers = Mock()
+
+        handler._send_json({"status": {"power": "On"}})
+
+        assert handler.wfile.getvalue() == b'{\n  "status": {\n    "power": "On"\n  }\n}'
+
     def test_check_auth_no_token_configured(self, handler_kwargs):
         """Test _check_auth() when no token is configured."""
         handler = BaseHandler(**handler_kwargs)
@@ -98,6 +175,25 @@ class TestBaseHandler:
         
         assert handler._check_auth() is True
 
+    def test_check_auth_uses_middleware_token_bytes(self, handler_kwargs):
+        """Test _check_auth() reuses the middleware's pre-encoded token when it is the same token."""
+        from homeconnect_coffee.middleware import AuthMiddleware
+        
+        token = "test-token"
+        handler = BaseHandler(**handler_kwargs)
+        handler.api_token = token
+        handler.auth_middleware = AuthMiddleware(api_token=token)
+        handler.headers = {"Authorization": "Bearer test-token"}
+        handler.path = "/test"
+        
+        with patch.object(AuthMiddleware, "check_auth", wraps=handler.auth_middleware.check_auth) as mock_check:
+            assert handler._check_auth() is True
+            mock_check.assert_called_once_with(handler)
+        
+        # A middleware configured with another token is not consulted
+        handler.auth_middleware = AuthMiddleware(api_token="other-token")
+        assert handler._check_auth() is True
+
     def test_require_auth_sends_401(self, handler_kwargs, error_handler):
         """Test _require_auth() sends 401 on missing auth."""
         handler = BaseHandler(**handler_kwargs)
@@ -128,6 +224,61 @@ class TestBaseHandler:
         assert query_params["other"] == ["123"]
 
 
+@pytest.mark.unit
+class TestSharedClient:
+    """Tests for the client shared by all request handlers."""
+
+    def test_get_client_is_created_once(self):
+        """Test that config and client are only loaded on first use."""
+        reset_client()
+        try:
+            with patch("homeconnect_coffee.handlers.base_handler.load_config") as mock_config, \
+                 patch("homeconnect_coffee.handlers.base_handler.HomeConnectClient") as mock_client_class:
+                first = get_client()
+                second = get_client()
+
+                assert first is second
+                mock_config.assert_called_once()
+                mock_client_class.assert_called_once_with(mock_config.return_value)
+        finally:
+            reset_client()
+
+    def test_reset_client_creates_new_client(self):
+        """Test that reset_client() forces a new client on the next call."""
+        reset_client()
+        try:
+            with patch("homeconnect_coffee.handlers.base_handler.load_config"), \
+                 patch("homeconnect_coffee.handlers.base_handler.HomeConnectClient") as mock_client_class:
+                mock_client_class.side_effect = [Mock(), Mock()]
+                first = get_client()
+                reset_client()
+                second = get_client()
+
+                assert first is not second
+                assert mock_client_class.call_count == 2
+        finally:
+            reset_client()
+
+
+    @pytest.mark.parametrize(
+        ("error", "reset"),
+        [
+            (RuntimeError("API request failed (401): invalid_token"), True),
+            (RuntimeError("API request failed (409): SDK.Error.WrongOperationState"), False),
+        ],
+    )
+    def test_auth_error_resets_client(self, handler_kwargs, error_handler, error, reset):
+        """Test that a 401 from the API drops the shared client, other errors keep it."""
+        router = BaseHandler(**handler_kwargs)
+        router.error_handler = error_handler
+        router._send_error_response = Mock()
+        
+        with patch("homeconnect_coffee.handlers.base_handler.reset_client") as mock_reset:
+            CoffeeHandler._handle_error(router, error, "Error starting program")
+        
+        assert mock_reset.called is reset
+        router._send_error_response.assert_called_once()
+
 @pytest.mark.unit
 class TestCoffeeHandler:
     """Tests for CoffeeHandler class."""
@@ -145,11 +296,10 @@ class TestCoffeeHandler:
         router.headers = Mock()
         router.headers.get.return_value = ""
         
-        with patch("homeconnect_coffee.handlers.coffee_handler.load_config") as mock_config, \
-             patch("homeconnect_coffee.handlers.coffee_handler.HomeConnectClient") as mock_client_class, \
+        with patch("homeconnect_coffee.handlers.coffee_handler.get_client") as mock_get_client, \
              patch("homeconnect_coffee.handlers.coffee_handler.CoffeeService") as mock_service_class:
             mock_client = Mock()
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_service = Mock()
             mock_service.wake_device.return_value = {"status": "ok"}
             mock_service_class.return_value = mock_service
@@ -171,11 +321,10 @@ class TestCoffeeHandler:
         router.headers = Mock()
         router.headers.get.return_value = ""
         
-        with patch("homeconnect_coffee.handlers.coffee_handler.load_config") as mock_config, \
-             patch("homeconnect_coffee.handlers.coffee_handler.HomeConnectClient") as mock_client_class, \
+        with patch("homeconnect_coffee.handlers.coffee_handler.get_client") as mock_get_client, \
              patch("homeconnect_coffee.handlers.coffee_handler.CoffeeService") as mock_service_class:
             mock_client = Mock()
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_service = Mock()
             mock_service.brew_program.return_value = {"status": "ok"}
             mock_service_class.return_value = mock_service
@@ -200,11 +349,10 @@ class TestCoffeeHandler:
         router.headers = Mock()
         router.headers.get.return_value = ""
         
-        with patch("homeconnect_coffee.handlers.coffee_handler.load_config") as mock_config, \
-             patch("homeconnect_coffee.handlers.coffee_handler.HomeConnectClient") as mock_client_class, \
+        with patch("homeconnect_coffee.handlers.coffee_handler.get_client") as mock_get_client, \
              patch("homeconnect_coffee.handlers.coffee_handler.CoffeeService") as mock_service_class:
             mock_client = Mock()
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_service = Mock()
             mock_service.brew_program.return_value = {"status": "ok"}
             mock_service_class.return_value = mock_service
@@ -216,6 +364,32 @@ class TestCoffeeHandler:
             call_args = mock_service.brew_program.call_args
             assert "ConsumerProducts.CoffeeMaker.Program.Beverage.Cappuccino" in str(call_args)
 
+    def test_handle_brew_async(self, handler_kwargs, error_handler):
+        """Test handle_brew(run_async=True) answers 202 and brews in the background."""
+        router = BaseHandler(**handler_kwargs)
+        router.path = "/brew"
+        router.api_token = None
+        router.error_handler = error_handler
+        router.wfile = BytesIO()
+        router.send_response = Mock()
+        router.send_header = Mock()
+        router.end_headers = Mock()
+        router.headers = Mock()
+        router.headers.get.return_value = ""
+        
+        with patch("homeconnect_coffee.handlers.coffee_handler.get_client") as mock_get_client, \
+             patch("homeconnect_coffee.handlers.coffee_handler.CoffeeService") as mock_service_class:
+            mock_get_client.return_value = Mock()
+            mock_service = Mock()
+            mock_service_class.return_value = mock_service
+            
+            CoffeeHandler.handle_brew(router, fill_ml=None, program="cappuccino", run_async=True)
+            coffee_handler._brew_executor.submit(lambda: None).result(timeout=5)
+            
+            router.send_response.assert_called_once_with(202)
+            assert json.loads(router.wfile.getvalue())["status"] == "queued"
+            mock_service.brew_program.assert_called_once()
+
     def test_handle_brew_invalid_program(self, handler_kwargs, error_handler):
         """Test handle_brew() with invalid program name."""
         router = BaseHandler(**handler_kwargs)
@@ -256,11 +430,10 @@ class TestStatusHandler:
         router.headers = Mock()
         router.headers.get.return_value = ""
         
-        with patch("homeconnect_coffee.handlers.status_handler.load_config") as mock_config, \
-             patch("homeconnect_coffee.handlers.status_handler.HomeConnectClient") as mock_client_class, \
+        with patch("homeconnect_coffee.handlers.status_handler.get_client") as mock_get_client, \
              patch("homeconnect_coffee.handlers.status_handler.StatusService") as mock_service_class:
             mock_client = Mock()
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_service = Mock()
             mock_service.get_status.return_value = {"status": "ok"}
             mock_service_class.return_value = mock_service
@@ -282,11 +455,10 @@ class TestStatusHandler:
         router.headers = Mock()
         router.headers.get.return_value = ""
         
-        with patch("homeconnect_coffee.handlers.status_handler.load_config") as mock_config, \
-             patch("homeconnect_coffee.handlers.status_handler.HomeConnectClient") as mock_client_class, \
+        with patch("homeconnect_coffee.handlers.status_handler.get_client") as mock_get_client, \
              patch("homeconnect_coffee.handlers.status_handler.StatusService") as mock_service_class:
             mock_client = Mock()
-            mock_client_class.return_value = mock_client
+            mock_get_client.return_value = mock_client
             mock_service = Mock()
             mock_service.get_extended_status.return_value = {"status": "ok"}
             mock_service_class.return_value = mock_service
@@ -320,12 +492,13 @@ class TestHistoryHandler:
         try:
             with patch("homeconnect_coffee.handlers.history_handler.HistoryService") as mock_service_class:
                 mock_service = Mock()
-                mock_service.get_history.return_value = []
+                mock_service.get_history_json.return_value = b'{"history":[]}'
                 mock_service_class.return_value = mock_service
                 
                 HistoryHandler.handle_history(router, {})
                 
-                mock_service.get_history.assert_called_once()
+                mock_service.get_history_json.assert_called_once_with(None, None, None)
+                assert router.wfile.getvalue() == b'{"history":[]}'
         finally:
             history_module.history_manager = None
 
@@ -358,48 +531,129 @@ class TestHistoryHandler:
 class TestDashboardHandler:
     """Tests for DashboardHandler class."""
 
-    def test_handle_dashboard(self, handler_kwargs, error_handler):
-        """Test handle_dashboard() static method."""
+    @pytest.mark.parametrize("accept_encoding", ["", "gzip, deflate, br"])
+    def test_handle_dashboard(self, handler_kwargs, error_handler, temp_dir, accept_encoding):
+        """Test handle_dashboard() serves the rendered page, gzipped if accepted."""
+        dashboard_path = temp_dir / "dashboard.html"
+        dashboard_path.write_text("<html>{{VERSION}}</html>", encoding="utf-8")
         router = BaseHandler(**handler_kwargs)
         router.path = "/dashboard"
         router.api_token = None
         router.error_handler = error_handler
+        router.headers = {"Accept-Encoding": accept_encoding}
         router.wfile = BytesIO()
         router.send_response = Mock()
         router.send_header = Mock()
         router.end_headers = Mock()
         
-        # Mock Path completely - use side_effect for complex parent chain
-        mock_dashboard = Mock()
-        mock_dashboard.exists.return_value = True
-        mock_dashboard.read_text.return_value = "<html>Dashboard</html>"
+        with patch("homeconnect_coffee.handlers.dashboard_handler._DASHBOARD_PATH", dashboard_path), \
+             patch("homeconnect_coffee.handlers.dashboard_handler._dashboard_cache", None):
+            DashboardHandler.handle_dashboard(router)
+        
+        router.send_response.assert_called_once_with(200)
+        body = router.wfile.getvalue()
+        if accept_encoding:
+            router.send_header.assert_any_call("Content-Encoding", "gzip")
+            body = gzip.decompress(body)
+        assert body.startswith(b"<html>v")
+        assert b"{{VERSION}}" not in body
+
+    def test_dashboard_is_rendered_once(self, temp_dir):
+        """Test the rendered dashboard is reused until the file changes."""
+        dashboard_path = temp_dir / "dashboard.html"
+        dashboard_path.write_text("<html>one</html>", encoding="utf-8")
+        
+        with patch("homeconnect_coffee.handlers.dashboard_handler._DASHBOARD_PATH", dashboard_path), \
+             patch("homeconnect_coffee.handlers.dashboard_handler._dashboard_cache", None):
+            first = dashboard_handler._load_dashboard()
+            assert dashboard_handler._load_dashboard()[0] is first[0]
+            
+            dashboard_path.write_text("<html>two</html>", encoding="utf-8")
+            os.utime(dashboard_path, ns=(0, dashboard_path.stat().st_mtime_ns + 1_000_000))
+            assert dashboard_handler._load_dashboard()[0] == b"<html>two</html>"
+
+    def test_handle_cert_download(self, handler_kwargs, error_handler, temp_dir):
+        """Test handle_cert_download() streams the file with its Content-Length."""
+        cert_path = temp_dir / "server.crt"
+        cert_path.write_bytes(b"-----BEGIN CERTIFICATE-----\n")
+        router = BaseHandler(**handler_kwargs)
+        router.error_handler = error_handler
+        router.wfile = BytesIO()
+        router.send_response = Mock()
+        router.send_header = Mock()
+        router.end_headers = Mock()
+        router.connection, peer = socket.socketpair()
+        
+        try:
+            with patch("homeconnect_coffee.handlers.dashboard_handler._CERT_PATH", cert_path):
+                DashboardHandler.handle_cert_download(router)
+            
+            router.send_response.assert_called_once_with(200)
+            router.send_header.assert_any_call("Content-Length", "28")
+            assert peer.recv(1024) == b"-----BEGIN CERTIFICATE-----\n"
+        finally:
+            router.connection.close()
+            peer.close()
+
+    def test_send_file_without_sendfile(self, handler_kwargs, temp_dir):
+        """Test _send_file() copies through wfile if the connection has no sendfile()."""
+        path = temp_dir / "file.bin"
+        path.write_bytes(b"payload")
+        router = BaseHandler(**handler_kwargs)
+        router.wfile = BytesIO()
+        router.connection = object()
         
-        # Create mock chain for parent.parent.parent.parent / "scripts" / "dashboard.html"
-        mock_scripts = Mock()
-        mock_scripts.__truediv__ = Mock(return_value=mock_dashboard)
+        with path.open("rb") as f:
+            dashboard_handler._send_file(router, f)
         
-        mock_parent4 = Mock()
-        mock_parent4.__truediv__ = Mock(return_value=mock_scripts)
+        assert router.wfile.getvalue() == b"payload"
+
+    def test_handle_cert_download_missing(self, handler_kwargs, error_handler, temp_dir):
+        """Test handle_cert_download() returns 404 without a certificate."""
+        router = BaseHandler(**handler_kwargs)
+        router.error_handler = error_handler
+        router._send_error_response = Mock()
         
-        mock_parent3 = Mock()
-        mock_parent3.parent = mock_parent4
+        with patch("homeconnect_coffee.handlers.dashboard_handler._CERT_PATH", temp_dir / "missing.crt"):
+            DashboardHandler.handle_cert_download(router)
         
-        mock_parent2 = Mock()
-        mock_parent2.parent = mock_parent3
+        assert router._send_error_response.call_args[0][0] == 404
+
+    def test_events_stream_announces_connection_close(self, handler_kwargs, error_handler):
+        """Test the SSE response tells clients the connection is not reused."""
+        import threading
         
-        mock_parent1 = Mock()
-        mock_parent1.parent = mock_parent2
+        router = BaseHandler(**handler_kwargs)
+        router.error_handler = error_handler
+        router.enable_logging = False
+        router.path = "/events"
+        router.request_version = "HTTP/1.1"
+        router.wfile = BytesIO()
+        closed = threading.Event()
+        closed.set()  # Client already dropped, so the handler returns immediately
+        manager = Mock()
+        manager.add_client.return_value = closed
+        
+        with patch("homeconnect_coffee.handlers.dashboard_handler.event_stream_manager", manager):
+            DashboardHandler.handle_events_stream(router)
+        
+        head = router.wfile.getvalue().split(b"\r\n\r\n", 1)[0]
+        assert b"Content-Type: text/event-stream" in head
+        assert b"Connection: close" in head
+        assert router.close_connection is True
+        manager.remove_client.assert_called_once_with(router)
+
+    def test_send_sse_event(self, handler_kwargs):
+        """Test _send_sse_event() writes one compact SSE frame."""
+        router = BaseHandler(**handler_kwargs)
+        router.wfile = BytesIO()
         
-        mock_file_path = Mock()
-        mock_file_path.parent = mock_parent1
+        DashboardHandler._send_sse_event(router, "status", {"message": "Café"})
         
-        with patch("homeconnect_coffee.handlers.dashboard_handler.Path", return_value=mock_file_path):
-            DashboardHandler.handle_dashboard(router)
-            
-            # Check that read_text was called
-            mock_dashboard.read_text.assert_called_once()
-            # Check that send_response was called
-            router.send_response.assert_called_once_with(200)
+        frame = router.wfile.getvalue()
+        assert frame.startswith(b"event: status\ndata: ")
+        assert frame.endswith(b"\n\n")
+        assert json.loads(frame.split(b"data: ", 1)[1]) == {"message": "Café"}
 
     def test_handle_health(self, handler_kwargs, error_handler):
         """Test handle_health() static method."""
@@ -415,7 +669,8 @@ class TestDashboardHandler:
         DashboardHandler.handle_health(router)
         
         # Check that JSON was sent
-        assert router.wfile.getvalue() == b'{\n  "status": "ok"\n}'
+        assert router.wfile.getvalue() == b'{"status":"ok"}'
+        router.send_header.assert_any_call("Content-Length", "15")
 
 
 @pytest.mark.unit
@@ -474,6 +729,89 @@ class TestRequestRouter:
             # Check that router and query_params were passed
             assert mock_handle.call_args[0][0] == router
 
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            (b'{"program": "cappuccino"}', {"fill_ml": None, "program": "cappuccino", "run_async": False}),
+            (b"", {"fill_ml": 50, "program": None, "run_async": False}),
+            (b'{"program": "coffee", "async": true}', {"fill_ml": None, "program": "coffee", "run_async": True}),
+        ],
+    )
+    def test_route_brew_post(self, handler_kwargs, error_handler, body, expected):
+        """Test router reads the POST /brew JSON body (empty body = espresso default)."""
+        router = RequestRouter(**handler_kwargs)
+        router.path = "/brew"
+        router.command = "POST"
+        router.enable_logging = False
+        router.api_token = None
+        router.error_handler = error_handler
+        router.auth_middleware = None
+        router.wfile = BytesIO()
+        router.headers = {"Content-Length": str(len(body))}
+        router.rfile = BytesIO(body)
+
+        with patch("homeconnect_coffee.handlers.router.CoffeeHandler.handle_brew") as mock_handle:
+            router._route_request()
+            mock_handle.assert_called_once_with(router, auth_middleware=None, **expected)
+
+    def test_post_drains_unused_body(self, handler_kwargs, error_handler):
+        """Test do_POST() consumes a body the endpoint ignores (keep-alive safety)."""
+        router = RequestRouter(**handler_kwargs)
+        router.path = "/wake"
+        router.command = "POST"
+        router.enable_logging = False
+        router.error_handler = error_handler
+        router.auth_middleware = None
+        router.wfile = BytesIO()
+        router.headers = {"Content-Length": "2"}
+        router.rfile = BytesIO(b"{}GET /health HTTP/1.1\r\n")
+
+        with patch("homeconnect_coffee.handlers.router.CoffeeHandler.handle_wake"):
+            router.do_POST()
+        
+        assert router.rfile.read() == b"GET /health HTTP/1.1\r\n"
+
+    @pytest.mark.parametrize(
+        ("content_length", "status"),
+        [("abc", 400), (str(64 * 1024 + 1), 413)],
+    )
+    def test_post_rejects_bad_content_length(self, handler_kwargs, error_handler, content_length, status):
+        """Test do_POST() rejects invalid or oversized bodies without reading them."""
+        router = RequestRouter(**handler_kwargs)
+        router.path = "/brew"
+        router.command = "POST"
+        router.enable_logging = False
+        router.error_handler = error_handler
+        router.auth_middleware = None
+        router.headers = {"Content-Length": content_length}
+        router.rfile = Mock()
+        router._send_error = Mock()
+
+        with patch("homeconnect_coffee.handlers.router.CoffeeHandler.handle_brew") as mock_handle:
+            router.do_POST()
+        
+        mock_handle.assert_not_called()
+        router.rfile.read.assert_not_called()
+        assert router._send_error.call_args[0][0] == status
+        assert router.close_connection is True
+
+    def test_post_body_timeout(self, handler_kwargs, error_handler):
+        """Test do_POST() answers 408 if the client stalls while sending the body."""
+        router = RequestRouter(**handler_kwargs)
+        router.path = "/brew"
+        router.command = "POST"
+        router.enable_logging = False
+        router.error_handler = error_handler
+        router.auth_middleware = None
+        router.headers = {"Content-Length": "20"}
+        router.rfile = Mock()
+        router.rfile.read.side_effect = TimeoutError("timed out")
+        router._send_error = Mock()
+
+        router.do_POST()
+        
+        assert router._send_error.call_args[0][0] == 408
+
     def test_route_dashboard_handler(self, handler_kwargs, error_handler):
         """Test router forwards /dashboard to DashboardHandler."""
         router = RequestRouter(**handler_kwargs)
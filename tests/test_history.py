@@ -114,6 +114,82 @@ class TestHistoryManager:
         finally:
             os.chdir(original_cwd)
 
+    def test_init_enables_wal_mode(self, temp_history_db: Path):
+        """Test that the database uses write-ahead logging."""
+        import sqlite3
+        
+        HistoryManager(temp_history_db)
+        
+        conn = sqlite3.connect(str(temp_history_db))
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+
+    def test_init_replaces_type_index(self, temp_history_db: Path):
+        """Test that the composite (type, timestamp) index replaces idx_type."""
+        import sqlite3
+
+        conn = sqlite3.connect(str(temp_history_db))
+        try:
+            conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, timestamp TEXT NOT NULL, type TEXT NOT NULL, data TEXT NOT NULL)")
+            conn.execute("CREATE INDEX idx_type ON events(type)")
+            conn.commit()
+        finally:
+            conn.close()
+
+        HistoryManager(temp_history_db)
+
+        conn = sqlite3.connect(str(temp_history_db))
+        try:
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(events)")}
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM events WHERE type = 'test' ORDER BY timestamp"
+            ).fetchall()
+        finally:
+            conn.close()
+        assert "idx_type_timestamp" in indexes
+        assert "idx_type" not in indexes
+        assert any("idx_type_timestamp" in row[-1] for row in plan)
+        assert not any("TEMP B-TREE" in row[-1] for row in plan)
+
+    def test_read_only_connection_rejects_writes(self, temp_history_db: Path):
+        """Test that query connections are opened read-only."""
+        import sqlite3
+        
+        manager = HistoryManager(temp_history_db)
+        conn = manager._connect(read_only=True)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM events").fetchone() == (0,)
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute("INSERT INTO events (timestamp, type, data) VALUES ('t', 'test', '{}')")
+        finally:
+            conn.close()
+
+    def test_queries_do_not_wait_for_writer_lock(self, temp_history_db: Path):
+        """Test that read-only queries run while a write holds the lock."""
+        import threading
+        
+        manager = HistoryManager(temp_history_db)
+        manager.add_event("program_started", {"program": "Espresso"})
+        results = []
+        
+        def read():
+            results.append(manager.get_history())
+            results.append(manager.get_history_json())
+            results.append(manager.get_program_counts())
+            results.append(manager.get_daily_usage(1))
+            results.append(manager.get_api_statistics())
+        
+        with manager._lock:
+            reader = threading.Thread(target=read)
+            reader.start()
+            reader.join(5)
+            assert not reader.is_alive()
+        
+        assert len(results) == 5
+        assert results[2] == {"Espresso": 1}
+
     def test_add_event(self, temp_history_db: Path):
         """Test add_event() adds event."""
         manager = HistoryManager(temp_history_db)
@@ -139,6 +215,89 @@ class TestHistoryManager:
         assert len(history) == 1
         assert history[0]["timestamp"] == timestamp.isoformat()
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_add_event_roundtrip_with_and_without_orjson(self, temp_history_db: Path, monkeypatch, use_orjson):
+        """Test that event data survives storage with both JSON codecs."""
+        from homeconnect_coffee import history as history_module
+        
+        if use_orjson and history_module.orjson is None:
+            pytest.skip("orjson not installed")
+        if not use_orjson:
+            monkeypatch.setattr(history_module, "orjson", None)
+            monkeypatch.setattr(history_module, "_loads", json.loads)
+        
+        manager = HistoryManager(temp_history_db)
+        data = {"program": "Caffè Crema", "options": [{"key": "FillQuantity", "value": 40}], 1: "non-str key"}
+        manager.add_event("program_started", data)
+        
+        stored = manager.get_history()[0]["data"]
+        assert stored["program"] == "Caffè Crema"
+        assert stored["options"] == [{"key": "FillQuantity", "value": 40}]
+        assert stored["1"] == "non-str key"
+
+    def test_add_events(self, temp_history_db: Path):
+        """Test add_events() writes all events in one call."""
+        manager = HistoryManager(temp_history_db)
+        timestamp = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        
+        written = manager.add_events([
+            {"type": "program_started", "data": {"program": "Espresso"}, "timestamp": timestamp},
+            {"type": "status_changed", "data": {"status": "Ready"}, "timestamp": "2024-01-01T12:05:00+00:00"},
+            {"type": "test", "data": {"index": 1}},
+        ])
+        
+        assert written == 3
+        history = manager.get_history()
+        assert len(history) == 3
+        assert history[0]["timestamp"] == timestamp.isoformat()
+        assert history[0]["data"] == {"program": "Espresso"}
+        assert history[1]["type"] == "status_changed"
+
+    def test_add_events_empty(self, temp_history_db: Path):
+        """Test add_events() with no events."""
+        manager = HistoryManager(temp_history_db)
+        
+        assert manager.add_events([]) == 0
+        assert manager.get_history() == []
+
+    def test_add_events_skips_malformed_entries(self, temp_history_db: Path):
+        """Test add_events() skips entries without a type."""
+        manager = HistoryManager(temp_history_db)
+        
+        written = manager.add_events([{"data": {"index": 0}}, {"type": "test", "data": {"index": 1}}])
+        
+        assert written == 1
+        assert manager.get_history()[0]["data"] == {"index": 1}
+
+    def test_write_connection_is_reused(self, temp_history_db: Path):
+        """Test that writes share one connection until close()."""
+        manager = HistoryManager(temp_history_db)
+
+        manager.add_event("test", {"index": 0})
+        conn = manager._write_conn
+        manager.add_events([{"type": "test", "data": {"index": 1}}])
+        manager.increment_api_call("2024-01-01")
+
+        assert conn is not None
+        assert manager._write_conn is conn
+
+        manager.close()
+        assert manager._write_conn is None
+
+        # Writing after close() reopens the connection
+        manager.add_event("test", {"index": 2})
+        assert len(manager.get_history()) == 3
+        manager.close()
+
+    def test_add_event_with_timestamp_string(self, temp_history_db: Path):
+        """Test add_event() stores preformatted timestamp strings unchanged."""
+        manager = HistoryManager(temp_history_db)
+        
+        manager.add_event("test", {"key": "value"}, timestamp="2024-01-01T12:00:00+00:00")
+        
+        history = manager.get_history()
+        assert history[0]["timestamp"] == "2024-01-01T12:00:00+00:00"
+
     def test_get_history_empty(self, temp_history_db: Path):
         """Test get_history() with empty database."""
         manager = HistoryManager(temp_history_db)
@@ -192,6 +351,53 @@ class TestHistoryManager:
         assert history[0]["data"]["index"] == 0
         assert history[1]["data"]["index"] == 1
 
+    def test_get_history_skips_malformed_data(self, temp_history_db: Path):
+        """Test that rows with malformed JSON data are skipped."""
+        import sqlite3
+        
+        manager = HistoryManager(temp_history_db)
+        manager.add_event("test", {"index": 1})
+        conn = sqlite3.connect(str(temp_history_db))
+        try:
+            conn.execute(
+                "INSERT INTO events (timestamp, type, data) VALUES (?, 'test', '{broken')",
+                (datetime.now(timezone.utc).isoformat(),),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        
+        history = manager.get_history()
+        
+        assert [event["data"] for event in history] == [{"index": 1}]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"limit": 2}, {"event_type": "program_started"}, {"before_timestamp": "2024-01-01T12:03:00+00:00", "limit": 1}],
+    )
+    def test_get_history_json_matches_get_history(self, temp_history_db: Path, kwargs):
+        """Test get_history_json() returns the same events as get_history()."""
+        import sqlite3
+        
+        manager = HistoryManager(temp_history_db)
+        manager.add_events([
+            {"type": "program_started", "data": {"program": "Caffè Crema", "fill_ml": 40}, "timestamp": "2024-01-01T12:00:00+00:00"},
+            {"type": "status_changed", "data": {"status": 'Say "Ready"'}, "timestamp": "2024-01-01T12:01:00+00:00"},
+            {"type": "program_started", "data": {"program": "Espresso"}, "timestamp": "2024-01-01T12:02:00+00:00"},
+        ])
+        conn = sqlite3.connect(str(temp_history_db))
+        try:
+            conn.execute(
+                "INSERT INTO events (timestamp, type, data) VALUES ('2024-01-01T12:00:30+00:00', 'test', '{broken')"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        
+        body = manager.get_history_json(**kwargs)
+        
+        assert json.loads(body) == {"history": manager.get_history(**kwargs)}
+
     def test_get_program_history(self, temp_history_db: Path):
         """Test get_program_history()."""
         manager = HistoryManager(temp_history_db)
@@ -248,6 +454,31 @@ class TestHistoryManager:
         yesterday_key = yesterday.strftime("%Y-%m-%d")
         assert daily_usage.get(yesterday_key, 0) == 1
 
+    def test_get_daily_usage_skips_invalid_and_cleaning_events(self, temp_history_db: Path):
+        """Test that get_daily_usage() ignores malformed data and cleaning programs."""
+        import sqlite3
+        
+        manager = HistoryManager(temp_history_db)
+        today = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+        
+        manager.add_event("program_started", {"program": "Espresso"}, timestamp=today)
+        manager.add_event("program_started", {"program": "CleaningModes.Descaling"}, timestamp=today)
+        manager.add_event("program_started", {}, timestamp=today)  # Counted as "Unknown"
+        manager.add_event("program_started", {"program": None}, timestamp=today)  # Not a brew program
+        conn = sqlite3.connect(str(temp_history_db))
+        try:
+            conn.execute(
+                "INSERT INTO events (timestamp, type, data) VALUES (?, 'program_started', '{invalid')",
+                (today.isoformat(),),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        
+        daily_usage = manager.get_daily_usage(days=7)
+        
+        assert daily_usage[today.strftime("%Y-%m-%d")] == 2
+
     def test_get_program_counts(self, temp_history_db: Path):
         """Test get_program_counts()."""
         manager = HistoryManager(temp_history_db)
@@ -262,6 +493,33 @@ class TestHistoryManager:
         assert counts["Espresso"] == 3
         assert counts["Cappuccino"] == 1
 
+    def test_get_program_counts_filters_entries(self, temp_history_db: Path):
+        """Test get_program_counts() skips cleaning programs and malformed data."""
+        import sqlite3
+
+        manager = HistoryManager(temp_history_db)
+        manager.add_event("program_started", {"program": "ConsumerProducts.CoffeeMaker.Program.Beverage.Espresso"})
+        manager.add_event("program_started", {"program": "ConsumerProducts.CoffeeMaker.Program.CleaningModes.ApplianceOnRinsing"})
+        manager.add_event("program_started", {})
+        manager.add_event("program_started", {"program": None})  # Not a brew program
+        manager.add_event("status_changed", {"program": "Espresso"})
+
+        conn = sqlite3.connect(str(temp_history_db))
+        try:
+            conn.execute(
+                "INSERT INTO events (timestamp, type, data) VALUES ('2024-01-01T00:00:00+00:00', 'program_started', '{not json')"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        counts = manager.get_program_counts()
+
+        assert counts == {
+            "ConsumerProducts.CoffeeMaker.Program.Beverage.Espresso": 1,
+            "Unknown": 1,
+        }
+
     def test_thread_safety(self, temp_history_db: Path):
         """Test that HistoryManager is thread-safe."""
         import threading
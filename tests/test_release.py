@@ -0,0 +1,138 @@
+"""Unit tests for scripts/release.py (version handling)."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_RELEASE_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "release.py"
+
+
+@pytest.fixture(scope="module")
+def release():
+    """Loads scripts/release.py (the scripts directory is not a package)."""
+    spec = importlib.util.spec_from_file_location("release", _RELEASE_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.unit
+class TestParseVersion:
+    """Tests for parse_version()."""
+
+    @pytest.mark.parametrize(
+        "version,expected",
+        [
+            ("1.2.1", (1, 2, 1, "", 0)),
+            ("1.2.1-b2", (1, 2, 1, "beta", 2)),
+            ("1.2.1b2", (1, 2, 1, "beta", 2)),
+            ("1.2.1-a1", (1, 2, 1, "alpha", 1)),
+            ("1.2.1-rc3", (1, 2, 1, "rc", 3)),
+            ("1.2.1-dev", (1, 2, 1, "dev", 0)),
+            ("1.2.1.dev", (1, 2, 1, "dev", 0)),
+            ("1.2.1-b", (1, 2, 1, "beta", 0)),
+            ("1.2", (1, 2, 0, "", 0)),
+            (" 1.2.1\n", (1, 2, 1, "", 0)),
+        ],
+    )
+    def test_valid_versions(self, release, version, expected):
+        """Test the supported version formats."""
+        assert release.parse_version(version) == expected
+
+    @pytest.mark.parametrize("version", ["", "abc", "1.2.x", "v1.2.1"])
+    def test_malformed_version_raises(self, release, version):
+        """Test that malformed versions raise instead of parsing as 0.0.0."""
+        with pytest.raises(ValueError, match="Invalid version"):
+            release.parse_version(version)
+
+
+@pytest.mark.unit
+class TestIncrementVersion:
+    """Tests for increment_version() and remove_prerelease_suffix()."""
+
+    @pytest.mark.parametrize(
+        "current,prerelease_type,expected",
+        [
+            ("1.2.1", "beta", "1.2.1-b1"),
+            ("1.2.1-b1", "beta", "1.2.1-b2"),
+            ("1.2.1b2", "beta", "1.2.1-b3"),
+            ("1.2.1-a2", "beta", "1.2.1-b1"),
+            ("1.2.1-b2", "rc", "1.2.1-rc1"),
+            ("1.2.1", "dev", "1.2.1-dev"),
+            ("1.2.1-dev", "dev", "1.2.2-dev"),
+            ("1.2.1-b2", None, "1.2.1"),
+        ],
+    )
+    def test_increment_version(self, release, current, prerelease_type, expected):
+        """Test prerelease numbering and type changes."""
+        assert release.increment_version(current, prerelease_type) == expected
+
+    def test_invalid_prerelease_type_raises(self, release):
+        """Test that unknown prerelease types are rejected."""
+        with pytest.raises(ValueError, match="Invalid prerelease type"):
+            release.increment_version("1.2.1", "gamma")
+
+    def test_remove_prerelease_suffix(self, release):
+        """Test that the release version drops the suffix."""
+        assert release.remove_prerelease_suffix("1.2.1-rc2") == "1.2.1"
+
+
+@pytest.mark.unit
+class TestVersionToTag:
+    """Tests for _version_to_tag()."""
+
+    @pytest.mark.parametrize(
+        "version,tag",
+        [
+            ("1.2.1", "v1.2.1"),
+            ("1.2.1-b2", "v1.2.1-b2"),
+            ("1.2.1b2", "v1.2.1b2"),
+            ("1.2.1-b", "v1.2.1-b"),
+            ("1.3.0-dev\n", "v1.3.0-dev"),
+        ],
+    )
+    def test_tag_matches_version_file(self, release, version, tag):
+        """Test that the tag is the VERSION string with a 'v' prefix."""
+        assert release._version_to_tag(version) == tag
+
+
+@pytest.mark.unit
+class TestCheckChangelog:
+    """Tests for check_changelog()."""
+
+    def test_version_header_found(self, release, monkeypatch, temp_dir: Path):
+        """Test that a matching version header passes."""
+        changelog = temp_dir / "CHANGELOG.md"
+        changelog.write_text("# Changelog\n\n## [1.2.1] - 2026-01-01\n\n## [1.2.0]\n", encoding="utf-8")
+        monkeypatch.setattr(release, "_CHANGELOG_FILE", changelog)
+
+        release.check_changelog("1.2.1")
+        release.check_changelog("1.2.0")
+
+    @pytest.mark.parametrize("header", ["### [1.2.1]", "  ## [1.2.1]", "##[1.2.1] - 2026-01-01"])
+    def test_header_found_anywhere_in_line(self, release, monkeypatch, temp_dir: Path, header):
+        """Test that deeper and indented headers count, as with the original substring search."""
+        changelog = temp_dir / "CHANGELOG.md"
+        changelog.write_text(f"# Changelog\n\n{header}\n", encoding="utf-8")
+        monkeypatch.setattr(release, "_CHANGELOG_FILE", changelog)
+
+        release.check_changelog("1.2.1")
+
+    def test_missing_version_raises(self, release, monkeypatch, temp_dir: Path):
+        """Test that a changelog without the version is rejected."""
+        changelog = temp_dir / "CHANGELOG.md"
+        changelog.write_text("# Changelog\n\n## [1.2.0]\n\nMentions 1.2.1 in text\n", encoding="utf-8")
+        monkeypatch.setattr(release, "_CHANGELOG_FILE", changelog)
+
+        with pytest.raises(RuntimeError, match="does not contain version 1.2.1"):
+            release.check_changelog("1.2.1")
+
+    def test_missing_changelog_raises(self, release, monkeypatch, temp_dir: Path):
+        """Test that a missing CHANGELOG.md is reported."""
+        monkeypatch.setattr(release, "_CHANGELOG_FILE", temp_dir / "CHANGELOG.md")
+
+        with pytest.raises(FileNotFoundError):
+            release.check_changelog("1.2.1")
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from unittest.mock import Mock, patch
 
 import pytest
@@ -218,6 +219,106 @@ class TestCoffeeService:
             service.brew_program(CAPPUCCINO_KEY, fill_ml=200, program_name="cappuccino")
 
 
+    def test_brew_after_wake_skips_settings_request(self, test_config, valid_token_bundle, temp_token_file):
+        """Test brew_program() reuses the PowerState set by wake_device()."""
+        valid_token_bundle.save(temp_token_file)
+        
+        from homeconnect_coffee.client import HomeConnectClient
+        
+        client = HomeConnectClient(test_config)
+        
+        with patch.object(client, "get_settings") as mock_get_settings, \
+             patch.object(client, "set_setting"), \
+             patch.object(client, "clear_selected_program"), \
+             patch.object(client, "select_program"), \
+             patch.object(client, "start_program") as mock_start:
+            
+            service = CoffeeService(client)
+            service.wake_device()
+            service.brew_espresso(50)
+            
+            mock_get_settings.assert_not_called()
+            mock_start.assert_called_once()
+
+    def test_brew_clears_program_during_power_check(self, test_config, valid_token_bundle, temp_token_file):
+        """Test brew_program() clears the selected program while a stale On state is confirmed."""
+        valid_token_bundle.save(temp_token_file)
+        
+        import threading
+        from homeconnect_coffee.client import HomeConnectClient
+        from homeconnect_coffee.services.coffee_service import POWER_ON, POWER_STATE_TTL
+        
+        client = HomeConnectClient(test_config)
+        cleared = threading.Event()
+        overlapped = []
+        
+        def get_settings():
+            overlapped.append(cleared.wait(5))
+            return {"data": {"settings": [{"key": "BSH.Common.Setting.PowerState", "value": POWER_ON}]}}
+        
+        with patch.object(client, "get_settings", side_effect=get_settings), \
+             patch.object(client, "set_setting") as mock_set_setting, \
+             patch.object(client, "clear_selected_program", side_effect=lambda: cleared.set()), \
+             patch.object(client, "select_program") as mock_select, \
+             patch.object(client, "start_program"):
+            
+            service = CoffeeService(client)
+            service._known_power_state = (POWER_ON, time.monotonic() - POWER_STATE_TTL - 1)
+            service.brew_espresso(50)
+            
+            assert overlapped == [True]
+            mock_set_setting.assert_not_called()
+            mock_select.assert_called_once()
+
+    def test_brew_wakes_device_before_clearing_program(self, test_config, valid_token_bundle, temp_token_file):
+        """Test brew_program() switches an unknown or standby device on before clearing."""
+        valid_token_bundle.save(temp_token_file)
+        
+        from homeconnect_coffee.client import HomeConnectClient
+        
+        client = HomeConnectClient(test_config)
+        calls = Mock()
+        calls.get_settings.return_value = {"data": {"settings": [
+            {"key": "BSH.Common.Setting.PowerState", "value": "BSH.Common.EnumType.PowerState.Standby"},
+        ]}}
+        
+        with patch.object(client, "get_settings", calls.get_settings), \
+             patch.object(client, "set_setting", calls.set_setting), \
+             patch.object(client, "clear_selected_program", calls.clear_selected_program), \
+             patch.object(client, "select_program", calls.select_program), \
+             patch.object(client, "start_program", calls.start_program):
+            
+            CoffeeService(client).brew_espresso(50)
+        
+        assert [c[0] for c in calls.mock_calls] == [
+            "get_settings", "set_setting", "clear_selected_program", "select_program", "start_program",
+        ]
+
+    def test_brew_checks_power_state_after_ttl(self, test_config, valid_token_bundle, temp_token_file):
+        """Test brew_program() fetches settings again once the PowerState is stale."""
+        valid_token_bundle.save(temp_token_file)
+        
+        from homeconnect_coffee.client import HomeConnectClient
+        from homeconnect_coffee.services.coffee_service import POWER_STATE_TTL
+        
+        client = HomeConnectClient(test_config)
+        
+        with patch.object(client, "get_settings") as mock_get_settings, \
+             patch.object(client, "set_setting"), \
+             patch.object(client, "clear_selected_program"), \
+             patch.object(client, "select_program"), \
+             patch.object(client, "start_program"):
+            mock_get_settings.return_value = {"data": {"settings": []}}
+            
+            service = CoffeeService(client)
+            service.wake_device()
+            power_state, seen_at = service._known_power_state
+            service._known_power_state = (power_state, seen_at - POWER_STATE_TTL - 1)
+            service.brew_espresso(50)
+            
+            mock_get_settings.assert_called_once()
+
+
 @pytest.mark.unit
 class TestStatusService:
     """Tests for StatusService."""
@@ -238,6 +339,115 @@ class TestStatusService:
             
             assert result == expected_status
 
+    def test_get_status_reuses_recent_response(self, test_config, valid_token_bundle, temp_token_file):
+        """Test get_status() collapses repeated calls within the TTL."""
+        valid_token_bundle.save(temp_token_file)
+        
+        from homeconnect_coffee.client import HomeConnectClient
+        
+        client = HomeConnectClient(test_config)
+        
+        with patch.object(client, "get_status", return_value={"data": {"status": []}}) as mock_get_status:
+            service = StatusService(client)
+            service.get_status()
+            service.get_status()
+            assert mock_get_status.call_count == 1
+            
+            service.invalidate_cache()
+            service.get_status()
+            assert mock_get_status.call_count == 2
+
+    def test_concurrent_get_status_shares_one_call(self, test_config, valid_token_bundle, temp_token_file):
+        """Test concurrent get_status() calls on a cold cache share one API call."""
+        valid_token_bundle.save(temp_token_file)
+        
+        import threading
+        from homeconnect_coffee.client import HomeConnectClient
+        
+        client = HomeConnectClient(test_config)
+        started = threading.Event()
+        release = threading.Event()
+        
+        def slow_status():
+            started.set()
+            release.wait(5)
+            return {"data": {"status": []}}
+        
+        with patch.object(client, "get_status", side_effect=slow_status) as mock_get_status:
+            service = StatusService(client)
+            results = []
+            threads = [threading.Thread(target=lambda: results.append(service.get_status())) for _ in range(5)]
+            threads[0].start()
+            started.wait(5)
+            for thread in threads[1:]:
+                thread.start()
+            release.set()
+            for thread in threads:
+                thread.join(5)
+            
+            assert mock_get_status.call_count == 1
+            assert results == [{"data": {"status": []}}] * 5
+            assert service._inflight == {}
+
+    def test_invalidate_during_fetch_discards_stale_result(self, test_config, valid_token_bundle, temp_token_file):
+        """Test that a fetch running across invalidate_cache() is neither joined nor cached."""
+        valid_token_bundle.save(temp_token_file)
+        
+        import threading
+        from homeconnect_coffee.client import HomeConnectClient
+        
+        client = HomeConnectClient(test_config)
+        started = threading.Event()
+        release = threading.Event()
+        
+        def status_sequence():
+            yield {"data": {"state": "old"}}
+            yield {"data": {"state": "new"}}
+        
+        responses = status_sequence()
+        
+        def get_status():
+            response = next(responses)
+            if response["data"]["state"] == "old":
+                started.set()
+                release.wait(5)
+            return response
+        
+        with patch.object(client, "get_status", side_effect=get_status) as mock_get_status:
+            service = StatusService(client)
+            results = []
+            slow = threading.Thread(target=lambda: results.append(service.get_status()))
+            slow.start()
+            started.wait(5)
+            
+            service.invalidate_cache()
+            # A caller after the invalidation starts its own fetch
+            assert service.get_status() == {"data": {"state": "new"}}
+            
+            release.set()
+            slow.join(5)
+            
+            assert results == [{"data": {"state": "old"}}]
+            assert mock_get_status.call_count == 2
+            # The old result did not overwrite the cache
+            assert service.get_status() == {"data": {"state": "new"}}
+            assert mock_get_status.call_count == 2
+            assert service._inflight == {}
+
+    def test_single_flight_propagates_errors(self, test_config, valid_token_bundle, temp_token_file):
+        """Test that an error from the shared call is raised and not cached."""
+        valid_token_bundle.save(temp_token_file)
+        
+        from homeconnect_coffee.client import HomeConnectClient
+        
+        client = HomeConnectClient(test_config)
+        
+        with patch.object(client, "get_status", side_effect=[RuntimeError("Offline"), {"data": {}}]):
+            service = StatusService(client)
+            with pytest.raises(RuntimeError, match="Offline"):
+                service.get_status()
+            assert service.get_status() == {"data": {}}
+
     def test_get_extended_status(self, test_config, valid_token_bundle, temp_token_file):
         """Test get_extended_status() returns extended status."""
         valid_token_bundle.save(temp_token_file)